@@ -0,0 +1,70 @@
+import pytest
+import itacovidlib.functions as icl
+
+################################################################################################
+# NOTE ON BENCHMARKS
+#
+# Benchmarks require pytest-benchmark and are not collected by the normal test run, since
+# their file names do not begin with "test_". Run them with:
+#     python -m pytest benchmarks/bench_analysis.py
+# They run offline against the fixture files of benchmarks/fixtures.py (generated at first run),
+# as large as the upstream files. "cold" benchmarks start with empty caches, so that they include
+# downloading (from fixture files) and parsing data; "warm" ones are run again with the data of
+# get_<resource_name> functions (and whatever else the library caches) already in memory. Besides
+# time, the peak memory allocated by a single call is recorded as peak_memory_MiB among the extra
+# information of each benchmark.
+################################################################################################
+
+
+TELLS = {
+    "tell_total_administered_doses": ((), {}),
+    "tell_total_vaccinated first doses": (("1",), {}),
+    "tell_total_vaccinated booster doses, eligible, from 2022": (("booster", "eligible"), {"start_date":"2022"}),
+    "tell_total_vaccinated second doses by region": (("2", "population"), {"by":"region"}),
+    "vaccination_summary": ((), {}),
+    "tell_total_admin_points": ((), {}),
+    "tell_manufacturer_delivered_doses": (("Moderna",), {"start_date":"2021-06", "stop_date":"2021-12"}),
+    "tell_manufacturer_delivered_doses by region": ((), {"by":"region"}),
+}
+
+@pytest.mark.parametrize("name", list(TELLS))
+def test_tell_cold(benchmark, offline_library, peak_memory, name):
+    """tell_<information> functions starting with empty caches."""
+    benchmark.group = "tell_<information>, cold"
+    args, kwargs = TELLS[name]
+    function = getattr(icl, name.split()[0])
+    peak_memory(function, *args, setup=icl.clear_cache, **kwargs)
+    benchmark.pedantic(function, args=args, kwargs=kwargs, setup=icl.clear_cache, rounds=3)
+
+@pytest.mark.parametrize("name", list(TELLS))
+def test_tell_warm(benchmark, offline_library, peak_memory, name):
+    """tell_<information> functions with cached data."""
+    benchmark.group = "tell_<information>, warm"
+    args, kwargs = TELLS[name]
+    function = getattr(icl, name.split()[0])
+    function(*args, **kwargs)
+    peak_memory(function, *args, **kwargs)
+    benchmark(function, *args, **kwargs)
+
+@pytest.mark.parametrize("join", ["merge", "index"])
+def test_prepare_for_plotting_on_map(benchmark, offline_library, peak_memory, join):
+    """Attaching region borders to the whole history of get_region_cases."""
+    benchmark.group = "prepare_for_plotting_on_map"
+    region_cases = icl.get_region_cases()
+    # borders are read once, as in any session plotting more than one map
+    icl.prepare_for_plotting_on_map(region_cases.head(1), on="region")
+    peak_memory(icl.prepare_for_plotting_on_map, region_cases, on="region", join=join)
+    result = benchmark(icl.prepare_for_plotting_on_map, region_cases, on="region", join=join)
+    assert len(result.index) == len(region_cases.index)
+
+def test_tell_rt(benchmark, offline_library, peak_memory):
+    """Estimating Rt over the whole history of get_national_trend, starting with empty caches."""
+    benchmark.group = "tell_rt"
+    peak_memory(icl.tell_rt, setup=icl.clear_cache)
+    benchmark.pedantic(icl.tell_rt, setup=icl.clear_cache, rounds=1)
+
+def test_tell_rt_cached(benchmark, offline_library):
+    """Rt estimates already cached, as in repeated calls before new data are published."""
+    benchmark.group = "tell_rt"
+    icl.tell_rt()
+    benchmark(icl.tell_rt)
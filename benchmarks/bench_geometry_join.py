@@ -0,0 +1,44 @@
+import tracemalloc
+import numpy as np
+import pandas as pd
+import pytest
+import itacovidlib.backend as icl_b, itacovidlib.functions as icl
+
+################################################################################################
+# NOTE ON BENCHMARKS
+#
+# Benchmarks require pytest-benchmark and are not collected by the normal test run, since
+# their file names do not begin with "test_". Run them with:
+#     python -m pytest benchmarks/bench_geometry_join.py
+# Besides timings, the peak memory allocated while attaching geometries is stored in the
+# extra_info of each benchmark (shown with --benchmark-json).
+################################################################################################
+
+
+@pytest.fixture(params=[30, 700], ids=["one_month", "whole_history"])
+def region_cases(request):
+    """Returns a DataFrame shaped like the one returned by get_region_cases (one row per region per day, indexed by date), for a month and for about the whole history."""
+    regions = icl_b._load_geometries("region")["region"].to_numpy()
+    dates = pd.date_range("2020-02-24 17:00", periods=request.param, freq="D")
+    generator = np.random.default_rng(0)
+    return pd.DataFrame({"region":np.tile(regions, len(dates)), "new_cases":generator.integers(0, 5000, len(dates)*len(regions))}, index=pd.Index(np.repeat(dates, len(regions)), name="date"))
+
+def peak_memory(join, source):
+    """Returns the peak memory, in bytes, allocated by icl.prepare_for_plotting_on_map."""
+    tracemalloc.start()
+    try:
+        icl.prepare_for_plotting_on_map(source, on="region", join=join)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("join", ["merge", "index"])
+def test_prepare_for_plotting_on_map_join(benchmark, region_cases, join):
+    """Attaching region borders to a multi-day DataFrame, merging (previous behaviour) or looking them up by index."""
+    benchmark.group = "geometry join, {} rows".format(len(region_cases.index))
+    # geometries are loaded in advance, so that only joining is measured
+    icl_b._load_geometries("region")
+    benchmark.extra_info["peak_memory"] = peak_memory(join, region_cases)
+    result = benchmark(icl.prepare_for_plotting_on_map, region_cases, on="region", join=join)
+    assert len(result.index) == len(region_cases.index)
@@ -0,0 +1,87 @@
+import pytest
+import itacovidlib.backend as icl_b, itacovidlib.datasets as icl_d, itacovidlib.functions as icl
+
+################################################################################################
+# NOTE ON BENCHMARKS
+#
+# Benchmarks require pytest-benchmark and are not collected by the normal test run, since
+# their file names do not begin with "test_". Run them with:
+#     python -m pytest benchmarks/bench_getters.py
+# They run offline against the fixture files of benchmarks/fixtures.py (generated at first run),
+# as large as the upstream files. Besides time, the peak memory allocated by a single call is
+# recorded as peak_memory_MiB among the extra information of each benchmark (e.g. shown with
+# --benchmark-json or --benchmark-columns).
+################################################################################################
+
+
+GETTERS = ["get_"+name for name in icl_d.DATASETS]
+
+def parsed(getter, monkeypatch):
+    """Returns the arguments getter passes to backend._get and the DataFrame it returns, before translation."""
+    calls = []
+    get = icl_b._get
+    def recording_get(url, *args, **kwargs):
+        calls.append((url, args, kwargs))
+        return get(url, *args, **kwargs)
+    with monkeypatch.context() as patch:
+        patch.setattr(icl_b, "_get", recording_get)
+        getattr(icl, getter)()
+    url, args, kwargs = calls[0]
+    return (url, args, kwargs), get(url, *args, **kwargs)
+
+
+@pytest.mark.parametrize("getter", GETTERS)
+def test_get(benchmark, offline_library, peak_memory, getter):
+    """Whole get_<resource_name> functions: download (from fixture files), parsing and translation."""
+    benchmark.group = "get_<resource_name>"
+    function = getattr(icl, getter)
+    peak_memory(function, setup=icl.clear_cache)
+    benchmark.pedantic(function, setup=icl.clear_cache, rounds=5)
+
+@pytest.mark.parametrize("getter", GETTERS)
+def test_get_parse(benchmark, offline_library, peak_memory, monkeypatch, getter):
+    """backend._get alone: download (from fixture files) and parsing according to schemas."""
+    benchmark.group = "backend._get"
+    (url, args, kwargs), _ = parsed(getter, monkeypatch)
+    peak_memory(icl_b._get, url, *args, **kwargs)
+    benchmark.pedantic(icl_b._get, args=(url, *args), kwargs=kwargs, rounds=5)
+
+@pytest.mark.parametrize("getter", GETTERS)
+def test_get_translate(benchmark, offline_library, peak_memory, monkeypatch, getter):
+    """Steps of get_<resource_name> functions after parsing: renaming of columns, conversions and indexing."""
+    benchmark.group = "get_<resource_name> after parsing"
+    _, data = parsed(getter, monkeypatch)
+    function = getattr(icl, getter)
+    # every round translates its own copy of the parsed data, made before the round starts
+    copies = []
+    def setup():
+        icl.clear_cache()
+        copies.append(data.copy())
+    monkeypatch.setattr(icl_b, "_get", lambda *args, **kwargs: copies.pop())
+    peak_memory(function, setup=setup)
+    benchmark.pedantic(function, setup=setup, rounds=5)
+
+# narrow queries of get_vaccine_admin, such as the one of tell_total_vaccinated, against the whole dataset
+NARROW_QUERIES = {
+    "all": {},
+    "columns": {"columns":["manufacturer", "first_dose", "second_dose", "previously_infected", "extra_dose", "booster_dose"]},
+    "columns_and_filters": {"columns":["first_dose"], "filters":[("region", "==", "Lazio"), ("manufacturer", "==", "Moderna")]},
+    # parsing stops past stop, while data before start are parsed from .csv files and skipped in snapshots
+    "first_month": {"stop":"2021-01"},
+    "last_month": {"start":"2023-02"},
+}
+
+@pytest.mark.parametrize("query", list(NARROW_QUERIES))
+@pytest.mark.parametrize("snapshots", [False, True], ids=["csv", "snapshots"])
+def test_get_narrow(benchmark, offline_library, peak_memory, tmp_path, query, snapshots):
+    """get_vaccine_admin with columns, filters and date ranges, parsing only what they need from fixture files or reading it from snapshots."""
+    benchmark.group = "get_vaccine_admin narrow queries"
+    if snapshots:
+        icl.set_snapshots(tmp_path)
+        icl.get_vaccine_admin()
+    try:
+        function = lambda: icl.get_vaccine_admin(**NARROW_QUERIES[query])
+        peak_memory(function, setup=icl.clear_cache)
+        benchmark.pedantic(function, setup=icl.clear_cache, rounds=5)
+    finally:
+        icl.set_snapshots(None)
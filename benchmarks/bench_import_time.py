@@ -0,0 +1,40 @@
+import subprocess
+import sys
+import pytest
+
+################################################################################################
+# NOTE ON BENCHMARKS
+#
+# Benchmarks require pytest-benchmark and are not collected by the normal test run, since
+# their file names do not begin with "test_". Run them with:
+#     python -m pytest benchmarks/bench_import_time.py
+# Every round starts a new Python process, whose startup time is included in timings (see the
+# "python" benchmark). Modules already cached by the operating system after the first round
+# make later rounds faster, as for repeated short-lived jobs.
+################################################################################################
+
+
+IMPORTS = {
+    "python": "pass",
+    "itacovidlib": "import itacovidlib.functions",
+    # what importing the library cost when optional dependencies were imported with it
+    "itacovidlib with optional dependencies": "import itacovidlib.functions, itacovidlib.rendering, itacovidlib.rt, geopandas",
+}
+
+
+@pytest.mark.parametrize("name", list(IMPORTS))
+def test_import_time(benchmark, name):
+    """Starting Python and importing the library."""
+    benchmark.group = "import time"
+    benchmark.pedantic(subprocess.run, args=([sys.executable, "-c", IMPORTS[name]],), kwargs={"check":True}, warmup_rounds=1, rounds=5)
+
+def test_import_time_regression():
+    """Importing the library must remain faster than importing it together with its optional dependencies, which it must not import."""
+    timings = {}
+    for name in ["itacovidlib", "itacovidlib with optional dependencies"]:
+        code = "import time\nstart = time.perf_counter()\n"+IMPORTS[name]+"\nimport sys\nprint(time.perf_counter()-start, 'epyestim' in sys.modules or 'geopandas' in sys.modules)"
+        output = [subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split() for _ in range(3)]
+        timings[name] = min(float(seconds) for seconds, _ in output)
+        if name == "itacovidlib":
+            assert all(heavy == "False" for _, heavy in output)
+    assert timings["itacovidlib"] < timings["itacovidlib with optional dependencies"]/2
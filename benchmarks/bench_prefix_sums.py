@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+import itacovidlib.functions as icl
+
+################################################################################################
+# NOTE ON BENCHMARKS
+#
+# Benchmarks require pytest-benchmark and are not collected by the normal test run, since
+# their file names do not begin with "test_". Run them with:
+#     python -m pytest benchmarks/bench_prefix_sums.py
+################################################################################################
+
+
+@pytest.fixture(scope="module")
+def vaccine_admin():
+    """Returns a DataFrame shaped like the one returned by get_vaccine_admin, with about as many rows as the real one (one row per day, manufacturer, region and age group)."""
+    generator = np.random.default_rng(0)
+    dates = pd.date_range("2020-12-27", periods=500, freq="D")
+    size = len(dates)*5*21*10
+    return pd.DataFrame({"manufacturer":pd.Categorical(generator.choice(["Pfizer/BioNTech", "Moderna", "Vaxzevria (AstraZeneca)", "Janssen", "Novavax"], size)), "first_dose":generator.integers(0, 500, size, dtype="int32"), "second_dose":generator.integers(0, 500, size, dtype="int32")}, index=pd.Index(np.repeat(dates, 5*21*10), name="date"))
+
+@pytest.fixture(scope="module")
+def windows():
+    """Returns 200 sliding 7-day windows, as str bounds."""
+    starts = pd.date_range("2021-01-01", periods=200, freq="D")
+    return [(start.strftime("%Y-%m-%d"), (start+pd.Timedelta(days=6)).strftime("%Y-%m-%d")) for start in starts]
+
+
+def test_window_totals_slicing(benchmark, vaccine_admin, windows):
+    """Previous slicing of the DataFrame and summing over each window."""
+    benchmark.group = "200 weekly totals of Janssen first doses"
+    def query():
+        return [vaccine_admin[start:stop].loc[lambda data: data["manufacturer"]=="Janssen", "first_dose"].sum() for start, stop in windows]
+    benchmark(query)
+
+def test_window_totals_prefix_sums(benchmark, vaccine_admin, windows):
+    """Queries to a PrefixSumIndex, built once."""
+    benchmark.group = "200 weekly totals of Janssen first doses"
+    sums = icl.PrefixSumIndex(vaccine_admin, ["first_dose", "second_dose"], by="manufacturer")
+    result = benchmark(lambda: [sums.total("first_dose", start, stop, group="Janssen") for start, stop in windows])
+    assert result[0] == vaccine_admin["2021-01-01":"2021-01-07"].loc[lambda data: data["manufacturer"]=="Janssen", "first_dose"].sum()
+
+def test_prefix_sums_building(benchmark, vaccine_admin):
+    """Building the PrefixSumIndex, once per download."""
+    benchmark.group = "building"
+    benchmark(icl.PrefixSumIndex, vaccine_admin, ["first_dose", "second_dose"], by="manufacturer")
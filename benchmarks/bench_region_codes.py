@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+import pytest
+import itacovidlib.backend as icl_b
+
+################################################################################################
+# NOTE ON BENCHMARKS
+#
+# Benchmarks require pytest-benchmark and are not collected by the normal test run, since
+# their file names do not begin with "test_". Run them with:
+#     python -m pytest benchmarks/bench_region_codes.py
+################################################################################################
+
+
+@pytest.fixture(params=[3000, 300000], ids=["admin_sites_size", "admin_sites_size_x100"])
+def region_codes(request):
+    """Returns ISTAT region codes as parsed for get_admin_sites, for a dataset as large as the current one (about 3000 rows) and for one 100 times larger."""
+    generator = np.random.default_rng(0)
+    return pd.Series(generator.integers(1, 21, request.param), dtype="int8", name="ISTAT_region_code")
+
+
+def test_region_codes_apply_str(benchmark, region_codes):
+    """Previous per-row conversion of region codes."""
+    benchmark.group = "region codes, {} rows".format(len(region_codes))
+    benchmark(region_codes.apply, str)
+
+def test_region_codes_normalize_codes(benchmark, region_codes):
+    """Vectorized conversion of region codes used by get_<resource_name> functions."""
+    benchmark.group = "region codes, {} rows".format(len(region_codes))
+    result = benchmark(icl_b._normalize_codes, region_codes)
+    assert result.equals(region_codes.apply(str))
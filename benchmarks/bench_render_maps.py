@@ -0,0 +1,33 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+import itacovidlib.backend as icl_b, itacovidlib.functions as icl
+
+################################################################################################
+# NOTE ON BENCHMARKS
+#
+# Benchmarks require pytest-benchmark and are not collected by the normal test run, since
+# their file names do not begin with "test_". Run them with:
+#     python -m pytest benchmarks/bench_render_maps.py
+# Timings with more workers than available processors are not meaningful, so they are skipped.
+################################################################################################
+
+
+@pytest.fixture(scope="module")
+def region_cases():
+    """Returns a DataFrame shaped like the one returned by get_region_cases (one row per region per day, indexed by date) over 120 days."""
+    regions = icl_b._load_geometries("region")["region"].to_numpy()
+    dates = pd.date_range("2021-01-01 17:00", periods=120, freq="D")
+    generator = np.random.default_rng(0)
+    return pd.DataFrame({"region":np.tile(regions, len(dates)), "new_cases":generator.integers(0, 5000, len(dates)*len(regions))}, index=pd.Index(np.repeat(dates, len(regions)), name="date"))
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, 4, 8])
+def test_render_maps_workers(benchmark, region_cases, tmp_path, max_workers):
+    """Rendering 120 daily maps with an increasing number of worker processes."""
+    if max_workers > (os.cpu_count() or 1):
+        pytest.skip("not enough processors")
+    benchmark.group = "render_maps, 120 maps"
+    manifest = benchmark.pedantic(icl.render_maps, args=(region_cases, "region", "new_cases", tmp_path), kwargs={"max_workers":max_workers}, rounds=3)
+    assert len(manifest.index) == 120
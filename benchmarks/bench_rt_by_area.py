@@ -0,0 +1,41 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+import itacovidlib.rt as icl_rt
+
+################################################################################################
+# NOTE ON BENCHMARKS
+#
+# Benchmarks require pytest-benchmark and are not collected by the normal test run, since
+# their file names do not begin with "test_". Run them with:
+#     python -m pytest benchmarks/bench_rt_by_area.py
+# Rt is estimated with 20 bootstrap samples instead of 100 to keep rounds short: timings
+# scale linearly with the number of samples. Timings with more workers than available
+# processors are not meaningful, so they are skipped.
+################################################################################################
+
+
+@pytest.fixture(scope="module")
+def region_cases():
+    """Returns daily cases of 21 areas over 600 days, one column per area, like the ones estimated by tell_rt(by="region")."""
+    generator = np.random.default_rng(0)
+    days = np.arange(600)
+    return pd.DataFrame({"area_{}".format(area):(200*np.exp(np.sin(days/(20+area)))+generator.integers(0, 50, len(days))).astype("int64") for area in range(21)}, index=pd.date_range("2020-02-24", periods=len(days), freq="D"))
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, 4, 8])
+def test_rt_by_area_workers(benchmark, region_cases, max_workers):
+    """Estimating Rt of 21 areas with an increasing number of worker processes."""
+    if max_workers > (os.cpu_count() or 1):
+        pytest.skip("not enough processors")
+    benchmark.group = "Rt of 21 areas"
+    estimates = benchmark.pedantic(icl_rt._estimate_rt_by, args=(region_cases,), kwargs={"max_workers":max_workers, "n_samples":20}, setup=icl_rt._clear_rt_cache, rounds=3)
+    assert len(estimates) == 21
+
+def test_rt_by_area_cached(benchmark, region_cases):
+    """Estimating Rt of 21 areas already estimated."""
+    benchmark.group = "Rt of 21 areas"
+    icl_rt._estimate_rt_by(region_cases, n_samples=20)
+    estimates = benchmark(icl_rt._estimate_rt_by, region_cases, n_samples=20)
+    assert len(estimates) == 21
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+import itacovidlib.rt as icl_rt
+
+################################################################################################
+# NOTE ON BENCHMARKS
+#
+# Benchmarks require pytest-benchmark and are not collected by the normal test run, since
+# their file names do not begin with "test_". Run them with:
+#     python -m pytest benchmarks/bench_rt_incremental.py
+# Rt is estimated with 20 bootstrap samples instead of 100 to keep rounds short: timings
+# scale linearly with the number of samples.
+################################################################################################
+
+
+@pytest.fixture(scope="module")
+def national_cases():
+    """Returns daily cases over 1000 days, like the ones estimated by tell_rt."""
+    generator = np.random.default_rng(0)
+    days = np.arange(1000)
+    return pd.Series((1000*np.exp(np.sin(days/30))+generator.integers(0, 100, len(days))).astype("int64"), index=pd.date_range("2020-02-24", periods=len(days), freq="D"))
+
+def estimate_new_day(cases, history):
+    """Estimates Rt after a new day is added to cases, with the estimate of the previous days stored in history if given."""
+    icl_rt._clear_rt_cache()
+    if history is not None:
+        icl_rt._estimate_rt(cases.iloc[:-1], history=history, n_samples=20)
+    # only the update after the new day is timed
+    with icl_rt._rt_cache_lock:
+        icl_rt._rt_cache.clear()
+    return (cases,), {"history":history, "n_samples":20}
+
+
+@pytest.mark.parametrize("history", [None, "national"])
+def test_rt_new_day(benchmark, national_cases, history):
+    """Estimating Rt over 1000 days after a new day, from scratch or from stored estimates."""
+    benchmark.group = "Rt after a new day, 1000 days"
+    estimate = benchmark.pedantic(icl_rt._estimate_rt, setup=lambda: estimate_new_day(national_cases, history), rounds=3)
+    assert len(estimate.index) > 900
@@ -0,0 +1,43 @@
+import tracemalloc
+import pytest
+import itacovidlib.functions as icl
+import fixtures
+
+################################################################################################
+# NOTE ON BENCHMARKS
+#
+# Fixtures shared by benchmarks. With offline_library, every get_<resource_name> function reads
+# the fixture files of benchmarks/fixtures.py instead of downloading data, through the "replay"
+# transport of the library (see set_transport), so that the whole download path (streaming and
+# parsing) is timed without network.
+################################################################################################
+
+
+@pytest.fixture(scope="session")
+def fixture_directory():
+    """Returns the directory with the fixture files of all datasets, generating the missing ones."""
+    fixtures.generate()
+    return fixtures.DIRECTORY
+
+@pytest.fixture
+def offline_library(fixture_directory):
+    """Makes get_<resource_name> functions read fixture files through the "replay" transport of the library, with empty caches, restoring the network transport afterwards."""
+    icl.set_transport("replay", fixture_directory)
+    yield
+    icl.set_transport("network")
+
+@pytest.fixture
+def peak_memory(benchmark):
+    """Returns a function running a function once with the given arguments under tracemalloc, after running setup if given, and recording its peak memory allocation (in MiB) among the extra information of the benchmark, which is also returned."""
+    def measure(function, *args, setup=None, **kwargs):
+        if setup is not None:
+            setup()
+        tracemalloc.start()
+        try:
+            function(*args, **kwargs)
+            peak = tracemalloc.get_traced_memory()[1]/2**20
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_memory_MiB"] = round(peak, 2)
+        return peak
+    return measure
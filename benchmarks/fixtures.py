@@ -0,0 +1,308 @@
+# fixture .csv files standing in for every dataset downloaded by get_<resource_name> functions, for offline benchmarks.
+# files have the same columns, formats and about the same number of rows as the upstream ones at the end of the data collection (early 2023). Values are synthetic but deterministic, so that timings are comparable across runs and machines.
+# files are generated at first use in benchmarks/fixtures/<host>/<path of the URL> (the layout read by the "replay" transport of the library), which is not tracked by git. Run this module to generate them in advance:
+#     python benchmarks/fixtures.py
+import os
+import zlib
+import functools
+import numpy as np
+import pandas as pd
+import itacovidlib.backend as icl_b, itacovidlib.datasets as icl_d
+
+
+DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# (codice_regione, denominazione_regione, area, codice_nuts_1, codice_nuts_2, latitudine, longitudine), in the order of the datasets of Protezione Civile
+REGIONS = [
+    (13, "Abruzzo", "ABR", "ITF", "ITF1", 42.35, 13.40), (17, "Basilicata", "BAS", "ITF", "ITF5", 40.64, 15.81), (18, "Calabria", "CAL", "ITF", "ITF6", 38.91, 16.59),
+    (15, "Campania", "CAM", "ITF", "ITF3", 40.84, 14.25), (8, "Emilia-Romagna", "EMR", "ITH", "ITH5", 44.49, 11.34), (6, "Friuli Venezia Giulia", "FVG", "ITH", "ITH4", 45.65, 13.77),
+    (12, "Lazio", "LAZ", "ITI", "ITI4", 41.89, 12.48), (7, "Liguria", "LIG", "ITC", "ITC3", 44.41, 8.93), (3, "Lombardia", "LOM", "ITC", "ITC4", 45.47, 9.19),
+    (11, "Marche", "MAR", "ITI", "ITI3", 43.62, 13.52), (14, "Molise", "MOL", "ITF", "ITF2", 41.56, 14.66), (21, "P.A. Bolzano", "PAB", "ITH", "ITH1", 46.50, 11.35),
+    (22, "P.A. Trento", "PAT", "ITH", "ITH2", 46.07, 11.12), (1, "Piemonte", "PIE", "ITC", "ITC1", 45.07, 7.68), (16, "Puglia", "PUG", "ITF", "ITF4", 41.13, 16.87),
+    (20, "Sardegna", "SAR", "ITG", "ITG2", 39.22, 9.12), (19, "Sicilia", "SIC", "ITG", "ITG1", 38.12, 13.36), (9, "Toscana", "TOS", "ITI", "ITI1", 43.77, 11.25),
+    (10, "Umbria", "UMB", "ITI", "ITI2", 43.11, 12.39), (2, "Valle d'Aosta", "VDA", "ITC", "ITC2", 45.74, 7.32), (5, "Veneto", "VEN", "ITH", "ITH3", 45.43, 12.33),
+]
+# names of regions in vaccination datasets, which differ from the ones of Protezione Civile for some regions
+VACCINE_REGION_NAMES = {"PAB":"Provincia Autonoma Bolzano / Bozen", "PAT":"Provincia Autonoma Trento", "FVG":"Friuli-Venezia Giulia", "VDA":"Valle d'Aosta / Vallée d'Aoste"}
+AGE_GROUPS = ["05-11", "12-19", "20-29", "30-39", "40-49", "50-59", "60-69", "70-79", "80-89", "90+"]
+MANUFACTURERS = ["Pfizer/BioNTech", "Moderna", "Vaxzevria (AstraZeneca)", "Janssen", "Novavax", "Pfizer Pediatrico"]
+# number of provinces per region (107 in total)
+PROVINCES = {"ABR":4, "BAS":2, "CAL":5, "CAM":5, "EMR":9, "FVG":4, "LAZ":5, "LIG":4, "LOM":12, "MAR":5, "MOL":2, "PAB":1, "PAT":1, "PIE":8, "PUG":6, "SAR":5, "SIC":9, "TOS":10, "UMB":2, "VDA":1, "VEN":7}
+NUTS1_DESCRIPTIONS = {"ITC":"Nord-Ovest", "ITH":"Nord-Est", "ITI":"Centro", "ITF":"Sud", "ITG":"Isole"}
+
+# days of data collection of Protezione Civile and of vaccination data
+CASE_DAYS = pd.date_range("2020-02-24 18:00", "2023-02-28 17:00", freq="D")
+VACCINE_DAYS = pd.date_range("2020-12-27", "2023-02-28", freq="D")
+
+
+def regions():
+    """Returns a DataFrame with one row per region, with the columns of REGIONS and the ISTAT code and name used by vaccination datasets."""
+    data = pd.DataFrame(REGIONS, columns=["codice_regione", "denominazione_regione", "area", "codice_nuts_1", "codice_nuts_2", "latitudine", "longitudine"])
+    # both autonomous provinces of Trentino-Alto Adige have the ISTAT code of the region in vaccination datasets
+    data["codice_regione_ISTAT"] = data["codice_regione"].replace({21:4, 22:4})
+    data["nome_area"] = [VACCINE_REGION_NAMES.get(area, name) for area, name in zip(data["area"], data["denominazione_regione"])]
+    return data
+
+def waves(days, scale, generator, phase=0.0):
+    """Returns daily counts over days following epidemic waves, with noise."""
+    t = np.arange(days)
+    curve = scale*(0.2+np.exp(3*np.sin(t/60+phase))/np.exp(3))
+    return np.maximum(0, curve*generator.lognormal(0, 0.2, days)).astype("int64")
+
+def vaccine_admin(generator):
+    """Returns the rows of somministrazioni-vaccini-latest.csv: one per day, manufacturer, region and age group with administrations (about 400000 rows)."""
+    region_data = regions()
+    rows = pd.MultiIndex.from_product([range(len(VACCINE_DAYS)), range(len(MANUFACTURERS)), range(len(region_data.index)), range(len(AGE_GROUPS))], names=["day", "manufacturer", "region", "age"]).to_frame(index=False)
+    # not every manufacturer administers to every age group every day
+    rows = rows[generator.random(len(rows.index)) < 0.35]
+    day, region = rows["day"].to_numpy(), rows["region"].to_numpy()
+    doses = lambda scale: (generator.poisson(scale, len(rows.index))*(1+np.sin(day/90)**2)).astype("int64")
+    data = pd.DataFrame({
+        "data_somministrazione": VACCINE_DAYS[day].strftime("%Y-%m-%d"),
+        "fornitore": np.asarray(MANUFACTURERS)[rows["manufacturer"].to_numpy()],
+        "area": region_data["area"].to_numpy()[region],
+        "fascia_anagrafica": np.asarray(AGE_GROUPS)[rows["age"].to_numpy()],
+        "sesso_maschile": doses(150),
+        "sesso_femminile": doses(160),
+        "prima_dose": doses(100),
+        "seconda_dose": doses(90),
+        "pregressa_infezione": doses(5),
+        "dose_aggiuntiva": doses(3),
+        "dose_booster": doses(110),
+        "codice_NUTS1": region_data["codice_nuts_1"].to_numpy()[region],
+        "codice_NUTS2": region_data["codice_nuts_2"].to_numpy()[region],
+        "codice_regione_ISTAT": region_data["codice_regione_ISTAT"].to_numpy()[region],
+        "nome_area": region_data["nome_area"].to_numpy()[region],
+    })
+    return data
+
+def vaccine_admin_summary(generator):
+    """Returns the rows of somministrazioni-vaccini-summary-latest.csv: one per day and region."""
+    region_data = regions()
+    rows = len(VACCINE_DAYS)*len(region_data.index)
+    data = pd.DataFrame({"data_somministrazione": np.repeat(VACCINE_DAYS.strftime("%Y-%m-%d"), len(region_data.index)), "area": np.tile(region_data["area"], len(VACCINE_DAYS))})
+    for column, scale in [("sesso_maschile", 4000), ("sesso_femminile", 4200), ("prima_dose", 3000), ("seconda_dose", 2700), ("pregressa_infezione", 100), ("dose_aggiuntiva", 80), ("dose_booster", 2500)]:
+        data[column] = generator.poisson(scale, rows)
+    data.insert(2, "totale", data["sesso_maschile"]+data["sesso_femminile"])
+    for column in ["codice_NUTS1", "codice_NUTS2", "codice_regione_ISTAT", "nome_area"]:
+        source = {"codice_NUTS1":"codice_nuts_1", "codice_NUTS2":"codice_nuts_2"}.get(column, column)
+        data[column] = np.tile(region_data[source], len(VACCINE_DAYS))
+    return data
+
+def vaccine_deliveries(generator):
+    """Returns the rows of consegne-vaccini-latest.csv: about 4000 deliveries, sorted by region and not by date, as upstream."""
+    region_data = regions()
+    rows = 4000
+    region = np.sort(generator.integers(0, len(region_data.index), rows))
+    return pd.DataFrame({
+        "area": region_data["area"].to_numpy()[region],
+        "fornitore": np.asarray(MANUFACTURERS)[generator.integers(0, len(MANUFACTURERS), rows)],
+        "data_consegna": VACCINE_DAYS[generator.integers(0, len(VACCINE_DAYS), rows)].strftime("%Y-%m-%d"),
+        "numero_dosi": generator.integers(100, 200000, rows),
+        "codice_NUTS1": region_data["codice_nuts_1"].to_numpy()[region],
+        "codice_NUTS2": region_data["codice_nuts_2"].to_numpy()[region],
+        "codice_regione_ISTAT": region_data["codice_regione_ISTAT"].to_numpy()[region],
+        "nome_area": region_data["nome_area"].to_numpy()[region],
+    })
+
+def vaccine_ages(generator):
+    """Returns the rows of anagrafica-vaccini-summary-latest.csv: one per age group."""
+    data = pd.DataFrame({"fascia_anagrafica": AGE_GROUPS})
+    for column, scale in [("sesso_maschile", 4000000), ("sesso_femminile", 4200000), ("prima_dose", 3000000), ("seconda_dose", 2900000), ("pregressa_infezione", 100000), ("dose_aggiuntiva", 80000), ("dose_booster", 2500000)]:
+        data[column] = generator.integers(scale//2, scale, len(AGE_GROUPS))
+    data.insert(1, "totale", data["sesso_maschile"]+data["sesso_femminile"])
+    data["ultimo_aggiornamento"] = VACCINE_DAYS[-1].strftime("%Y-%m-%d")
+    return data
+
+def vaccine_general_summary(generator):
+    """Returns the rows of vaccini-summary-latest.csv: one per region."""
+    region_data = regions()
+    delivered = generator.integers(1000000, 20000000, len(region_data.index))
+    administered = (delivered*generator.uniform(0.85, 0.99, len(region_data.index))).astype("int64")
+    return pd.DataFrame({"area": region_data["area"], "dosi_somministrate": administered, "dosi_consegnate": delivered, "percentuale_somministrazione": np.round(100*administered/delivered, 1), "ultimo_aggiornamento": VACCINE_DAYS[-1].strftime("%Y-%m-%d"), "codice_NUTS1": region_data["codice_nuts_1"], "codice_NUTS2": region_data["codice_nuts_2"], "codice_regione_ISTAT": region_data["codice_regione_ISTAT"], "nome_area": region_data["nome_area"]})
+
+def eligible(generator):
+    """Returns the rows of platea.csv: one per region and age group."""
+    region_data = regions()
+    return pd.DataFrame({"area": np.repeat(region_data["area"], len(AGE_GROUPS)), "nome_area": np.repeat(region_data["nome_area"], len(AGE_GROUPS)), "fascia_anagrafica": np.tile(AGE_GROUPS, len(region_data.index)), "totale_popolazione": generator.integers(10000, 1500000, len(region_data.index)*len(AGE_GROUPS))})
+
+def dose_eligible(generator):
+    """Returns the rows of platea-dose-aggiuntiva.csv or platea-dose-booster.csv: one per region and prevailing category."""
+    region_data = regions()
+    categories = ["Immunocompromessi", "Ospiti RSA", "Over 80", "Operatori sanitari", "Altro"]
+    return pd.DataFrame({"area": np.repeat(region_data["area"], len(categories)), "nome_area": np.repeat(region_data["nome_area"], len(categories)), "categoria_prevalente": np.tile(categories, len(region_data.index)), "totale_popolazione": generator.integers(1000, 800000, len(region_data.index)*len(categories))})
+
+def admin_sites(generator):
+    """Returns the rows of punti-somministrazione-latest.csv: about 3000 administration sites."""
+    region_data = regions()
+    rows = 3000
+    region = np.sort(generator.integers(0, len(region_data.index), rows))
+    return pd.DataFrame({"area": region_data["area"].to_numpy()[region], "provincia": ["Provincia {}-{}".format(region_data["area"].iloc[r], generator.integers(1, PROVINCES[region_data["area"].iloc[r]]+1)) for r in region], "comune": ["Comune {}".format(number) for number in generator.integers(1, 7900, rows)], "presidio_ospedaliero": ["Presidio {}".format(number) for number in range(rows)], "codice_NUTS1": region_data["codice_nuts_1"].to_numpy()[region], "codice_NUTS2": region_data["codice_nuts_2"].to_numpy()[region], "codice_regione_ISTAT": region_data["codice_regione_ISTAT"].to_numpy()[region], "nome_area": region_data["nome_area"].to_numpy()[region]})
+
+def admin_sites_types(generator):
+    """Returns the rows of punti-somministrazione-tipologia.csv: about 3000 administration sites with their type."""
+    region_data = regions()
+    rows = 3000
+    region = np.sort(generator.integers(0, len(region_data.index), rows))
+    return pd.DataFrame({"area": region_data["area"].to_numpy()[region], "denominazione_struttura": ["Presidio {}".format(number) for number in range(rows)], "tipologia": np.asarray(["Ospedaliero", "Territoriale"])[generator.integers(0, 2, rows)], "codice_NUTS1": region_data["codice_nuts_1"].to_numpy()[region], "codice_NUTS2": region_data["codice_nuts_2"].to_numpy()[region], "codice_regione_ISTAT": region_data["codice_regione_ISTAT"].to_numpy()[region], "nome_area": region_data["nome_area"].to_numpy()[region]})
+
+def case_columns(days, scale, generator, phase=0.0):
+    """Returns the columns on cases, hospitalizations and tests shared by the national and regional datasets of Protezione Civile, for one area over days."""
+    new_cases = waves(days, scale, generator, phase)
+    cumulative = np.cumsum(new_cases)
+    deaths = np.cumsum(waves(days, scale/100, generator, phase-0.2))
+    recovered = np.concatenate([np.zeros(14, dtype="int64"), cumulative[:-14]])-deaths
+    recovered = np.maximum(recovered, 0)
+    positives = cumulative-deaths-recovered
+    hospitalized_with_symptoms = positives//20
+    intensive_care = positives//200
+    swabs = np.cumsum(new_cases*generator.integers(8, 15, days))
+    # some columns were only added during the data collection, and are empty before
+    def since(values, day):
+        values = pd.Series(values, dtype="float64")
+        values[:day] = np.nan
+        return values
+    return {
+        "ricoverati_con_sintomi": hospitalized_with_symptoms,
+        "terapia_intensiva": intensive_care,
+        "totale_ospedalizzati": hospitalized_with_symptoms+intensive_care,
+        "isolamento_domiciliare": positives-hospitalized_with_symptoms-intensive_care,
+        "totale_positivi": positives,
+        "variazione_totale_positivi": np.diff(positives, prepend=0),
+        "nuovi_positivi": new_cases,
+        "dimessi_guariti": recovered,
+        "deceduti": deaths,
+        "casi_da_sospetto_diagnostico": since(cumulative*0.6, 60),
+        "casi_da_screening": since(cumulative*0.4, 60),
+        "totale_casi": cumulative,
+        "tamponi": swabs,
+        "casi_testati": since(swabs*0.6, 40),
+        "note": None,
+        "ingressi_terapia_intensiva": since(new_cases//500, 280),
+        "note_test": None,
+        "note_casi": None,
+        "totale_positivi_test_molecolare": since(cumulative*0.8, 320),
+        "totale_positivi_test_antigenico_rapido": since(cumulative*0.2, 320),
+        "tamponi_test_molecolare": since(swabs*0.7, 320),
+        "tamponi_test_antigenico_rapido": since(swabs*0.3, 320),
+    }
+
+def national_trend(generator, latest=False):
+    """Returns the rows of dpc-covid19-ita-andamento-nazionale.csv: one per day (or the last one only)."""
+    data = pd.DataFrame({"data": CASE_DAYS.strftime("%Y-%m-%dT%H:%M:%S"), "stato": "ITA", **case_columns(len(CASE_DAYS), 60000, generator)})
+    return data.tail(1) if latest else data
+
+def region_cases(generator, latest=False):
+    """Returns the rows of dpc-covid19-ita-regioni.csv: one per day and region (or the ones of the last day only)."""
+    region_data = regions()
+    parts = []
+    for position, region in region_data.iterrows():
+        part = pd.DataFrame({"data": CASE_DAYS.strftime("%Y-%m-%dT%H:%M:%S"), "stato": "ITA", "codice_regione": region["codice_regione"], "denominazione_regione": region["denominazione_regione"], "lat": region["latitudine"], "long": region["longitudine"], **case_columns(len(CASE_DAYS), 3000, generator, phase=position/10)})
+        part["codice_nuts_1"] = region["codice_nuts_1"]
+        part["codice_nuts_2"] = region["codice_nuts_2"]
+        parts.append(part)
+    data = pd.concat(parts).sort_values("data", kind="stable")
+    return data[data["data"] == data["data"].iloc[-1]] if latest else data
+
+def province_cases(generator, latest=False):
+    """Returns the rows of dpc-covid19-ita-province.csv: one per day and province, including one pseudo-province per region for cases still to be assigned (or the ones of the last day only)."""
+    region_data = regions()
+    parts = []
+    code = 1
+    for _, region in region_data.iterrows():
+        for number in range(PROVINCES[region["area"]]+1):
+            pseudo = number == PROVINCES[region["area"]]
+            part = pd.DataFrame({"data": CASE_DAYS.strftime("%Y-%m-%dT%H:%M:%S"), "stato": "ITA", "codice_regione": region["codice_regione"], "denominazione_regione": region["denominazione_regione"], "codice_provincia": 979+code if pseudo else code, "denominazione_provincia": "In fase di definizione/aggiornamento" if pseudo else "Provincia {}-{}".format(region["area"], number+1), "sigla_provincia": None if pseudo else "{}{}".format(region["area"][:1], code), "lat": None if pseudo else region["latitudine"], "long": None if pseudo else region["longitudine"]})
+            part["totale_casi"] = np.cumsum(waves(len(CASE_DAYS), 5 if pseudo else 500, generator, phase=code/50))
+            part["note"] = None
+            part["codice_nuts_1"] = None if pseudo else region["codice_nuts_1"]
+            part["codice_nuts_2"] = None if pseudo else region["codice_nuts_2"]
+            part["codice_nuts_3"] = None if pseudo else "{}{}".format(region["codice_nuts_2"], number+1)
+            parts.append(part)
+            code += 1
+    data = pd.concat(parts).sort_values("data", kind="stable")
+    return data[data["data"] == data["data"].iloc[-1]] if latest else data
+
+def population(generator, ranges):
+    """Returns rows of the ISTAT population datasets: one per region (with autonomous provinces) and age range."""
+    region_data = regions()
+    rows = len(region_data.index)*len(ranges)
+    males = generator.integers(5000, 400000, rows)
+    females = generator.integers(5000, 400000, rows)
+    return pd.DataFrame({"codice_regione": np.repeat(region_data["codice_regione"], len(ranges)), "codice_nuts_1": np.repeat(region_data["codice_nuts_1"], len(ranges)), "descrizione_nuts_1": np.repeat(region_data["codice_nuts_1"].map(NUTS1_DESCRIPTIONS), len(ranges)), "codice_nuts_2": np.repeat(region_data["codice_nuts_2"], len(ranges)), "denominazione_regione": np.repeat(region_data["denominazione_regione"], len(ranges)), "range_eta": np.tile(ranges, len(region_data.index)), "totale_genere_maschile": males, "totale_genere_femminile": females, "totale_generale": males+females}).reset_index(drop=True)
+
+def istat_region_data(generator):
+    """Returns the rows of popolazione-istat-regione-range.csv."""
+    data = population(generator, ["0-15", "16-19", "20-29", "30-39", "40-49", "50-59", "60-69", "70-79", "80-89", ">90"])
+    region_data = regions().set_index("codice_regione")
+    data.insert(5, "sigla_regione", data["codice_regione"].map(region_data["area"]))
+    data.insert(6, "latitudine_regione", data["codice_regione"].map(region_data["latitudine"]))
+    data.insert(7, "longitudine_regione", data["codice_regione"].map(region_data["longitudine"]))
+    return data
+
+def over_80(generator):
+    """Returns the rows of popolazione-over80.csv."""
+    return population(generator, ["80-84", "85-89", ">90"])
+
+def equip_contracts(generator):
+    """Returns the rows of dpc-covid19-dati-contratti-dpc-forniture.csv: about 500 contract items."""
+    rows = 500
+    quantity = generator.integers(100, 10000000, rows)
+    price = np.round(generator.uniform(0.01, 20000, rows), 2)
+    dates = pd.date_range("2020-03-01", "2020-12-31", freq="D")[generator.integers(0, 306, rows)].strftime("%Y-%m-%d")
+    return pd.DataFrame({"fornitore": ["Fornitore {}".format(number) for number in generator.integers(1, 150, rows)], "stato_fornitore": np.asarray(["ITALIA", "CINA", "GERMANIA", "SVIZZERA"])[generator.integers(0, 4, rows)], "gruppo_articoli": np.asarray(["DPI", "Apparecchiature elettromedicali", "Materiale sanitario"])[generator.integers(0, 3, rows)], "sottogruppo_articoli": "Sottogruppo", "categoria": "Categoria", "sottocategoria": "Sottocategoria", "tipologia_fornitura": np.asarray(["Mascherine", "Ventilatori", "Camici"])[generator.integers(0, 3, rows)], "fornitura": "Fornitura", "protocollo_atto_negoziale": ["CDPC/{}".format(number) for number in range(rows)], "data_atto_negoziale": dates, "file_atto_negoziale": "contratto.pdf", "integrazione_rettifica": None, "protocollo_integrazione_rettifica": None, "data_integrazione_rettifica": None, "file_integrazione_rettifica": None, "tipologia_cig": "CIG", "cig": ["{:010X}".format(number) for number in generator.integers(0, 2**36, rows)], "quantita": quantity, "prezzo_unitario": price, "totale_articolo": np.round(quantity*price, 2), "stato_contratto": "Attivo", "ceduti_commissario_straordinario": None, "note": None, "data_aggiornamento": "2021-06-30"})
+
+def equip_contracts_payments(generator):
+    """Returns the rows of dpc-covid19-dati-pagamenti-contratti-dpc-forniture.csv: about 400 payments."""
+    rows = 400
+    total = np.round(generator.uniform(1000, 100000000, rows), 2)
+    paid = np.round(total*generator.uniform(0, 1, rows), 2)
+    return pd.DataFrame({"protocollo_atto_negoziale": ["CDPC/{}".format(number) for number in range(rows)], "totale_fornitura": total, "totale_pagato": paid, "pagato_donazioni": np.round(paid*0.1, 2), "pagato_altri_fondi": np.round(paid*0.9, 2), "fondo_pagamento": "Fondo emergenze nazionali", "ceduti_commissario_straordinario": None, "note": None, "data_aggiornamento": "2021-06-30"})
+
+# function generating the rows of every dataset of the registry of the library (called with latest=True for the daily files of the datasets having them)
+GENERATORS = {
+    "vaccine_ages": vaccine_ages,
+    "vaccine_deliveries": vaccine_deliveries,
+    "eligible": eligible,
+    "extra_dose_eligible": dose_eligible,
+    "booster_dose_eligible": dose_eligible,
+    "admin_sites": admin_sites,
+    "admin_sites_types": admin_sites_types,
+    "vaccine_admin": vaccine_admin,
+    "vaccine_admin_summary": vaccine_admin_summary,
+    "vaccine_general_summary": vaccine_general_summary,
+    "national_trend": national_trend,
+    "equip_contracts": equip_contracts,
+    "equip_contracts_payments": equip_contracts_payments,
+    "province_cases": province_cases,
+    "region_cases": region_cases,
+    "over_80": over_80,
+    "istat_region_data": istat_region_data,
+}
+
+# URL of every file and function generating its rows
+DATASETS = {}
+for name, dataset in icl_d.DATASETS.items():
+    DATASETS[dataset["url"]] = GENERATORS[name]
+    if "latest_url" in dataset:
+        DATASETS[dataset["latest_url"]] = functools.partial(GENERATORS[name], latest=True)
+
+
+def fixture_path(url, directory=DIRECTORY):
+    """Returns the path of the fixture file of url, i.e. the one served for it by the "replay" transport of the library."""
+    return icl_b._fixture_path(url, directory)
+
+def generate(directory=DIRECTORY):
+    """Writes the fixture files of all datasets missing from directory."""
+    for url, rows in DATASETS.items():
+        path = fixture_path(url, directory)
+        if os.path.exists(path):
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # each file has its own seed, derived from its URL, so that files do not depend on which other files are generated
+        rows(np.random.default_rng(zlib.crc32(url.encode("utf-8")))).to_csv(path+".tmp", index=False)
+        os.replace(path+".tmp", path)
+
+
+if __name__ == "__main__":
+    generate()
@@ -1,36 +1,1088 @@
+import numpy as np
 import pandas as pd
 import requests
+import urllib3
 import io
+import os
+import json
+import time
+import operator
+import re
+import urllib.parse
+import hashlib
+import tempfile
+import inspect
+import functools
+import importlib
+import threading
+import collections
 import itacovidlib.exceptions as icl_e
+import itacovidlib.datasets as icl_d
 
 
-def _get(url):
+# settings of the persistent HTTP cache. With directory set to None (default) the cache is disabled and every call downloads data again.
+_http_cache = {"directory": None, "ttl": 3600, "max_size": 512*1024*1024}
+
+# settings of the snapshot store of parsed DataFrames. With directory set to None (default) snapshots are disabled.
+_snapshots = {"directory": None}
+
+# process-wide cache of the results of get_<resource_name> functions, ordered from least to most recently used. Values are (storing time, result) pairs.
+_memo = collections.OrderedDict()
+_memo_options = {"maxsize": 32, "ttl": 3600}
+_memo_statistics = {"hits": 0, "misses": 0}
+_memo_lock = threading.Lock()
+
+# geometries of Italian subdivisions, loaded at first use by _load_geometries. Keys are (subdivision, tolerance) pairs.
+_geometries = {}
+_geometries_lock = threading.Lock()
+
+def _make_session(retries=3, backoff_factor=0.5, pool_maxsize=16):
+    """Returns a requests.Session keeping connections alive in a pool, retrying failed requests with exponential backoff and negotiating compressed responses. Meant to be invoked by set_session and at import time.
+
+    Parameters
+    ----------
+    retries : int
+        Maximum number of retries of a failed request (default is 3)
+    backoff_factor : float
+        Factor of the exponential backoff between retries, in seconds (default is 0.5)
+    pool_maxsize : int
+        Maximum number of connections kept alive per host (default is 16)
+
+    Returns
+    -------
+    requests.Session
+        Configured session."""
+
+    # connection failures are retried at most once, so that lack of Internet connection is reported quickly
+    retry = urllib3.util.Retry(total=retries, connect=min(retries, 1), read=retries, status=retries, backoff_factor=backoff_factor, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=frozenset(["GET", "HEAD"]), raise_on_status=False)
+    adapter = requests.adapters.HTTPAdapter(max_retries=retry, pool_maxsize=pool_maxsize)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    return session
+
+# HTTP session shared by all downloads, keeping connections alive so that TLS handshakes are not repeated for every dataset. It can be replaced with set_session.
+_session = _make_session()
+# (connect, read) timeouts in seconds for every request
+_timeout = (10, 60)
+
+# transport of requests, chosen with set_transport: "network" (default) sends them through _session, "replay" serves the files recorded in directory instead and "record" sends them through _session, recording the files received into directory. Session is the requests.Session of the last two modes.
+_transport = {"mode": "network", "directory": None, "session": None}
+
+def _fixture_path(url, directory):
+    """Returns the path of the recorded file of url in directory: <directory>/<host>/<path of the URL>, the port (if any) being joined to the host with an underscore. Meant to be invoked by transport adapters."""
+
+    parts = urllib.parse.urlsplit(url)
+    return os.path.join(directory, parts.netloc.replace(":", "_"), *parts.path.lstrip("/").split("/"))
+
+def _file_response(request, path):
+    """Returns the requests.Response answering request with the file at path, streamed from disk with an ETag derived from its size and modification time (304 Not Modified if it matches the If-None-Match header of request, 404 Not Found if there is no such file). Meant to be invoked by transport adapters."""
+
+    if not os.path.isfile(path):
+        raw = urllib3.HTTPResponse(body=io.BytesIO(b""), headers={"Content-Length":"0"}, status=404, preload_content=False)
+    else:
+        status = os.stat(path)
+        etag = '"{:x}-{:x}"'.format(status.st_size, status.st_mtime_ns)
+        if request.headers.get("If-None-Match") == etag:
+            raw = urllib3.HTTPResponse(body=io.BytesIO(b""), headers={"ETag":etag}, status=304, preload_content=False)
+        else:
+            raw = urllib3.HTTPResponse(body=open(path, "rb"), headers={"Content-Type":"text/csv", "Content-Length":str(status.st_size), "ETag":etag}, status=200, preload_content=False, decode_content=False)
+    return requests.adapters.HTTPAdapter().build_response(request, raw)
+
+class _ReplayAdapter(requests.adapters.BaseAdapter):
+    """requests transport adapter answering requests for any URL with the file recorded for it in directory, without network."""
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        return _file_response(request, _fixture_path(request.url, self.directory))
+
+    def close(self):
+        pass
+
+class _RecordingAdapter(requests.adapters.BaseAdapter):
+    """requests transport adapter sending requests through _session and recording the (decompressed) files received into directory, from which they are then served. Other responses (e.g. 304 Not Modified or errors) are returned as they are."""
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        # the adapter of _session is looked up at every request, so that sessions set later with set_session are used
+        response = _session.get_adapter(request.url).send(request, stream=True, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        if response.status_code != 200:
+            return response
+        path = _fixture_path(request.url, self.directory)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # the file is written to a temporary file first, so that an interrupted download never leaves a truncated recording
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                for block in response.raw.stream(1024*1024, decode_content=True):
+                    temporary_file.write(block)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+        finally:
+            response.close()
+        os.replace(temporary_path, path)
+        # the request is answered from the recording, without its conditional headers, so that the file just received is returned
+        request.headers.pop("If-None-Match", None)
+        return _file_response(request, path)
+
+    def close(self):
+        pass
+
+def _make_transport_session(mode, directory):
+    """Returns a requests.Session whose requests are answered by the transport adapter of mode ("replay" or "record") for directory. Meant to be invoked by set_transport."""
+
+    adapter = _ReplayAdapter(directory) if mode == "replay" else _RecordingAdapter(directory)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def _request(url, validators=None):
+    """Sends a GET request for url through the current transport, conditional on validators (see _conditional_headers), returning the streamed response. Meant to be invoked by download functions."""
+
+    session = _session if _transport["mode"] == "network" else _transport["session"]
+    return session.get(url, headers=_conditional_headers(validators), stream=True, timeout=_timeout)
+
+# errors which may occur either while connecting or while a streamed response is being read
+_CONNECTION_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.ChunkedEncodingError, urllib3.exceptions.HTTPError)
+
+
+def _get(url, schema=None, chunksize=None, columns=None, filters=None, sorted_by=None):
     """Returns a DataFrame from the .csv file at which the URL provided as a parameter points, properly parsing it. Meant to be invoked by get_<resource_name> functions.
-    
+
+    The response is streamed and parsed while it is being downloaded, so that no full in-memory copy of the file is made before the DataFrame is built. If the persistent HTTP cache is enabled (see set_http_cache), the file is streamed to the cache directory and parsed from there. If snapshots are enabled (see set_snapshots), the parsed DataFrame is loaded from a local snapshot whenever the file has not changed upstream, or when there is no Internet connection.
+
     Parameters
     ----------
     url : str
         URL at which the required .csv file is.
-    
+    schema : dict or None
+        Parsing options (column types, date columns and date format) passed to pandas.read_csv, usually built from the dataset registry by datasets.schema (default is None, i.e. pandas defaults)
+    chunksize : int or None
+        If provided, an iterator of DataFrames with at most chunksize rows each is returned instead of a single DataFrame, so that files larger than the available memory can be processed. Snapshots are not used in this case (default is None)
+    columns : list of str or None
+        Columns to return, with original names. The other ones are not parsed (or, from snapshots, not read) at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples with original column names (see _select). Rows are filtered a block at a time while being parsed, or by pyarrow before conversion when loaded from snapshots, so that rows not meeting them are never held in memory all together (default is None, i.e. all rows)
+    sorted_by : str or None
+        Column, with original name, by which rows of the file are sorted. Parsing stops at the first block past the upper bounds set on it by filters, without downloading the rest of the file, and rows of snapshots outside its bounds are skipped by binary search (default is None, i.e. rows in no particular order)
+
     Raises
     ------
     ItaCovidLibConnectionError
         Connection error coming from Italian COVID Library, making it clear to the user it comes from this library and not other ones. This error is raised when the library fails to get data from the Internet, e.g. for lack of Internet connection.
-    
+
     Returns
     -------
     pandas.core.frame.DataFrame
         Pandas DataFrame with the data from the .csv file at which url points.
-    
+    OR (if chunksize is provided)
+    iterator of pandas.core.frame.DataFrame
+        Iterator of Pandas DataFrames with consecutive parts of the data from the .csv file at which url points.
+
     See Also
     --------
     Any function whose name begins with "get_" : uses _get"""
 
     try:
-        downloaded_content = requests.get(url).content
-        dataframe = pd.read_csv(io.StringIO(downloaded_content.decode('utf-8')))
-        return dataframe
+        if _snapshots["directory"] is not None and chunksize is None:
+            return _get_with_snapshot(url, schema, columns, filters, sorted_by)
+        source, response, _ = _download(url)
+        return _parse(source, response, schema, chunksize, columns, filters, sorted_by)
     # error reraising makes it clear to the user the error was actually raised by Italian COVID Library and not other libraries.
-    except requests.exceptions.ConnectionError:
+    except _CONNECTION_ERRORS:
         raise icl_e.ItaCovidLibConnectionError("connection failure. Most probable cause is lack of Internet connection.") from None
 
+def _parse(source, response, schema, chunksize, columns=None, filters=None, sorted_by=None):
+    """Parses the .csv data from source with pandas.read_csv according to schema, either into a DataFrame or (if chunksize is not None) into an iterator of DataFrames, closing response (if not None) when done. Only columns (None for all) are parsed, together with the ones needed by filters, and only rows meeting filters are kept (see _select). If rows are sorted by column sorted_by, parsing stops at the first block with rows past the upper bounds set on it by filters. Meant to be invoked by _get."""
+
+    options = {} if schema is None else schema
+    needed = _needed_columns(columns, filters)
+    if needed is not None:
+        options = dict(_project_schema(options, needed), usecols=needed)
+    if chunksize is not None:
+        return _iterate_chunks(pd.read_csv(source, chunksize=chunksize, **options), response, columns, filters)
+    try:
+        if not filters:
+            return pd.read_csv(source, **options)
+        # rows are filtered a block at a time, so that rows not meeting filters are never held in memory all together
+        with pd.read_csv(source, chunksize=_FILTER_CHUNKSIZE, **options) as reader:
+            parts = []
+            for chunk in reader:
+                parts.append(_select(chunk, columns, filters))
+                # later rows of sorted files cannot meet filters either: the rest of the file is neither parsed nor downloaded
+                if sorted_by is not None and _sorted_range(chunk[sorted_by], sorted_by, filters)[1] < len(chunk.index):
+                    break
+            data = pd.concat(parts, ignore_index=True)
+        # categories of different blocks differ, turning category columns into object ones
+        return data.astype({column:dtype for column, dtype in options.get("dtype", {}).items() if dtype == "category" and column in data.columns})
+    finally:
+        if response is not None:
+            response.close()
+
+# number of rows parsed at a time when filtering rows while parsing
+_FILTER_CHUNKSIZE = 100000
+
+# comparison operators accepted in filters, besides "in"
+_FILTER_OPERATORS = {"==":operator.eq, "!=":operator.ne, "<":operator.lt, "<=":operator.le, ">":operator.gt, ">=":operator.ge}
+
+def _needed_columns(columns, filters):
+    """Returns the columns to read in order to return columns after applying filters, i.e. columns followed by the other ones used by filters, or None if all columns are needed (columns is None). Meant to be invoked by _parse and _load_snapshot."""
+
+    if columns is None:
+        return None
+    return list(dict.fromkeys([*columns, *(column for column, _, _ in filters or [])]))
+
+def _project_schema(schema, needed):
+    """Returns the parsing options of schema restricted to the columns in needed, since pandas.read_csv rejects date columns which are not read. Meant to be invoked by _parse."""
+
+    options = dict(schema)
+    if "dtype" in options:
+        options["dtype"] = {column:dtype for column, dtype in options["dtype"].items() if column in needed}
+    if "parse_dates" in options:
+        options["parse_dates"] = [column for column in options["parse_dates"] if column in needed]
+    return options
+
+def _select(data, columns=None, filters=None):
+    """Returns the rows of data meeting all filters, with only columns (None for all) in their original order. Meant to be invoked by loading functions.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+        DataFrame to select from.
+    columns : list of str or None
+        Columns to return (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet, as (column, operator, value) triples. Operators are "==", "!=", "<", "<=", ">", ">=" and "in", for which value is a list of accepted values (default is None, i.e. all rows)
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        Selected rows and columns."""
+
+    if filters:
+        mask = np.ones(len(data.index), dtype=bool)
+        for column, comparison, value in filters:
+            if comparison == "in":
+                mask &= data[column].isin(value).to_numpy()
+            else:
+                mask &= _FILTER_OPERATORS[comparison](data[column], value).to_numpy(dtype=bool, na_value=False)
+        data = data[mask]
+    if columns is not None:
+        data = data[[column for column in data.columns if column in columns]]
+    return data
+
+def _arrow_filter(filters):
+    """Returns the pyarrow expression equivalent to filters (see _select), for predicate pushdown when loading snapshots. Meant to be invoked by _load_snapshot."""
+
+    compute = _import_optional("pyarrow.compute", "snapshots", "snapshots")
+    expression = None
+    for column, comparison, value in filters:
+        if comparison == "in":
+            condition = compute.field(column).isin(list(value))
+        else:
+            condition = _FILTER_OPERATORS[comparison](compute.field(column), value)
+        expression = condition if expression is None else expression & condition
+    return expression
+
+def _sorted_range(values, column, filters):
+    """Returns the positions (first, stop) delimiting the rows which may meet the bounds set on column by filters (see _select), found by binary search in values, the sorted values of column. Meant to be invoked by _parse and _load_snapshot."""
+
+    first, stop = 0, len(values)
+    for filter_column, comparison, value in filters:
+        if filter_column != column:
+            continue
+        if comparison in (">=", ">"):
+            first = max(first, int(values.searchsorted(value, side="left" if comparison == ">=" else "right")))
+        elif comparison in ("<", "<="):
+            stop = min(stop, int(values.searchsorted(value, side="left" if comparison == "<" else "right")))
+    return first, max(first, stop)
+
+def _iterate_chunks(reader, response, columns=None, filters=None):
+    """Yields the DataFrames produced by reader, with the rows meeting filters and columns only (see _select), reraising connection errors occurring while the response is being read and closing it at the end. Meant to be invoked by _get."""
+
+    try:
+        with reader:
+            for chunk in reader:
+                yield _select(chunk, columns, filters)
+    except _CONNECTION_ERRORS:
+        raise icl_e.ItaCovidLibConnectionError("connection failure. Most probable cause is lack of Internet connection.") from None
+    finally:
+        if response is not None:
+            response.close()
+
+def _download(url, validators=None):
+    """Starts the download of the file at which the URL provided as a parameter points, through the HTTP cache if it is enabled. Meant to be invoked by _get.
+
+    Parameters
+    ----------
+    url : str
+        URL at which the required file is.
+    validators : dict or None
+        ETag and Last-Modified headers (keys "etag" and "last_modified") of an already available version of the file. If the file has not changed since then, nothing is downloaded (default is None)
+
+    Returns
+    -------
+    tuple
+        Source to read the file from (either a file-like object or a path, None if the file has not changed with respect to validators), streamed response to close after reading (None if the file is not read from the network) and validators of the file (None for error responses, i.e. whose status code is not 200).
+
+    See Also
+    --------
+    _get : uses _download"""
+
+    if _http_cache["directory"] is not None:
+        source, current_validators = _cached_download(url)
+        if validators is not None and _same_revision(validators, current_validators):
+            return None, None, current_validators
+        return source, None, current_validators
+    response = _request(url, validators)
+    if response.status_code == 304 and validators is not None:
+        response.close()
+        return None, None, validators
+    # compressed responses must be decompressed while they are read
+    response.raw.decode_content = True
+    if response.status_code != 200:
+        return response.raw, response, None
+    return response.raw, response, {"etag":response.headers.get("ETag"), "last_modified":response.headers.get("Last-Modified")}
+
+def _conditional_headers(validators):
+    """Returns the headers of a conditional request for a file whose ETag and Last-Modified headers are in validators (possibly None). Meant to be invoked by download functions."""
+
+    headers = {}
+    if validators is not None:
+        if validators["etag"] is not None:
+            headers["If-None-Match"] = validators["etag"]
+        if validators["last_modified"] is not None:
+            headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+def _same_revision(validators, other_validators):
+    """Returns True if the two sets of validators (possibly None) certainly refer to the same version of a file, False otherwise. Meant to be invoked by download functions."""
+
+    if validators is None or other_validators is None:
+        return False
+    if validators["etag"] is not None or other_validators["etag"] is not None:
+        return validators["etag"] == other_validators["etag"]
+    return validators["last_modified"] is not None and validators["last_modified"] == other_validators["last_modified"]
+
+def _cached_download(url):
+    """Returns the local copy of the file at which the URL provided as a parameter points, downloading it only when the cached copy is missing or has changed upstream. Meant to be invoked by _download.
+
+    Copies validated less than ttl seconds ago are served without contacting the server. Older copies are revalidated with a conditional request (If-None-Match/If-Modified-Since), so that a 304 Not Modified answer skips the download of the body.
+
+    Parameters
+    ----------
+    url : str
+        URL at which the required file is.
+
+    Returns
+    -------
+    tuple
+        Path of the cached file, or in-memory content for responses which are not cached (i.e. whose status code is not 200), and validators of the file (dict with keys "etag" and "last_modified", None for responses which are not cached).
+
+    See Also
+    --------
+    _download : uses _cached_download"""
+
+    directory = _http_cache["directory"]
+    os.makedirs(directory, exist_ok=True)
+    # each URL is stored as a pair of files named after its hash: the raw payload (.csv) and its validators (.json)
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    body_path = os.path.join(directory, key+".csv")
+    metadata_path = os.path.join(directory, key+".json")
+    metadata = None
+    if os.path.exists(body_path) and os.path.exists(metadata_path):
+        with open(metadata_path) as metadata_file:
+            metadata = json.load(metadata_file)
+    if metadata is not None:
+        validators = {"etag":metadata["etag"], "last_modified":metadata["last_modified"]}
+        if time.time()-metadata["validated"] < _http_cache["ttl"]:
+            # modification time is refreshed on every use, so that eviction removes least recently used files first
+            os.utime(body_path)
+            return body_path, validators
+    else:
+        validators = None
+    response = _request(url, validators)
+    if response.status_code == 304 and metadata is not None:
+        response.close()
+        metadata["validated"] = time.time()
+        _write_json(metadata_path, metadata)
+        os.utime(body_path)
+        return body_path, validators
+    if response.status_code != 200:
+        # error pages must not end up in the cache
+        return io.BytesIO(response.content), None
+    # payload is written to a temporary file first, so that an interrupted write never leaves a truncated file in the cache
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as temporary_file:
+            # the body is copied to disk in blocks, without being fully loaded into memory
+            for block in response.iter_content(chunk_size=1024*1024):
+                temporary_file.write(block)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+    finally:
+        response.close()
+    os.replace(temporary_path, body_path)
+    validators = {"etag":response.headers.get("ETag"), "last_modified":response.headers.get("Last-Modified")}
+    _write_json(metadata_path, {"url":url, "etag":validators["etag"], "last_modified":validators["last_modified"], "validated":time.time()})
+    _evict_http_cache(keep=key)
+    return body_path, validators
+
+def _get_with_snapshot(url, schema, columns=None, filters=None, sorted_by=None):
+    """Returns the DataFrame parsed from the .csv file at which the URL provided as a parameter points, loading it from a local snapshot when the file has not changed upstream or when it cannot be downloaded. Meant to be invoked by _get.
+
+    Snapshots are Feather files keyed by URL, schema and upstream revision (i.e. ETag or Last-Modified header of the file), loaded with memory mapping instead of parsing .csv data again. Files served without such headers are never stored as snapshots, since their revision cannot be checked.
+
+    Parameters
+    ----------
+    url : str
+        URL at which the required .csv file is.
+    schema : dict or None
+        Parsing options passed to pandas.read_csv.
+    columns : list of str or None
+        Columns to return. Snapshots always store all columns, of which only these are read (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned (see _select), pushed down to pyarrow when loading snapshots (default is None, i.e. all rows)
+    sorted_by : str or None
+        Column by which rows of the file are sorted, so that rows of snapshots outside the bounds set on it by filters are skipped without being compared (default is None)
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        Pandas DataFrame with the data from the .csv file at which url points.
+
+    See Also
+    --------
+    _get : uses _get_with_snapshot"""
+
+    directory = _snapshots["directory"]
+    os.makedirs(directory, exist_ok=True)
+    # DataFrames parsed with different schemas are different, so the schema is part of the key
+    key = hashlib.sha256((url+json.dumps(schema, sort_keys=True, default=str)).encode("utf-8")).hexdigest()
+    metadata_path = os.path.join(directory, key+".json")
+    metadata = None
+    if os.path.exists(metadata_path):
+        with open(metadata_path) as metadata_file:
+            metadata = json.load(metadata_file)
+        if not os.path.exists(os.path.join(directory, metadata["file"])):
+            metadata = None
+    try:
+        source, response, validators = _download(url, None if metadata is None else metadata["validators"])
+    except _CONNECTION_ERRORS:
+        if metadata is None:
+            raise
+        # without Internet connection, the last available snapshot is used
+        return _load_snapshot(os.path.join(directory, metadata["file"]), columns, filters, sorted_by)
+    if source is None:
+        return _load_snapshot(os.path.join(directory, metadata["file"]), columns, filters, sorted_by)
+    if validators is None:
+        # files which are not stored as snapshots are parsed as narrowly as requested
+        return _parse(source, response, schema, None, columns, filters, sorted_by)
+    # snapshots store all data, so that later calls can select any part of them
+    dataframe = _parse(source, response, schema, None)
+    _save_snapshot(key, url, validators, dataframe)
+    return _select(dataframe, columns, filters)
+
+def _get_incremental(url, latest_url, schema=None):
+    """Returns a DataFrame with the whole history of a daily time series dataset, keeping a local copy of it and only downloading the data of the days missing from it. Meant to be invoked by get_<resource_name> functions with the incremental option.
+
+    The local copy is stored in the snapshot directory. At every call, the file with the data of the current day (latest_url) is downloaded, together with the daily files of the days between it and the last day in the local copy, which are then appended to it. The local copy is downloaded again in full when it is missing, when too many days are missing from it, or when upstream revisions are detected (i.e. when the daily file of the last day in the local copy differs from the stored data of that day). Without Internet connection, the local copy is returned as it is.
+
+    Parameters
+    ----------
+    url : str
+        URL at which the .csv file with the whole history is.
+    latest_url : str
+        URL at which the .csv file with the data of the current day is. Its name must end with "-latest.csv", daily files having the same name with the date (YYYYMMDD) instead of "latest".
+    schema : dict or None
+        Parsing options passed to pandas.read_csv. Dates must be in column "data", parsed into datetime objects (default is None)
+
+    Raises
+    ------
+    ItaCovidLibConnectionError
+        Raised when there are issues with Internet connection and no local copy is available.
+
+    ItaCovidLibArgumentError
+        Raised when snapshots are not enabled.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        Pandas DataFrame with the whole history of the dataset.
+
+    See Also
+    --------
+    get_national_trend, get_region_cases, get_province_cases : use _get_incremental"""
+
+    directory = _snapshots["directory"]
+    if directory is None:
+        raise icl_e.ItaCovidLibArgumentError("incremental mode requires snapshots to be enabled. Please see documentation of set_snapshots.")
+    os.makedirs(directory, exist_ok=True)
+    key = hashlib.sha256(("history:"+url+json.dumps(schema, sort_keys=True, default=str)).encode("utf-8")).hexdigest()
+    history_path = os.path.join(directory, key+"-history.feather")
+    history = _load_snapshot(history_path) if os.path.exists(history_path) else None
+    try:
+        if history is not None:
+            latest, latest_available = _fetch(latest_url, schema)
+            new_data = _new_days(history, latest, latest_url, schema) if latest_available else None
+            if new_data is not None:
+                if len(new_data.index) == 0:
+                    return history
+                # rows of the days to append (possibly already stored, e.g. the current day downloaded earlier) are replaced
+                history = pd.concat([history[history["data"].dt.normalize() < new_data["data"].dt.normalize().min()], new_data], ignore_index=True)
+                if schema is not None and "dtype" in schema:
+                    # categories of the appended rows may differ from the stored ones, turning columns into object ones
+                    history = history.astype({column:dtype for column, dtype in schema["dtype"].items() if column in history.columns})
+                _save_history(history_path, history)
+                return history
+        history, available = _fetch(url, schema, required=True)
+    except _CONNECTION_ERRORS:
+        if history is None:
+            raise icl_e.ItaCovidLibConnectionError("connection failure. Most probable cause is lack of Internet connection.") from None
+        # without Internet connection, the local copy is returned as it is
+        return history
+    if available:
+        _save_history(history_path, history)
+    return history
+
+# maximum number of missing days downloaded one by one by _get_incremental. Beyond it, the whole history is downloaded again.
+_MAX_MISSING_DAYS = 31
+
+def _new_days(history, latest, latest_url, schema):
+    """Returns the rows to append to history, i.e. the data of the days after the last one in history (possibly none), or None if the whole history must be downloaded again. Meant to be invoked by _get_incremental."""
+
+    last_day = history["data"].dt.normalize().max()
+    latest_day = latest["data"].dt.normalize().max()
+    if pd.isna(last_day) or pd.isna(latest_day) or latest_day < last_day:
+        return None
+    # upstream revisions are detected by comparing the stored data of the last day with the current daily file of the same day
+    reference, reference_available = _fetch(_daily_url(latest_url, last_day), schema)
+    if not reference_available or not _same_rows(history[history["data"].dt.normalize() == last_day], reference):
+        return None
+    if latest_day == last_day:
+        return latest.iloc[0:0]
+    missing_days = pd.date_range(last_day+pd.Timedelta(days=1), latest_day-pd.Timedelta(days=1), freq="D")
+    if len(missing_days) > _MAX_MISSING_DAYS:
+        return None
+    new_data = []
+    for day in missing_days:
+        day_data, day_available = _fetch(_daily_url(latest_url, day), schema)
+        if not day_available:
+            return None
+        new_data.append(day_data)
+    new_data.append(latest)
+    return pd.concat(new_data, ignore_index=True)
+
+def _daily_url(latest_url, day):
+    """Returns the URL of the daily file of day, given the URL of the file with the data of the current day (ending with "-latest.csv")."""
+
+    return latest_url[:-len("latest.csv")]+day.strftime("%Y%m%d")+".csv"
+
+def _same_rows(stored, downloaded):
+    """Returns True if the two DataFrames have the same rows in the same order, independently of their index and of the categories of categorical columns."""
+
+    if len(stored.index) != len(downloaded.index) or list(stored.columns) != list(downloaded.columns):
+        return False
+    stored = stored.reset_index(drop=True)
+    downloaded = downloaded.reset_index(drop=True)
+    for column in stored.columns:
+        if isinstance(stored[column].dtype, pd.CategoricalDtype) or isinstance(downloaded[column].dtype, pd.CategoricalDtype):
+            if not stored[column].astype(object).equals(downloaded[column].astype(object)):
+                return False
+        elif not stored[column].equals(downloaded[column]):
+            return False
+    return True
+
+def _fetch(url, schema, required=False):
+    """Downloads and parses the .csv file at url without using snapshots, returning the DataFrame and whether the file was actually available (i.e. it was not an error page). Unless required is True, error pages are not parsed and None is returned instead of the DataFrame. Meant to be invoked by _get_incremental."""
+
+    source, response, validators = _download(url)
+    if validators is None and not required:
+        if response is not None:
+            response.close()
+        return None, False
+    return _parse(source, response, schema, None), validators is not None
+
+def _save_history(path, history):
+    """Stores the local copy of the history of a daily time series dataset at path. Meant to be invoked by _get_incremental."""
+
+    feather = _import_feather()
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(file_descriptor)
+    try:
+        feather.write_feather(history, temporary_path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+    os.replace(temporary_path, path)
+
+def _save_snapshot(key, url, validators, dataframe):
+    """Stores dataframe as the snapshot of the file at url with the given validators, replacing older snapshots of the same file. Meant to be invoked by _get_with_snapshot."""
+
+    feather = _import_feather()
+    directory = _snapshots["directory"]
+    revision = hashlib.sha256(str(validators["etag"] or validators["last_modified"]).encode("utf-8")).hexdigest()[:16]
+    file_name = "{}-{}.feather".format(key, revision)
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(file_descriptor)
+    try:
+        feather.write_feather(dataframe, temporary_path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+    os.replace(temporary_path, os.path.join(directory, file_name))
+    _write_json(os.path.join(directory, key+".json"), {"url":url, "validators":validators, "file":file_name})
+    # snapshots of older revisions are not needed anymore
+    for old_file_name in os.listdir(directory):
+        if old_file_name.startswith(key+"-") and old_file_name != file_name:
+            try:
+                os.remove(os.path.join(directory, old_file_name))
+            except FileNotFoundError:
+                pass
+
+def _load_snapshot(path, columns=None, filters=None, sorted_by=None):
+    """Returns the DataFrame stored in the snapshot at path, read with memory mapping. Only columns (None for all) are read, together with the ones needed by filters, and rows not meeting filters (see _select) are discarded by pyarrow, before conversion into a DataFrame. If rows are sorted by column sorted_by, the ones outside the bounds set on it by filters are skipped by binary search before filtering. Meant to be invoked by _get_with_snapshot."""
+
+    feather = _import_feather()
+    needed = _needed_columns(columns, filters)
+    if needed is not None:
+        # columns are read in their stored order, as they are parsed from .csv files
+        ipc = _import_optional("pyarrow.ipc", "snapshots", "snapshots")
+        with ipc.open_file(path) as reader:
+            needed = [column for column in reader.schema.names if column in needed]
+    table = feather.read_table(path, columns=needed, memory_map=True)
+    if filters:
+        if sorted_by is not None:
+            first, stop = _sorted_range(table.column(sorted_by).to_pandas(), sorted_by, filters)
+            table = table.slice(first, stop-first)
+        table = table.filter(_arrow_filter(filters))
+        if columns is not None:
+            table = table.select([column for column in table.column_names if column in columns])
+    return table.to_pandas()
+
+def _import_feather():
+    """Returns the pyarrow.feather module, required for snapshots, raising an explanatory error if pyarrow is not installed."""
+
+    return _import_optional("pyarrow.feather", "snapshots", "snapshots")
+
+def _import_optional(module, feature, extra):
+    """Returns module (e.g. "geopandas"), imported at first use instead of at import time of the library, since optional dependencies are slow to import and may not be installed. Raises an explanatory error, naming the extra of the library installing them, if they are not installed.
+
+    Parameters
+    ----------
+    module : str
+        Name of the module to import, either an optional dependency or a module of the library requiring it (e.g. "itacovidlib.rt").
+    feature : str
+        Name of the feature requiring the module, in plural form, for the error message (e.g. "maps").
+    extra : str
+        Name of the extra of the library installing the optional dependencies of the feature (e.g. "maps").
+
+    Raises
+    ------
+    ImportError
+        Raised when the module, or one of its dependencies, is not installed.
+
+    Returns
+    -------
+    module
+        The imported module."""
+
+    try:
+        return importlib.import_module(module)
+    except ImportError as error:
+        raise ImportError("{} require {}, which is not installed. Install it with: pip install itacovidlib[{}]".format(feature, error.name or module, extra)) from None
+
+# names of the files written to the snapshot directory: manifests and snapshots of datasets (keyed by sha256 digests, snapshots also by revision), local copies of histories and Rt estimates, and geometries
+_SNAPSHOT_FILE_NAME = re.compile(r"[0-9a-f]{64}(\.json|-[0-9a-f]{16}\.feather|-history\.feather|-rt\.feather)|geometries-[0-9a-f]{64}\.parquet")
+
+def _clear_snapshots():
+    """Removes all files stored by the library in the snapshot directory, leaving any other file untouched. Meant to be invoked by clear_snapshots."""
+
+    directory = _snapshots["directory"]
+    if directory is None or not os.path.isdir(directory):
+        return
+    for file_name in os.listdir(directory):
+        if _SNAPSHOT_FILE_NAME.fullmatch(file_name):
+            os.remove(os.path.join(directory, file_name))
+
+def _write_json(path, content):
+    """Writes content to the .json file at path, replacing it atomically. Meant to be invoked by cache handling functions."""
+
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(file_descriptor, "w") as temporary_file:
+        json.dump(content, temporary_file)
+    os.replace(temporary_path, path)
+
+# names of the files written to the HTTP cache directory: downloaded files and their metadata, keyed by the sha256 digest of their URL
+_HTTP_CACHE_FILE_NAME = re.compile(r"[0-9a-f]{64}\.(csv|json)")
+
+def _evict_http_cache(keep=None):
+    """Removes least recently used files stored by the library in the HTTP cache directory until their size is within max_size, leaving any other file untouched. The entry whose key is keep is never removed. Meant to be invoked by _cached_download."""
+
+    directory = _http_cache["directory"]
+    entries = []
+    for file_name in os.listdir(directory):
+        if file_name.endswith(".csv") and _HTTP_CACHE_FILE_NAME.fullmatch(file_name):
+            path = os.path.join(directory, file_name)
+            entries.append((os.path.getmtime(path), os.path.getsize(path), file_name[:-len(".csv")]))
+    total_size = sum(size for _, size, _ in entries)
+    # oldest entries come first
+    for _, size, key in sorted(entries):
+        if total_size <= _http_cache["max_size"]:
+            break
+        if key == keep:
+            continue
+        for extension in (".csv", ".json"):
+            try:
+                os.remove(os.path.join(directory, key+extension))
+            except FileNotFoundError:
+                pass
+        total_size -= size
+
+def _clear_http_cache():
+    """Removes all files stored by the library in the HTTP cache directory, leaving any other file untouched. Meant to be invoked by clear_http_cache."""
+
+    directory = _http_cache["directory"]
+    if directory is None or not os.path.isdir(directory):
+        return
+    for file_name in os.listdir(directory):
+        if _HTTP_CACHE_FILE_NAME.fullmatch(file_name):
+            os.remove(os.path.join(directory, file_name))
+
+def _memoized(function):
+    """Decorator storing the results of the decorated function in the process-wide cache, so that later calls with the same arguments within the cache ttl do not download and parse data again. Meant to decorate get_<resource_name> functions.
+
+    Callers always receive a copy of the cached DataFrame, so that changes made by one caller never affect results returned to other ones. With copy-on-write (see _copy) the copy is shallow, so that cache hits do not copy data.
+
+    Parameters
+    ----------
+    function : function
+        Function to decorate.
+
+    Returns
+    -------
+    function
+        Decorated function.
+
+    See Also
+    --------
+    clear_cache, cache_info, set_cache : functions handling the process-wide cache"""
+
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    def memoized_function(*args, **kwargs):
+        # arguments are bound to parameter names, so that e.g. f() and f(latest=False) share the same cache entry
+        bound_arguments = signature.bind(*args, **kwargs)
+        bound_arguments.apply_defaults()
+        key = (function.__qualname__, tuple((name, _frozen(value)) for name, value in bound_arguments.arguments.items()))
+        try:
+            hash(key)
+        except TypeError:
+            # unhashable arguments cannot be used as keys: the result is just not cached
+            return function(*args, **kwargs)
+        with _memo_lock:
+            entry = _memo.get(key)
+            if entry is not None and time.time()-entry[0] < _memo_options["ttl"]:
+                _memo.move_to_end(key)
+                _memo_statistics["hits"] += 1
+                return _copy(entry[1])
+            _memo_statistics["misses"] += 1
+        result = function(*args, **kwargs)
+        if result is not None and _memo_options["maxsize"] > 0:
+            with _memo_lock:
+                _memo[key] = (time.time(), result)
+                _memo.move_to_end(key)
+                while len(_memo) > _memo_options["maxsize"]:
+                    _memo.popitem(last=False)
+        return _copy(result)
+
+    return memoized_function
+
+def _frozen(value):
+    """Returns value with lists and tuples (e.g. columns and filters of get_<resource_name> functions) turned recursively into tuples, so that equal arguments make equal and hashable keys. Meant to be invoked by _memoized."""
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(item) for item in value)
+    return value
+
+def _copy(result):
+    """Returns a copy of result if it is a pandas object, result itself otherwise. Meant to be invoked by _memoized.
+
+    With copy-on-write, always enabled from pandas 3, the copy is shallow: it shares data with result until either of them is modified, so that cache hits take constant time. Otherwise (pandas 2 without copy-on-write enabled) the copy is deep."""
+
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.copy(deep=not _copy_on_write())
+    return result
+
+def _copy_on_write():
+    """Returns True if pandas copies data on write, i.e. with pandas 3 or later or with the copy_on_write option of pandas 2 enabled. Meant to be invoked by _copy."""
+
+    # the option is deprecated from pandas 3, which always copies on write
+    return int(pd.__version__.split(".")[0]) >= 3 or pd.get_option("mode.copy_on_write") is True
+
+def _normalize_codes(codes):
+    """Returns the integer geographical codes (e.g. region codes) provided as a parameter converted to str, e.g. 1 into "1". Meant to be invoked by get_<resource_name> functions.
+
+    Only the distinct codes (a few tens) are converted one by one, and rows are then filled in a vectorized way, instead of converting every row as with Series.apply(str).
+
+    Parameters
+    ----------
+    codes : pandas.core.series.Series
+        Series with integer codes.
+
+    Returns
+    -------
+    pandas.core.series.Series
+        Series with the same codes as str."""
+
+    positions, distinct_codes = pd.factorize(codes)
+    return pd.Series(distinct_codes.astype(str).take(positions), index=codes.index, name=codes.name)
+
+def _index_by_code(data, column):
+    """Returns the DataFrame provided as a parameter sorted by the integer geographical codes in column and indexed by them, converted by _normalize_codes. Meant to be invoked by get_<resource_name> functions.
+
+    Codes are sorted before conversion, so that they follow the numerical order (e.g. "2" before "10"). Being str, they allow proper ranging operations (i.e. data[x:y]), which have issues with ints.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+        DataFrame to index.
+    column : str
+        Name of the column with integer codes.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        Sorted and indexed DataFrame."""
+
+    # stable sorting keeps the original order of rows sharing the same code
+    data = data.sort_values(by=column, kind="stable")
+    data[column] = _normalize_codes(data[column])
+    return data.set_index(column)
+
+def _load(name, latest=False, incremental=False, index=True, start=None, stop=None, columns=None, filters=None):
+    """Returns the DataFrame of dataset name of the registry (see datasets.DATASETS), downloaded and parsed according to its declared types and dates, with columns translated from Italian and indexed as declared. Meant to be invoked by get_<resource_name> functions.
+
+    Parameters
+    ----------
+    name : str
+        Name of the dataset in the registry, e.g. "national_trend".
+    latest : bool
+        If True, only the data of the current day are returned, from the latest_url of the dataset (default is False)
+    incremental : bool
+        If True (and latest is False), the local copy of the dataset is updated with the days missing from it (see _get_incremental) instead of downloading the whole file. Requires the dataset to have a latest_url (default is False)
+    index : bool
+        If False, the DataFrame is returned without setting its index, for getters indexing it in their own way (default is True)
+    start : datetime or datetime-like formatted str or None
+        First date of the rows to return, compared with the date index of the dataset. A str date covers the whole period it describes, as in DataFrame slicing (default is None, i.e. from the first row)
+    stop : datetime or datetime-like formatted str or None
+        Last date (included) of the rows to return, as for start. Parsing of datasets sorted by date (see datasets.DATASETS) stops past it (default is None, i.e. up to the last row)
+    columns : list of str or None
+        Columns to return, with translated names. The index is always returned, and other columns are never parsed (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples with translated column names (see _select), applied while parsing. Values for date columns may be datetime-like formatted str (default is None, i.e. all rows)
+
+    Raises
+    ------
+    ItaCovidLibConnectionError
+        Raised when there are issues with Internet connection.
+
+    ItaCovidLibArgumentError
+        Raised when incremental is True and snapshots are not enabled, when columns or filters refer to columns which are not in the dataset or filters are malformed, or when start or stop are not valid dates.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        Translated DataFrame.
+
+    See Also
+    --------
+    _get, _get_incremental : download and parse the .csv files of datasets"""
+
+    dataset = icl_d.DATASETS[name]
+    schema = icl_d.schema(name)
+    if start is not None or stop is not None:
+        filters = [*(filters or []), *_period_filters(dataset["index"], start, stop)]
+    columns, filters = _original_selection(dataset, columns, filters)
+    sorted_by = dataset.get("sorted_by")
+    if latest:
+        data = _get(dataset.get("latest_url", dataset["url"]), schema=schema, columns=columns, filters=filters, sorted_by=sorted_by)
+    elif incremental:
+        data = _select(_get_incremental(dataset["url"], dataset["latest_url"], schema=schema), columns, filters)
+    else:
+        data = _get(dataset["url"], schema=schema, columns=columns, filters=filters, sorted_by=sorted_by)
+    # column names must be translated from Italian
+    data.rename(columns=dataset["columns"], inplace=True)
+    if not index:
+        return data
+    order = dataset.get("index_order")
+    if order == "codes":
+        return _index_by_code(data, dataset["index"])
+    if order == "sorted":
+        # for proper ranging
+        data.sort_values(by=dataset["index"], inplace=True)
+    data.set_index(dataset["index"], inplace=True)
+    return data
+
+def _original_selection(dataset, columns, filters):
+    """Returns columns (plus the index, always returned) and filters of _load with the original column names of dataset, checking them and turning values compared with date columns into pandas.Timestamp objects and values compared with geographical codes (returned as str, see _index_by_code) into the integers they are parsed as. Meant to be invoked by _load."""
+
+    original = {translated:column for column, translated in dataset["columns"].items()}
+    if columns is not None:
+        if isinstance(columns, str) or any(column not in original for column in columns):
+            raise icl_e.ItaCovidLibArgumentError("invalid columns. Please see documentation for help on possible columns.")
+        columns = [original[column] for column in dict.fromkeys([dataset["index"], *columns])]
+    if filters is not None:
+        translated_filters = []
+        for condition in filters:
+            if not isinstance(condition, (list, tuple)) or len(condition) != 3 or condition[0] not in original or (condition[1] not in _FILTER_OPERATORS and condition[1] != "in"):
+                raise icl_e.ItaCovidLibArgumentError("invalid filters. Please see documentation for help on possible filters.")
+            column, comparison, value = original[condition[0]], condition[1], condition[2]
+            if comparison == "in" and (isinstance(value, str) or not hasattr(value, "__iter__")):
+                raise icl_e.ItaCovidLibArgumentError("invalid filters. Please see documentation for help on possible filters.")
+            # categories are not ordered
+            if comparison not in ("==", "!=", "in") and dataset.get("dtype", {}).get(column) == "category":
+                raise icl_e.ItaCovidLibArgumentError("invalid filters: column "+condition[0]+" can only be compared with \"==\", \"!=\" and \"in\".")
+            if column in dataset.get("dates", []):
+                value = [pd.Timestamp(item) for item in value] if comparison == "in" else pd.Timestamp(value)
+            elif dataset.get("index_order") == "codes" and condition[0] == dataset["index"]:
+                try:
+                    value = [int(str(item)) for item in value] if comparison == "in" else int(str(value))
+                except ValueError:
+                    raise icl_e.ItaCovidLibArgumentError("invalid filters: "+condition[0]+" values must be integer codes, e.g. \"1\".") from None
+            translated_filters.append((column, comparison, value))
+        filters = translated_filters
+    return columns, filters
+
+def _period_filters(column, start, stop):
+    """Returns the filters (see _select) selecting the rows of column between start and stop (both included), checking them. Meant to be invoked by _load."""
+
+    try:
+        first, after = _period_bounds(start, stop)
+    except (ValueError, TypeError):
+        raise icl_e.ItaCovidLibArgumentError("invalid start or stop. Please provide dates or datetime-like formatted str.") from None
+    filters = []
+    if first is not None:
+        filters.append((column, ">=", first))
+    if after is not None:
+        filters.append((column, "<", after))
+    return filters
+
+def _period_bounds(start, stop):
+    """Returns the first instant of start and the first instant after stop (None for None) as pandas.Timestamp objects, with the rules of date slicing of pandas DataFrames: a str date covers the whole period it describes (e.g. the whole day), other dates are exact."""
+
+    if isinstance(start, str):
+        start = pd.Period(start).start_time
+    elif start is not None:
+        start = pd.Timestamp(start)
+    if isinstance(stop, str):
+        stop = (pd.Period(stop)+1).start_time
+    elif stop is not None:
+        stop = pd.Timestamp(stop)+pd.Timedelta(1, "ns")
+    return start, stop
+
+# files, shipped with the library, with the borders of Italian subdivisions
+_GEOMETRY_FILES = {"region": "regions_map.geojson", "province": "provinces_map.geojson"}
+
+def _load_geometries(subdivision, tolerance=None):
+    """Returns a GeoDataFrame with the borders of Italian regions or provinces, with one row per subdivision and its name in column subdivision. Meant to be invoked by prepare_for_plotting_on_map.
+
+    Geometries are read, dissolved (provinces) and simplified (if tolerance is given) only once per process and kept in memory. When snapshots are enabled, they are also stored in the snapshot directory as a GeoParquet file, so that later processes can load them without parsing the .geojson file again.
+
+    Parameters
+    ----------
+    subdivision : str
+        Either "region" or "province".
+    tolerance : float or None
+        Tolerance, in degrees, for simplifying geometries, preserving topology. None keeps the original geometries (default is None)
+
+    Returns
+    -------
+    geopandas.geodataframe.GeoDataFrame
+        GeoDataFrame with the borders of Italian subdivisions. It is shared among callers and must not be modified.
+
+    See Also
+    --------
+    prepare_for_plotting_on_map : attaches these geometries to DataFrames"""
+
+    key = (subdivision, tolerance)
+    with _geometries_lock:
+        if key not in _geometries:
+            _geometries[key] = _build_geometries(subdivision, tolerance)
+        return _geometries[key]
+
+def _build_geometries(subdivision, tolerance):
+    """Reads, dissolves and simplifies the borders of Italian subdivisions, or loads them from the snapshot directory if they are stored there. Meant to be invoked by _load_geometries."""
+
+    gpd = _import_optional("geopandas", "maps", "maps")
+    path = os.path.join(os.path.dirname(__file__), _GEOMETRY_FILES[subdivision])
+    stored_path = None
+    if _snapshots["directory"] is not None and os.path.exists(path):
+        # stored geometries are keyed by options and by the version of the .geojson file, so that library updates are taken into account
+        status = os.stat(path)
+        key = hashlib.sha256(json.dumps([subdivision, tolerance, status.st_size, status.st_mtime_ns]).encode("utf-8")).hexdigest()
+        stored_path = os.path.join(_snapshots["directory"], "geometries-"+key+".parquet")
+        if os.path.exists(stored_path):
+            return gpd.read_parquet(stored_path)
+    geometries = gpd.read_file(path)
+    if subdivision == "province":
+        # the following solves an issue with Sardinian provinces, which are not optimally described by the provinces file
+        geometries = geometries.dissolve(by="province").reset_index()
+    if tolerance is not None:
+        geometries["geometry"] = geometries.geometry.simplify(tolerance, preserve_topology=True)
+    if stored_path is not None:
+        try:
+            _import_feather()
+            os.makedirs(_snapshots["directory"], exist_ok=True)
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=_snapshots["directory"], suffix=".tmp")
+            os.close(file_descriptor)
+            geometries.to_parquet(temporary_path)
+            os.replace(temporary_path, stored_path)
+        except (ImportError, OSError):
+            # storing geometries is only an optimization
+            pass
+    return geometries
+
+def _join_geometries(source, geometries, column):
+    """Attaches to source the geometries of the subdivisions named in its column, through a lookup of their positions instead of a merge. Rows with unknown subdivisions are dropped, as with an inner merge. Meant to be invoked by prepare_for_plotting_on_map.
+
+    Unlike pandas.merge, source is neither copied nor reordered and keeps its index (e.g. dates), and the geometry column only holds references to the shared geometries.
+
+    Parameters
+    ----------
+    source : pandas.core.frame.DataFrame
+        DataFrame with the names of subdivisions in column.
+    geometries : geopandas.geodataframe.GeoDataFrame
+        GeoDataFrame returned by _load_geometries.
+    column : str
+        Either "region" or "province".
+
+    Raises
+    ------
+    KeyError
+        Raised when source has no column named column.
+
+    Returns
+    -------
+    geopandas.geodataframe.GeoDataFrame
+        source with geometries in column "geometry"."""
+
+    gpd = _import_optional("geopandas", "maps", "maps")
+    positions = pd.Index(geometries[column]).get_indexer(source[column])
+    known = positions >= 0
+    if not known.all():
+        source = source[known]
+        positions = positions[known]
+    geometry = gpd.GeoSeries(geometries.geometry.array.take(positions), index=source.index, crs=geometries.crs)
+    return gpd.GeoDataFrame(source, geometry=geometry)
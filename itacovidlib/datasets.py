@@ -0,0 +1,149 @@
+# registry of the datasets downloaded by get_<resource_name> functions, keyed by resource name (i.e. the name of the function without "get_"). Each dataset is declared by:
+#     url: URL of the .csv file with the whole dataset
+#     latest_url: URL of the .csv file with the data of the current day only, for daily time series datasets (optional)
+#     columns: translation of the original (Italian) column names into the English ones of the returned DataFrame
+#     dtype: types of the columns which are not left to pandas, with original names (optional). Text columns with few distinct values are read as category, counts as the smallest integer type which can safely hold them
+#     dates: date columns, with original names (optional)
+#     index: column of the returned DataFrame to use as index, with English name
+#     sorted_by: date column, with original name, by which rows of the file are sorted, so that parsing can stop past the end of a requested period and snapshots can skip data outside it (optional)
+#     index_order: "sorted" if rows are sorted by index, "codes" if the index holds integer geographical codes, sorted and converted to str (e.g. ISTAT region codes, assigned from north to south, so that a North-Centre-South distinction is possible) (optional, default is the order of the file)
+# backend._load downloads, parses, translates and indexes any dataset according to its declaration, so that get_<resource_name> functions only document and wrap it.
+
+# all dates in the datasets are ISO 8601 formatted, either with or without time
+DATE_FORMAT = "ISO8601"
+
+VACCINES = "https://raw.githubusercontent.com/italia/covid19-opendata-vaccini/master/dati/"
+DPC = "https://raw.githubusercontent.com/pcm-dpc/COVID-19/master/"
+
+DATASETS = {
+    "vaccine_ages": {
+        "url": VACCINES+"anagrafica-vaccini-summary-latest.csv",
+        "columns": {"fascia_anagrafica":"age_group", "totale":"total", "sesso_maschile":"males", "sesso_femminile":"females", "prima_dose":"first_dose", "seconda_dose":"second_dose", "pregressa_infezione":"previously_infected", "dose_aggiuntiva":"extra_dose", "dose_booster":"booster_dose", "ultimo_aggiornamento":"last_update"},
+        "dates": ["ultimo_aggiornamento"],
+        "index": "age_group",
+    },
+    "vaccine_deliveries": {
+        "url": VACCINES+"consegne-vaccini-latest.csv",
+        "columns": {"area":"region_code", "fornitore":"manufacturer", "data_consegna":"date_of_delivery", "numero_dosi":"number_of_doses", "codice_NUTS1":"NUTS1_code", "codice_NUTS2":"NUTS2_code", "codice_regione_ISTAT":"ISTAT_region_code", "nome_area":"region"},
+        "dtype": {"area":"category", "fornitore":"category", "numero_dosi":"int32", "codice_NUTS1":"category", "codice_NUTS2":"category", "codice_regione_ISTAT":"int8", "nome_area":"category"},
+        "dates": ["data_consegna"],
+        "index": "date_of_delivery",
+        "index_order": "sorted",
+    },
+    "eligible": {
+        "url": VACCINES+"platea.csv",
+        "columns": {"area":"region_code", "nome_area":"region", "fascia_anagrafica":"age_group", "totale_popolazione":"population"},
+        "index": "age_group",
+    },
+    "extra_dose_eligible": {
+        "url": VACCINES+"platea-dose-aggiuntiva.csv",
+        "columns": {"area":"region_code", "nome_area":"region", "categoria_prevalente":"prevailing_category", "totale_popolazione":"population"},
+        "index": "region_code",
+    },
+    "booster_dose_eligible": {
+        "url": VACCINES+"platea-dose-booster.csv",
+        "columns": {"area":"region_code", "nome_area":"region", "categoria_prevalente":"prevailing_category", "totale_popolazione":"population"},
+        "index": "region_code",
+    },
+    "admin_sites": {
+        "url": VACCINES+"punti-somministrazione-latest.csv",
+        "columns": {"area":"region_code", "provincia":"province", "comune":"municipality", "presidio_ospedaliero":"place", "codice_NUTS1":"NUTS1_code", "codice_NUTS2":"NUTS2_code", "codice_regione_ISTAT":"ISTAT_region_code", "nome_area":"region"},
+        "dtype": {"area":"category", "provincia":"category", "codice_NUTS1":"category", "codice_NUTS2":"category", "codice_regione_ISTAT":"int8", "nome_area":"category"},
+        "index": "ISTAT_region_code",
+        "index_order": "codes",
+    },
+    "admin_sites_types": {
+        "url": VACCINES+"punti-somministrazione-tipologia.csv",
+        "columns": {"area":"region_code", "denominazione_struttura":"place", "tipologia":"type", "codice_NUTS1":"NUTS1_code", "codice_NUTS2":"NUTS2_code", "codice_regione_ISTAT":"ISTAT_region_code", "nome_area":"region"},
+        "dtype": {"area":"category", "tipologia":"category", "codice_NUTS1":"category", "codice_NUTS2":"category", "codice_regione_ISTAT":"int8", "nome_area":"category"},
+        "index": "ISTAT_region_code",
+        "index_order": "codes",
+    },
+    "vaccine_admin": {
+        "url": VACCINES+"somministrazioni-vaccini-latest.csv",
+        "columns": {"data_somministrazione":"date", "fornitore":"manufacturer", "area":"region_code", "fascia_anagrafica":"age_group", "sesso_maschile":"males", "sesso_femminile":"females", "prima_dose":"first_dose", "seconda_dose":"second_dose", "pregressa_infezione":"previously_infected", "dose_aggiuntiva":"extra_dose", "dose_booster":"booster_dose", "codice_NUTS1":"NUTS1_code", "codice_NUTS2":"NUTS2_code", "codice_regione_ISTAT":"ISTAT_region_code", "nome_area":"region"},
+        "dtype": {"fornitore":"category", "area":"category", "fascia_anagrafica":"category", "sesso_maschile":"int32", "sesso_femminile":"int32", "prima_dose":"int32", "seconda_dose":"int32", "pregressa_infezione":"int32", "dose_aggiuntiva":"int32", "dose_booster":"int32", "codice_NUTS1":"category", "codice_NUTS2":"category", "codice_regione_ISTAT":"int8", "nome_area":"category"},
+        "dates": ["data_somministrazione"],
+        "sorted_by": "data_somministrazione",
+        "index": "date",
+    },
+    "vaccine_admin_summary": {
+        "url": VACCINES+"somministrazioni-vaccini-summary-latest.csv",
+        "columns": {"data_somministrazione":"date", "area":"region_code", "totale":"total", "sesso_maschile":"males", "sesso_femminile":"females", "prima_dose":"first_dose", "seconda_dose":"second_dose", "pregressa_infezione":"previously_infected", "dose_aggiuntiva":"extra_dose", "dose_booster":"booster_dose", "codice_NUTS1":"NUTS1_code", "codice_NUTS2":"NUTS2_code", "codice_regione_ISTAT":"ISTAT_region_code", "nome_area":"region"},
+        "dtype": {"area":"category", "totale":"int32", "sesso_maschile":"int32", "sesso_femminile":"int32", "prima_dose":"int32", "seconda_dose":"int32", "pregressa_infezione":"int32", "dose_aggiuntiva":"int32", "dose_booster":"int32", "codice_NUTS1":"category", "codice_NUTS2":"category", "codice_regione_ISTAT":"int8", "nome_area":"category"},
+        "dates": ["data_somministrazione"],
+        "index": "date",
+        "index_order": "sorted",
+    },
+    "vaccine_general_summary": {
+        "url": VACCINES+"vaccini-summary-latest.csv",
+        "columns": {"area":"region_code", "dosi_somministrate":"administered_doses", "dosi_consegnate":"delivered_doses", "percentuale_somministrazione":"administration_percent", "ultimo_aggiornamento":"last_update", "codice_NUTS1":"NUTS1_code", "codice_NUTS2":"NUTS2_code", "codice_regione_ISTAT":"ISTAT_region_code", "nome_area":"region"},
+        "dates": ["ultimo_aggiornamento"],
+        "index": "ISTAT_region_code",
+        "index_order": "codes",
+    },
+    "national_trend": {
+        "url": DPC+"dati-andamento-nazionale/dpc-covid19-ita-andamento-nazionale.csv",
+        "latest_url": DPC+"dati-andamento-nazionale/dpc-covid19-ita-andamento-nazionale-latest.csv",
+        "columns": {"data":"date", "stato":"country", "ricoverati_con_sintomi":"hospitalized_with_symptoms", "terapia_intensiva":"intensive_care", "totale_ospedalizzati":"hospitalized", "isolamento_domiciliare":"isolation", "totale_positivi":"cases", "variazione_totale_positivi":"cases_variation", "nuovi_positivi":"new_cases", "dimessi_guariti":"recovered_released", "deceduti":"deaths", "casi_da_sospetto_diagnostico":"cases_from_clinical_suspects", "casi_da_screening":"cases_from_screening", "totale_casi":"cumulative_cases", "tamponi":"swabs", "casi_testati":"tested", "note":"notes", "ingressi_terapia_intensiva":"intensive_care_in", "note_test":"test_notes", "note_casi":"case_notes", "totale_positivi_test_molecolare":"molecular_test_cases", "totale_positivi_test_antigenico_rapido":"antigen_test_cases", "tamponi_test_molecolare":"molecular_tests", "tamponi_test_antigenico_rapido":"antigen_tests"},
+        "dtype": {"stato":"category"},
+        "dates": ["data"],
+        "sorted_by": "data",
+        "index": "date",
+    },
+    "equip_contracts": {
+        "url": DPC+"dati-contratti-dpc-forniture/dpc-covid19-dati-contratti-dpc-forniture.csv",
+        "columns": {"fornitore":"manufacturer", "stato_fornitore":"country", "gruppo_articoli":"product_group", "sottogruppo_articoli":"article_subgroup", "categoria":"category", "sottocategoria":"subcategory", "tipologia_fornitura":"equipment_kind", "fornitura":"equipment", "protocollo_atto_negoziale":"negotiation_protocol", "data_atto_negoziale":"negotiation_date", "file_atto_negoziale":"negotiation_file", "integrazione_rettifica":"errata", "protocollo_integrazione_rettifica":"errata_protocol", "data_integrazione_rettifica":"errata_date", "file_integrazione_rettifica":"errata_file", "tipologia_cig":"tender_id_type", "cig":"tender_id", "quantita":"quantity", "prezzo_unitario":"unit_price", "totale_articolo":"total_price", "stato_contratto":"agreement_state", "ceduti_commissario_straordinario":"ceded", "note":"notes", "data_aggiornamento":"update_date"},
+        "dates": ["data_atto_negoziale", "data_aggiornamento"],
+        "index": "negotiation_date",
+        "index_order": "sorted",
+    },
+    "equip_contracts_payments": {
+        "url": DPC+"dati-contratti-dpc-forniture/dpc-covid19-dati-pagamenti-contratti-dpc-forniture.csv",
+        "columns": {"protocollo_atto_negoziale":"negotiation_protocol", "totale_fornitura":"total_equipment", "totale_pagato":"total_paid", "pagato_donazioni":"donations", "pagato_altri_fondi":"other_funds", "fondo_pagamento":"payment_fund", "ceduti_commissario_straordinario":"ceded", "note":"notes", "data_aggiornamento":"update_date"},
+        "dates": ["data_aggiornamento"],
+        "index": "negotiation_protocol",
+    },
+    "province_cases": {
+        "url": DPC+"dati-province/dpc-covid19-ita-province.csv",
+        "latest_url": DPC+"dati-province/dpc-covid19-ita-province-latest.csv",
+        "columns": {"data":"date", "stato":"country", "codice_regione":"region_code", "denominazione_regione":"region", "codice_provincia":"province_code", "denominazione_provincia":"province", "sigla_provincia":"province_abbreviation", "lat":"lat", "long":"long", "totale_casi":"cumulative_cases", "note":"notes", "codice_nuts_1":"NUTS1_code", "codice_nuts_2":"NUTS2_code", "codice_nuts_3":"NUTS3_code"},
+        "dtype": {"stato":"category", "codice_regione":"int8", "denominazione_regione":"category", "codice_provincia":"int16", "denominazione_provincia":"category", "sigla_provincia":"category", "totale_casi":"int32", "codice_nuts_1":"category", "codice_nuts_2":"category", "codice_nuts_3":"category"},
+        "dates": ["data"],
+        "sorted_by": "data",
+        "index": "date",
+    },
+    "region_cases": {
+        "url": DPC+"dati-regioni/dpc-covid19-ita-regioni.csv",
+        "latest_url": DPC+"dati-regioni/dpc-covid19-ita-regioni-latest.csv",
+        "columns": {"data":"date", "stato":"country", "codice_regione":"region_code", "denominazione_regione":"region", "ricoverati_con_sintomi":"hospitalized_with_symptoms", "terapia_intensiva":"intensive_care", "totale_ospedalizzati":"hospitalized", "isolamento_domiciliare":"isolation", "totale_positivi":"cases", "variazione_totale_positivi":"cases_variation", "nuovi_positivi":"new_cases", "dimessi_guariti":"recovered_released", "deceduti":"deaths", "casi_da_sospetto_diagnostico":"cases_from_clinical_suspects", "casi_da_screening":"cases_from_screening", "totale_casi":"cumulative_cases", "tamponi":"swabs", "casi_testati":"tested", "note":"notes", "ingressi_terapia_intensiva":"intensive_care_in", "note_test":"test_notes", "note_casi":"case_notes", "totale_positivi_test_molecolare":"molecular_test_cases", "totale_positivi_test_antigenico_rapido":"antigen_test_cases", "tamponi_test_molecolare":"molecular_tests", "tamponi_test_antigenico_rapido":"antigen_tests", "codice_nuts_1":"NUTS1_code", "codice_nuts_2":"NUTS2_code"},
+        "dtype": {"stato":"category", "codice_regione":"int8", "denominazione_regione":"category", "ricoverati_con_sintomi":"int32", "terapia_intensiva":"int32", "totale_ospedalizzati":"int32", "isolamento_domiciliare":"int32", "totale_positivi":"int32", "variazione_totale_positivi":"int32", "nuovi_positivi":"int32", "dimessi_guariti":"int32", "deceduti":"int32", "totale_casi":"int32", "tamponi":"int32", "codice_nuts_1":"category", "codice_nuts_2":"category"},
+        "dates": ["data"],
+        "sorted_by": "data",
+        "index": "date",
+    },
+    "over_80": {
+        "url": DPC+"dati-statistici-riferimento/popolazione-over80.csv",
+        "columns": {"codice_regione":"region_code", "codice_nuts_1":"NUTS1_code", "descrizione_nuts_1":"NUTS1_description", "codice_nuts_2":"NUTS2_code", "denominazione_regione":"region", "range_eta":"age_range", "totale_genere_maschile":"males", "totale_genere_femminile":"females", "totale_generale":"total"},
+        "index": "region_code",
+        "index_order": "codes",
+    },
+    "istat_region_data": {
+        "url": DPC+"dati-statistici-riferimento/popolazione-istat-regione-range.csv",
+        "columns": {"codice_regione":"region_code", "codice_nuts_1":"NUTS1_code", "descrizione_nuts_1":"NUTS1_description", "codice_nuts_2":"NUTS2_code", "denominazione_regione":"region", "sigla_regione":"region_abbreviation", "latitudine_regione":"lat", "longitudine_regione":"long", "range_eta":"age_range", "totale_genere_maschile":"males", "totale_genere_femminile":"females", "totale_generale":"total"},
+        "index": "region_code",
+        "index_order": "codes",
+    },
+}
+
+def schema(name):
+    """Returns the parsing options of dataset name, passed by backend._get to pandas.read_csv so that no conversion is needed after parsing, or None for datasets without declared types and dates (parsed with pandas defaults)."""
+
+    dataset = DATASETS[name]
+    options = {}
+    if "dtype" in dataset:
+        options["dtype"] = dataset["dtype"]
+    if "dates" in dataset:
+        options["parse_dates"] = dataset["dates"]
+        options["date_format"] = DATE_FORMAT
+    return options or None
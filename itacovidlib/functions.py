@@ -1,24 +1,34 @@
 import os.path
+import sys
+import inspect
+import functools
+import concurrent.futures
 import itacovidlib.backend as icl_b
 import itacovidlib.exceptions as icl_e
 import numpy as np
 import pandas as pd
-import geopandas as gpd
-import epyestim.covid19 as covid19
+# geopandas, matplotlib (through itacovidlib.rendering) and epyestim (through itacovidlib.rt) are slow to import and optional: they are imported at first use by the functions requiring them
 
 
-def get_vaccine_ages():
+@icl_b._memoized
+def get_vaccine_ages(columns=None, filters=None):
     """Returns DataFrame about COVID-19 vaccine administrations per age group in Italy.
     
     Parameters
     ----------
-    None
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("age_group", "in", ["80-89", "90+"]). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
     
+    ItaCovidLibArgumentError
+        Raised when columns or filters refer to columns which are not in the dataset, or filters are malformed.
+    
     Returns
     -------
     pandas.core.frame.DataFrame
@@ -47,27 +57,31 @@ def get_vaccine_ages():
     last_update : datetime
         Date of last update"""
     
-    data = icl_b._get("https://raw.githubusercontent.com/italia/covid19-opendata-vaccini/master/dati/anagrafica-vaccini-summary-latest.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"fascia_anagrafica":"age_group","totale":"total","sesso_maschile":"males","sesso_femminile":"females","prima_dose":"first_dose","seconda_dose":"second_dose","pregressa_infezione":"previously_infected","dose_aggiuntiva":"extra_dose","dose_booster":"booster_dose","ultimo_aggiornamento":"last_update"}, inplace=True)
-        # dates in last_update must be parsed into datetime objects
-        data["last_update"] = pd.to_datetime(data["last_update"])
-        data.set_index("age_group", inplace=True)
-        return data
-
-def get_vaccine_deliveries():
+    return icl_b._load("vaccine_ages", columns=columns, filters=filters)
+
+@icl_b._memoized
+def get_vaccine_deliveries(start=None, stop=None, columns=None, filters=None):
     """Returns DataFrame about COVID-19 vaccine deliveries in Italy.
     
     Parameters
     ----------
-    None
+    start : datetime or datetime-like formatted str or None
+        First date (index) of the data to return. As in DataFrame slicing, a str date covers the whole period it describes, e.g. "2021-06" the whole month of June 2021 (default is None, i.e. from the first date)
+    stop : datetime or datetime-like formatted str or None
+        Last date (index, included) of the data to return, as for start. The file is not sorted by date, so it is parsed in full anyway (default is None, i.e. up to the last date)
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("region", "==", "Lazio"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
     
+    ItaCovidLibArgumentError
+        Raised when columns or filters refer to columns which are not in the dataset, when filters are malformed, or when start or stop are not valid dates.
+    
     Returns
     -------
     pandas.core.frame.DataFrame
@@ -77,44 +91,42 @@ def get_vaccine_deliveries():
     -----------------
     date_of_delivery : datetime (index)
         Date of delivery
-    region_code : str
+    region_code : category
         Code of delivery region
-    manufacturer : str
+    manufacturer : category
         Vaccine manufacturer name
-    number_of_doses : int64
+    number_of_doses : int32
         Number of delivered doses on date date_of_delivery
-    NUTS1_code : str
+    NUTS1_code : category
         European classification of territorial units NUTS: level NUTS1
-    NUTS2_code : str
+    NUTS2_code : category
         European classification of territorial units NUTS: level NUTS2
-    ISTAT_region_code : int
+    ISTAT_region_code : int8
         ISTAT region code
-    region : str
+    region : category
         Official region name"""
     
-    data = icl_b._get("https://raw.githubusercontent.com/italia/covid19-opendata-vaccini/master/dati/consegne-vaccini-latest.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"area":"region_code","fornitore":"manufacturer","data_consegna":"date_of_delivery","numero_dosi":"number_of_doses","codice_NUTS1":"NUTS1_code","codice_NUTS2":"NUTS2_code","codice_regione_ISTAT":"ISTAT_region_code","nome_area":"region"}, inplace=True)
-        # dates in column date_of_delivery must be parsed into datetime objects
-        data["date_of_delivery"] = pd.to_datetime(data["date_of_delivery"])
-        # since date_of_delivery is meant to be the index, it is reasonable returned DataFrame is sorted by date, also for proper ranging
-        data.sort_values(by="date_of_delivery", inplace=True)
-        data.set_index("date_of_delivery", inplace=True)
-        return data
-
-def get_eligible():
+    return icl_b._load("vaccine_deliveries", start=start, stop=stop, columns=columns, filters=filters)
+
+@icl_b._memoized
+def get_eligible(columns=None, filters=None):
     """Returns DataFrame about eligible persons for COVID-19 vaccine administration in Italy.
     
     Parameters
     ----------
-    None
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("region", "==", "Lazio"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
     
+    ItaCovidLibArgumentError
+        Raised when columns or filters refer to columns which are not in the dataset, or filters are malformed.
+    
     Returns
     -------
     pandas.core.frame.DataFrame
@@ -135,26 +147,28 @@ def get_eligible():
     --------
     get_extra_dose_eligible : data about eligible persons for extra COVID-19 vaccine dose administration in Italy."""
     
-    data = icl_b._get("https://raw.githubusercontent.com/italia/covid19-opendata-vaccini/master/dati/platea.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"area":"region_code","nome_area":"region","fascia_anagrafica":"age_group","totale_popolazione":"population"}, inplace=True)
-        data.set_index("age_group", inplace=True)
-        return data
-    
-def get_extra_dose_eligible():
+    return icl_b._load("eligible", columns=columns, filters=filters)
+
+@icl_b._memoized
+def get_extra_dose_eligible(columns=None, filters=None):
     """Returns DataFrame about eligible persons for extra COVID-19 vaccine dose administration in Italy.
     An extra dose is required for those individuals who cannot develop a proper protection after the usual vaccine administration(s).
     
     Parameters
     ----------
-    None
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("region", "==", "Lazio"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
-        
+    
+    ItaCovidLibArgumentError
+        Raised when columns or filters refer to columns which are not in the dataset, or filters are malformed.
+    
     Returns
     -------
     pandas.core.frame.DataFrame
@@ -175,27 +189,29 @@ def get_extra_dose_eligible():
     --------
     get_eligible : data about eligible persons for COVID-19 vaccine administration in Italy.
     get_booster_dose_eligible : data about eligible persons for booster dose."""
-        
-    data = icl_b._get("https://raw.githubusercontent.com/italia/covid19-opendata-vaccini/master/dati/platea-dose-aggiuntiva.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"area":"region_code","nome_area":"region","categoria_prevalente":"prevailing_category","totale_popolazione":"population"}, inplace=True)
-        data.set_index("region_code", inplace=True)
-        return data
     
-def get_booster_dose_eligible():
+    return icl_b._load("extra_dose_eligible", columns=columns, filters=filters)
+
+@icl_b._memoized
+def get_booster_dose_eligible(columns=None, filters=None):
     """Returns DataFrame about eligible persons for booster COVID-19 vaccine dose administration in Italy.
     A booster dose is required for those individuals who have successfully developed a proper protection after the usual vaccine administration(s) but are considered in need of one extra dose to furtherly reinforce their protection.
     
     Parameters
     ----------
-    None
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("region", "==", "Lazio"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
-        
+    
+    ItaCovidLibArgumentError
+        Raised when columns or filters refer to columns which are not in the dataset, or filters are malformed.
+    
     Returns
     -------
     pandas.core.frame.DataFrame
@@ -216,27 +232,29 @@ def get_booster_dose_eligible():
     --------
     get_eligible : data about eligible persons for COVID-19 vaccine administration in Italy.
     get_extra_dose_eligible : data about eligible persons for extra dose."""
-        
-    data = icl_b._get("https://raw.githubusercontent.com/italia/covid19-opendata-vaccini/master/dati/platea-dose-booster.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"area":"region_code","nome_area":"region","categoria_prevalente":"prevailing_category","totale_popolazione":"population"}, inplace=True)
-        data.set_index("region_code", inplace=True)
-        return data
-        
+    
+    return icl_b._load("booster_dose_eligible", columns=columns, filters=filters)
+
 
-def get_admin_sites():
+@icl_b._memoized
+def get_admin_sites(columns=None, filters=None):
     """Returns DataFrame about COVID-19 vaccine administrations points in Italy.
     
     Parameters
     ----------
-    None
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("region", "==", "Lazio"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
     
+    ItaCovidLibArgumentError
+        Raised when columns or filters refer to columns which are not in the dataset, or filters are malformed.
+    
     Returns
     -------
     pandas.core.frame.DataFrame
@@ -246,45 +264,42 @@ def get_admin_sites():
     -----------------
     ISTAT_region_code : str (index)
         ISTAT region code
-    region_code : str
+    region_code : category
         Region code
-    province : str
+    province : category
         Province
     municipality : str
         Municipality
     place : str
         Name of place of administration
-    NUTS1_code : str
+    NUTS1_code : category
         European classification of territorial units NUTS: level NUTS1
-    NUTS2_code : str
+    NUTS2_code : category
         European classification of territorial units NUTS: level NUTS2
-    region : str
+    region : category
         Official region name"""
     
-    data = icl_b._get("https://raw.githubusercontent.com/italia/covid19-opendata-vaccini/master/dati/punti-somministrazione-latest.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"area":"region_code","provincia":"province","comune":"municipality","presidio_ospedaliero":"place","codice_NUTS1":"NUTS1_code","codice_NUTS2":"NUTS2_code","codice_regione_ISTAT":"ISTAT_region_code","nome_area":"region"}, inplace=True)
-        # for proper indexing
-        data.sort_values(by="ISTAT_region_code", inplace=True)
-        # for proper ranging operations (i.e. data[x:y]). Ints have issues in this
-        data["ISTAT_region_code"] = data["ISTAT_region_code"].apply(str)
-        # for this dataset, this is the only reasonable choice, since ISTAT region codes are assigned from north to south, making a North-Centre-South distinction possible
-        data.set_index("ISTAT_region_code", inplace=True)
-        return data
-
-def get_admin_sites_types():
+    return icl_b._load("admin_sites", columns=columns, filters=filters)
+
+@icl_b._memoized
+def get_admin_sites_types(columns=None, filters=None):
     """Returns DataFrame on types of COVID-19 vaccine administration points in Italy.
     
     Parameters
     ----------
-    None
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("region", "==", "Lazio"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
     
+    ItaCovidLibArgumentError
+        Raised when columns or filters refer to columns which are not in the dataset, or filters are malformed.
+    
     Returns
     -------
     pandas.core.frame.DataFrame
@@ -294,43 +309,44 @@ def get_admin_sites_types():
     -----------------
     ISTAT_region_code : str (index)
         ISTAT region code
-    region_code : str
+    region_code : category
         Region code
     place : str
         Name of place of administration
-    type : str
+    type : category
         Type of administration place: OSPEDALIERO (hospital) or TERRITORIALE (local)
-    NUTS1_code : str
+    NUTS1_code : category
         European classification of territorial units NUTS: level NUTS1
-    NUTS2_code : str
+    NUTS2_code : category
         European classification of territorial units NUTS: level NUTS2
-    region : str
+    region : category
         Official region name"""
     
-    data = icl_b._get("https://raw.githubusercontent.com/italia/covid19-opendata-vaccini/master/dati/punti-somministrazione-tipologia.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"area":"region_code","denominazione_struttura":"place","tipologia":"type","codice_NUTS1":"NUTS1_code","codice_NUTS2":"NUTS2_code","codice_regione_ISTAT":"ISTAT_region_code","nome_area":"region"}, inplace=True)
-        # for proper indexing
-        data.sort_values(by="ISTAT_region_code", inplace=True)
-        # for proper ranging operations (i.e. data[x:y]). Ints have issues in this
-        data["ISTAT_region_code"] = data["ISTAT_region_code"].apply(str)
-        # for this dataset, this is the only reasonable choice, since ISTAT region codes are assigned from north to south, making a North-Centre-South distinction possible
-        data.set_index("ISTAT_region_code", inplace=True)
-        return data
-
-def get_vaccine_admin():
+    return icl_b._load("admin_sites_types", columns=columns, filters=filters)
+
+@icl_b._memoized
+def get_vaccine_admin(start=None, stop=None, columns=None, filters=None):
     """Returns DataFrame on COVID-19 vaccine administration in Italy.
     
     Parameters
     ----------
-    None
+    start : datetime or datetime-like formatted str or None
+        First date (index) of the data to return. As in DataFrame slicing, a str date covers the whole period it describes, e.g. "2021-06" the whole month of June 2021 (default is None, i.e. from the first date)
+    stop : datetime or datetime-like formatted str or None
+        Last date (index, included) of the data to return, as for start. The file being sorted by date, parsing stops as soon as it is passed, without downloading the rest of the file (default is None, i.e. up to the last date)
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("region", "==", "Lazio"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     -------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
     
+    ItaCovidLibArgumentError
+        Raised when columns or filters refer to columns which are not in the dataset, when filters are malformed, or when start or stop are not valid dates.
+    
     Returns
     -------
     pandas.core.frame.DataFrame
@@ -340,60 +356,60 @@ def get_vaccine_admin():
     -----------------
     date : datetime (index)
         Date of administration
-    Manufacturer : str
+    manufacturer : category
         Vaccine manufacturer name
-    region_code : str
+    region_code : category
         Region code
-    age_group : str
+    age_group : category
         Age group
-    males : int64
+    males : int32
         Number of male individuals who have been given the vaccine
-    females : int64
+    females : int32
         Number of female individuals who have been given the vaccine
-    first_dose : int64
+    first_dose : int32
         Number of first doses (excluding previously infected individuals)
-    second_dose : int64
+    second_dose : int32
         Number of second doses
-    previously_infected : int64
+    previously_infected : int32
         Number of vaccine administrations to individuals who have already been infected by SARS-CoV-2 between 3 and 6 months before and as such completing the vaccination cycle with just one dose
-    extra_dose : int64
+    extra_dose : int32
         Number of extra doses administered to individuals requiring it
-    booster_dose : int64
+    booster_dose : int32
         Number of booster doses administered to individuals requiring it
-    NUTS1_code : str
+    NUTS1_code : category
         European classification of territorial units NUTS: level NUTS1
-    NUTS2_code : str
+    NUTS2_code : category
         European classification of territorial units NUTS: level NUTS2
-    ISTAT_region_code : int64
+    ISTAT_region_code : int8
         ISTAT region code
-    region : str
+    region : category
         Official region name
     
     See Also
     --------
     get_vaccine_admin_summary : a concise version (summary) of this function"""
     
-    data = icl_b._get("https://raw.githubusercontent.com/italia/covid19-opendata-vaccini/master/dati/somministrazioni-vaccini-latest.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"data_somministrazione":"date","fornitore":"manufacturer","area":"region_code","fascia_anagrafica":"age_group","sesso_maschile":"males","sesso_femminile":"females","prima_dose":"first_dose","seconda_dose":"second_dose","pregressa_infezione":"previously_infected","dose_aggiuntiva":"extra_dose","dose_booster":"booster_dose","codice_NUTS1":"NUTS1_code","codice_NUTS2":"NUTS2_code","codice_regione_ISTAT":"ISTAT_region_code","nome_area":"region"}, inplace=True)
-        # dates in column date must be parsed into datetime objects
-        data["date"] = pd.to_datetime(data["date"])
-        data.set_index("date", inplace=True)
-        return data
-    
-def get_vaccine_admin_summary():
+    return icl_b._load("vaccine_admin", start=start, stop=stop, columns=columns, filters=filters)
+
+@icl_b._memoized
+def get_vaccine_admin_summary(columns=None, filters=None):
     """Returns DataFrame about COVID-19 vaccine administration in Italy (summary version)
     
     Parameters
     ----------
-    None
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("region", "==", "Lazio"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
     
+    ItaCovidLibArgumentError
+        Raised when columns or filters refer to columns which are not in the dataset, or filters are malformed.
+    
     Returns
     -------
     pandas.core.frame.DataFrame
@@ -403,60 +419,58 @@ def get_vaccine_admin_summary():
     -----------------
     date : datetime (index)
         Date of administration
-    region_code : str
+    region_code : category
         Region code
-    total : int64
+    total : int32
         Total amount of doses
-    males : int64
+    males : int32
         Number of male individuals who have been given a vaccine dose
-    females : int64
+    females : int32
         Number of female individuals who have been given a vaccine dose
-    first_dose : int64
+    first_dose : int32
         Number of first doses (excluding previously infected individuals)
-    second_dose : int64
+    second_dose : int32
         Number of second doses
-    previously_infected : int64
+    previously_infected : int32
         Number of vaccine administrations to individuals who have already been infected by SARS-CoV-2 between 3 and 6 months before and as such completing the vaccination cycle with just one dose
-    extra_dose : int64
+    extra_dose : int32
         Number of extra doses administered to individuals requiring it
-    booster_dose : int64
+    booster_dose : int32
         Number of booster doses administered to individuals requiring it
-    NUTS1_code : str
+    NUTS1_code : category
         European classification of territorial units NUTS: level NUTS1
-    NUTS2_code : str
+    NUTS2_code : category
         European classification of territorial units NUTS: level NUTS2
-    ISTAT_region_code : int64
+    ISTAT_region_code : int8
         ISTAT region code
-    region : str
+    region : category
         Official region name
     
     See Also
     --------
     get_vaccine_admin : a complete version of this function with more data"""
     
-    data = icl_b._get("https://raw.githubusercontent.com/italia/covid19-opendata-vaccini/master/dati/somministrazioni-vaccini-summary-latest.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"data_somministrazione":"date","area":"region_code","totale":"total","sesso_maschile":"males","sesso_femminile":"females","prima_dose":"first_dose","seconda_dose":"second_dose","pregressa_infezione":"previously_infected","dose_aggiuntiva":"extra_dose","dose_booster":"booster_dose","codice_NUTS1":"NUTS1_code","codice_NUTS2":"NUTS2_code","codice_regione_ISTAT":"ISTAT_region_code","nome_area":"region"}, inplace=True)
-        # dates in column date must be parsed into datetime objects
-        data["date"] = pd.to_datetime(data["date"])
-        # for proper indexing
-        data.sort_values(by="date", inplace=True)
-        data.set_index("date", inplace=True)
-        return data
-    
-def get_vaccine_general_summary():
+    return icl_b._load("vaccine_admin_summary", columns=columns, filters=filters)
+
+@icl_b._memoized
+def get_vaccine_general_summary(columns=None, filters=None):
     """Returns DataFrame with a synthesis of COVID-19 vaccines deliveries and administrations in Italy.
     
     Parameters
     ----------
-    None
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("region", "==", "Lazio"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
     
+    ItaCovidLibArgumentError
+        Raised when columns or filters refer to columns which are not in the dataset, or filters are malformed.
+    
     Returns
     -------
     pandas.core.frame.DataFrame
@@ -489,32 +503,33 @@ def get_vaccine_general_summary():
     get_vaccine_admin_summary : more info on COVID-19 vaccine administrations (concise version)
     get_vaccine_admin : more info on COVID-19 vaccine administrations (complete version)"""
     
-    data = icl_b._get("https://raw.githubusercontent.com/italia/covid19-opendata-vaccini/master/dati/vaccini-summary-latest.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"area":"region_code","dosi_somministrate":"administered_doses","dosi_consegnate":"delivered_doses","percentuale_somministrazione":"administration_percent","ultimo_aggiornamento":"last_update","codice_NUTS1":"NUTS1_code","codice_NUTS2":"NUTS2_code","codice_regione_ISTAT":"ISTAT_region_code","nome_area":"region"}, inplace=True)
-        # dates in column last_update must be parsed into datetime objects
-        data["last_update"] = pd.to_datetime(data["last_update"])
-        # for proper indexing
-        data.sort_values(by="ISTAT_region_code", inplace=True)
-        # for proper ranging operations (i.e. data[x:y]). Ints have issues in this
-        data["ISTAT_region_code"] = data["ISTAT_region_code"].apply(str)
-        # for this dataset, this is the only reasonable choice, since ISTAT region codes are assigned from north to south, making a North-Centre-South distinction possible
-        data.set_index("ISTAT_region_code", inplace=True)
-        return data
-
-def get_national_trend(latest=False):
+    return icl_b._load("vaccine_general_summary", columns=columns, filters=filters)
+
+@icl_b._memoized
+def get_national_trend(latest=False, incremental=False, start=None, stop=None, columns=None, filters=None):
     """Returns DataFrame about COVID-19 pandemic situation in Italy.
     
     Parameters
     ----------
     latest : bool
         Option for returning data referred to the current day only (default is False)
+    incremental : bool
+        Option for keeping a local copy of the whole history in the snapshot directory and downloading only the days missing from it, instead of the whole history (default is False). It requires snapshots to be enabled (see set_snapshots) and is ignored when latest is True.
+    start : datetime or datetime-like formatted str or None
+        First date (index) of the data to return. As in DataFrame slicing, a str date covers the whole period it describes, e.g. "2021-06" the whole month of June 2021 (default is None, i.e. from the first date)
+    stop : datetime or datetime-like formatted str or None
+        Last date (index, included) of the data to return, as for start. The file being sorted by date, parsing stops as soon as it is passed, without downloading the rest of the file (default is None, i.e. up to the last date)
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("date", ">=", "2021-06-01"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
+    ItaCovidLibArgumentError
+        Raised when incremental is True and snapshots are not enabled, when columns or filters refer to columns which are not in the dataset, when filters are malformed, or when start or stop are not valid dates.
     
     Returns
     -------
@@ -525,7 +540,7 @@ def get_national_trend(latest=False):
     -----------------
     date : datetime (index)
         Date
-    country : str
+    country : category
         Country
     hospitalized_with_symptoms : int64
         Number of hospitalized individuals with COVID-19 symptoms
@@ -576,31 +591,28 @@ def get_national_trend(latest=False):
     --------
     tell_rt : returns the Rt index over time calculated from these data"""
     
-    if latest == False:
-        data = icl_b._get("https://raw.githubusercontent.com/pcm-dpc/COVID-19/master/dati-andamento-nazionale/dpc-covid19-ita-andamento-nazionale.csv")
-    elif latest == True:
-        data = icl_b._get("https://raw.githubusercontent.com/pcm-dpc/COVID-19/master/dati-andamento-nazionale/dpc-covid19-ita-andamento-nazionale-latest.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"data":"date","stato":"country","ricoverati_con_sintomi":"hospitalized_with_symptoms","terapia_intensiva":"intensive_care","totale_ospedalizzati":"hospitalized","isolamento_domiciliare":"isolation","totale_positivi":"cases","variazione_totale_positivi":"cases_variation","nuovi_positivi":"new_cases","dimessi_guariti":"recovered_released","deceduti":"deaths","casi_da_sospetto_diagnostico":"cases_from_clinical_suspects","casi_da_screening":"cases_from_screening","totale_casi":"cumulative_cases","tamponi":"swabs","casi_testati":"tested","note":"notes","ingressi_terapia_intensiva":"intensive_care_in","note_test":"test_notes","note_casi":"case_notes","totale_positivi_test_molecolare":"molecular_test_cases","totale_positivi_test_antigenico_rapido":"antigen_test_cases","tamponi_test_molecolare":"molecular_tests","tamponi_test_antigenico_rapido":"antigen_tests"}, inplace=True)
-        # dates in column date must be parsed into datetime objects
-        data["date"] = pd.to_datetime(data["date"])
-        data.set_index("date", inplace=True)
-        return data
+    return icl_b._load("national_trend", latest=latest, incremental=incremental, start=start, stop=stop, columns=columns, filters=filters)
 
 
-def get_equip_contracts():
+@icl_b._memoized
+def get_equip_contracts(columns=None, filters=None):
     """Returns data about COVID-19 pandemic equipment contracts for Italy.
     
     Parameters
     ----------
-    None
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("negotiation_date", ">=", "2021-06-01"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
     
+    ItaCovidLibArgumentError
+        Raised when columns or filters refer to columns which are not in the dataset, or filters are malformed.
+    
     Returns
     -------
     pandas.core.frame.DataFrame
@@ -661,31 +673,27 @@ def get_equip_contracts():
     --------
     get_equip_contracts_payments : data about payments for COVID-19 pandemic equipment"""
     
-    data = icl_b._get("https://raw.githubusercontent.com/pcm-dpc/COVID-19/master/dati-contratti-dpc-forniture/dpc-covid19-dati-contratti-dpc-forniture.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"fornitore":"manufacturer","stato_fornitore":"country","gruppo_articoli":"product_group","sottogruppo_articoli":"article_subgroup","categoria":"category","sottocategoria":"subcategory","tipologia_fornitura":"equipment_kind","fornitura":"equipment","protocollo_atto_negoziale":"negotiation_protocol","data_atto_negoziale":"negotiation_date","file_atto_negoziale":"negotiation_file","integrazione_rettifica":"errata","protocollo_integrazione_rettifica":"errata_protocol","data_integrazione_rettifica":"errata_date","file_integrazione_rettifica":"errata_file","tipologia_cig":"tender_id_type","cig":"tender_id","quantita":"quantity","prezzo_unitario":"unit_price","totale_articolo":"total_price","stato_contratto":"agreement_state","ceduti_commissario_straordinario":"ceded","note":"notes","data_aggiornamento":"update_date"}, inplace=True)
-        # dates in column negotiation_date must be parsed into datetime objects
-        data["negotiation_date"] = pd.to_datetime(data["negotiation_date"])
-        # dates in column update_date must be parsed into datetime objects
-        data["update_date"] = pd.to_datetime(data["update_date"])
-        # for proper indexing
-        data.sort_values(by="negotiation_date", inplace=True)
-        data.set_index("negotiation_date", inplace=True)
-        return data
+    return icl_b._load("equip_contracts", columns=columns, filters=filters)
 
-def get_equip_contracts_payments():
+@icl_b._memoized
+def get_equip_contracts_payments(columns=None, filters=None):
     """Returns data about payments for COVID-19 equipment in Italy, as established by contracts.
     
     Parameters
     ----------
-    None
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("update_date", ">=", "2021-06-01"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
     
+    ItaCovidLibArgumentError
+        Raised when columns or filters refer to columns which are not in the dataset, or filters are malformed.
+    
     Returns
     -------
     pandas.core.frame.DataFrame
@@ -716,27 +724,33 @@ def get_equip_contracts_payments():
     --------
     get_equip_contracts : data about COVID-19 equipment contracts"""
     
-    data = icl_b._get("https://raw.githubusercontent.com/pcm-dpc/COVID-19/master/dati-contratti-dpc-forniture/dpc-covid19-dati-pagamenti-contratti-dpc-forniture.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"protocollo_atto_negoziale":"negotiation_protocol","totale_fornitura":"total_equipment","totale_pagato":"total_paid","pagato_donazioni":"donations","pagato_altri_fondi":"other_funds","fondo_pagamento":"payment_fund","ceduti_commissario_straordinario":"ceded","note":"notes","data_aggiornamento":"update_date"}, inplace=True)
-        # dates in column update_date must be parsed into datetime objects
-        data["update_date"] = pd.to_datetime(data["update_date"])
-        data.set_index("negotiation_protocol", inplace=True)
-        return data
-
-def get_province_cases(latest=False):
+    return icl_b._load("equip_contracts_payments", columns=columns, filters=filters)
+
+@icl_b._memoized
+def get_province_cases(latest=False, incremental=False, start=None, stop=None, columns=None, filters=None):
     """Returns DataFrame about COVID-19 cases per province in Italy.
     
     Parameters
     ----------
     latest : bool
         Option for returning data referred to the current day only (default is False) 
+    incremental : bool
+        Option for keeping a local copy of the whole history in the snapshot directory and downloading only the days missing from it, instead of the whole history (default is False). It requires snapshots to be enabled (see set_snapshots) and is ignored when latest is True.
+    start : datetime or datetime-like formatted str or None
+        First date (index) of the data to return. As in DataFrame slicing, a str date covers the whole period it describes, e.g. "2021-06" the whole month of June 2021 (default is None, i.e. from the first date)
+    stop : datetime or datetime-like formatted str or None
+        Last date (index, included) of the data to return, as for start. The file being sorted by date, parsing stops as soon as it is passed, without downloading the rest of the file (default is None, i.e. up to the last date)
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("region", "==", "Lazio"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
+    ItaCovidLibArgumentError
+        Raised when incremental is True and snapshots are not enabled, when columns or filters refer to columns which are not in the dataset, when filters are malformed, or when start or stop are not valid dates.
     
     Returns
     -------
@@ -747,62 +761,65 @@ def get_province_cases(latest=False):
     -----------------
     date : datetime (index)
         Date
-    country : str
+    country : category
         Country
-    region_code : int64
+    region_code : int8
         Region code number
-    region : str
+    region : category
         Official region name
-    province_code : int64
+    province_code : int16
         Province code number
-    province : str
+    province : category
         Province
-    province_abbreviation : str
+    province_abbreviation : category
         Province two-letter abbreviation
     lat : float64
         Latitude
     long : float64
         Longitude
-    cumulative_cases : int64
+    cumulative_cases : int32
         Total number of COVID-19 cases since the beginning of the pandemic
     notes : str
         Notes
-    NUTS1_code : str
+    NUTS1_code : category
         European classification of territorial units NUTS: level NUTS1
-    NUTS2_code : str
+    NUTS2_code : category
         European classification of territorial units NUTS: level NUTS2
-    NUTS3_code : str
+    NUTS3_code : category
         European classification of territorial units NUTS: level NUTS3
     
     See Also
     --------
     get_region_cases : returns data referred to regions"""
     
-    if latest == False:
-        data = icl_b._get("https://raw.githubusercontent.com/pcm-dpc/COVID-19/master/dati-province/dpc-covid19-ita-province.csv")
-    elif latest == True:
-        data = icl_b._get("https://raw.githubusercontent.com/pcm-dpc/COVID-19/master/dati-province/dpc-covid19-ita-province-latest.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"data":"date","stato":"country","codice_regione":"region_code","denominazione_regione":"region","codice_provincia":"province_code","denominazione_provincia":"province","sigla_provincia":"province_abbreviation","lat":"lat","long":"long","totale_casi":"cumulative_cases","note":"notes","codice_nuts_1":"NUTS1_code","codice_nuts_2":"NUTS2_code","codice_nuts_3":"NUTS3_code"}, inplace=True)
-        # dates in column date must be parsed into datetime objects
-        data["date"] = pd.to_datetime(data["date"])
-        data.set_index("date", inplace=True)
-        return data
-    
+    return icl_b._load("province_cases", latest=latest, incremental=incremental, start=start, stop=stop, columns=columns, filters=filters)
 
-def get_region_cases(latest=False):
+
+@icl_b._memoized
+def get_region_cases(latest=False, incremental=False, start=None, stop=None, columns=None, filters=None):
     """Returns DataFrame about COVID-19 cases per region in Italy.
     
     Parameters
     ----------
     latest : bool
         Option for returning data referred to the current day only (default is False)
+    incremental : bool
+        Option for keeping a local copy of the whole history in the snapshot directory and downloading only the days missing from it, instead of the whole history (default is False). It requires snapshots to be enabled (see set_snapshots) and is ignored when latest is True.
+    start : datetime or datetime-like formatted str or None
+        First date (index) of the data to return. As in DataFrame slicing, a str date covers the whole period it describes, e.g. "2021-06" the whole month of June 2021 (default is None, i.e. from the first date)
+    stop : datetime or datetime-like formatted str or None
+        Last date (index, included) of the data to return, as for start. The file being sorted by date, parsing stops as soon as it is passed, without downloading the rest of the file (default is None, i.e. up to the last date)
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("region", "==", "Lazio"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
+    ItaCovidLibArgumentError
+        Raised when incremental is True and snapshots are not enabled, when columns or filters refer to columns which are not in the dataset, when filters are malformed, or when start or stop are not valid dates.
     
     Returns
     -------
@@ -813,41 +830,41 @@ def get_region_cases(latest=False):
     -----------------
     date : datetime (index)
         Date
-    country : str
+    country : category
         Country
-    region_code : int64
+    region_code : int8
         Region code number
-    region : str
+    region : category
         Official region name
     lat : float64
         Latitude
     long : float64
         Longitude
-    hospitalized_with_symptoms : int64
+    hospitalized_with_symptoms : int32
         Number of hospitalized individuals with COVID-19 symptoms
-    intensive_care : int64
+    intensive_care : int32
         Number of individuals in intensive care units
-    hospitalized : int64
+    hospitalized : int32
         Number of hospitalized individuals, either with symptoms or in intensive care unit
-    isolation : int64
+    isolation : int32
         Number of people placed into isolation
-    cases : int64
+    cases : int32
         Number of COVID-19 cases
-    cases_variation : int64
+    cases_variation : int32
         Variation in the number of COVID-19 cases with respect to the previous day
-    new_cases : int64
+    new_cases : int32
         Number of new individuals diagnosed with COVID-19
-    recovered_released : int64
+    recovered_released : int32
         Number of individuals released from hospital after recovery
-    deaths : int64
+    deaths : int32
         Number of dead individuals following COVID-19 infection
     cases_from_clinical_suspects : float64
         Number of positive cases found after report of COVID-19-like symptoms
     cases_from_screening : float64
         Number of positive cases found after screening (e.g. close contacts of a positive case)
-    cumulative_cases : int64
+    cumulative_cases : int32
         Total number of COVID-19 cases since the beginning of the pandemic
-    swabs : int64
+    swabs : int32
         Number of swabs performed
     tested : float64
         Number of tested individuals
@@ -867,39 +884,36 @@ def get_region_cases(latest=False):
         Total number of molecular tests performed
     antigen_tests : float64
         Total number of antigen (so-called rapid) tests performed
-    NUTS1_code : str
+    NUTS1_code : category
         European classification of territorial units NUTS: level NUTS1
-    NUTS2_code : str
+    NUTS2_code : category
         European classification of territorial units NUTS: level NUTS2
     
     See Also
     --------
     get_province_cases : returns data referred to provinces"""
     
-    if latest == False:
-        data = icl_b._get("https://raw.githubusercontent.com/pcm-dpc/COVID-19/master/dati-regioni/dpc-covid19-ita-regioni.csv")
-    elif latest == True:
-        data = icl_b._get("https://raw.githubusercontent.com/pcm-dpc/COVID-19/master/dati-regioni/dpc-covid19-ita-regioni-latest.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"data":"date","stato":"country","codice_regione":"region_code","denominazione_regione":"region","ricoverati_con_sintomi":"hospitalized_with_symptoms","terapia_intensiva":"intensive_care","totale_ospedalizzati":"hospitalized","isolamento_domiciliare":"isolation","totale_positivi":"cases","variazione_totale_positivi":"cases_variation","nuovi_positivi":"new_cases","dimessi_guariti":"recovered_released","deceduti":"deaths","casi_da_sospetto_diagnostico":"cases_from_clinical_suspects","casi_da_screening":"cases_from_screening","totale_casi":"cumulative_cases","tamponi":"swabs","casi_testati":"tested","note":"notes","ingressi_terapia_intensiva":"intensive_care_in","note_test":"test_notes","note_casi":"case_notes","totale_positivi_test_molecolare":"molecular_test_cases","totale_positivi_test_antigenico_rapido":"antigen_test_cases","tamponi_test_molecolare":"molecular_tests","tamponi_test_antigenico_rapido":"antigen_tests","codice_nuts_1":"NUTS1_code","codice_nuts_2":"NUTS2_code"}, inplace=True)
-        # dates in column date must be parsed into datetime objects
-        data["date"] = pd.to_datetime(data["date"])
-        data.set_index("date", inplace=True)
-        return data
-
-def get_over_80():
+    return icl_b._load("region_cases", latest=latest, incremental=incremental, start=start, stop=stop, columns=columns, filters=filters)
+
+@icl_b._memoized
+def get_over_80(columns=None, filters=None):
     """Returns data on over 80 individuals in Italy
     
     Parameters
     ----------
-    None
+    columns : list of str or None
+        Columns to return (see DataFrame Columns below), the index being always returned. The other ones are not parsed at all (default is None, i.e. all columns)
+    filters : list of tuple or None
+        Conditions rows must meet to be returned, as (column, operator, value) triples, e.g. ("region", "==", "Lazio"). Operators are "==", "!=", "<", "<=", ">", ">=" (not for category columns) and "in" (with a list of accepted values), and any column (see DataFrame Columns below) can be used, also the index. Rows are filtered while being parsed, so that the other ones are never held in memory all together (default is None, i.e. all rows)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
     
+    ItaCovidLibArgumentError
+        Raised when columns or filters refer to columns which are not in the dataset, or filters are malformed.
+    
     Returns
     -------
     pandas.core.frame.DataFrame
@@ -926,18 +940,9 @@ def get_over_80():
     total : int64
         Total number of over 80 individuals"""
     
-    data = icl_b._get("https://raw.githubusercontent.com/pcm-dpc/COVID-19/master/dati-statistici-riferimento/popolazione-over80.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"codice_regione":"region_code","codice_nuts_1":"NUTS1_code","descrizione_nuts_1":"NUTS1_description","codice_nuts_2":"NUTS2_code","denominazione_regione":"region","range_eta":"age_range","totale_genere_maschile":"males","totale_genere_femminile":"females","totale_generale":"total"}, inplace=True)
-        # for proper indexing
-        data.sort_values(by="region_code", inplace=True)
-        # for proper ranging operations (i.e. data[x:y]). Ints have issues in this
-        data["region_code"] = data["region_code"].apply(str)
-        # for this dataset, this is the only reasonable choice, since ISTAT region codes are assigned from north to south, making a North-Centre-South distinction possible
-        data.set_index("region_code", inplace=True)
-        return data
+    return icl_b._load("over_80", columns=columns, filters=filters)
 
+@icl_b._memoized
 def get_istat_region_data(index="region_code"):
     """Returns data about Italian regions from ISTAT (Italian National Institute of Statistics).
     
@@ -986,27 +991,23 @@ def get_istat_region_data(index="region_code"):
     total : int64
         Total number of individuals"""
     
-    data = icl_b._get("https://raw.githubusercontent.com/pcm-dpc/COVID-19/master/dati-statistici-riferimento/popolazione-istat-regione-range.csv")
-    if data is not None:
-        # column names must be translated from Italian
-        data.rename(columns={"codice_regione":"region_code","codice_nuts_1":"NUTS1_code","descrizione_nuts_1":"NUTS1_description","codice_nuts_2":"NUTS2_code","denominazione_regione":"region","sigla_regione":"region_abbreviation","latitudine_regione":"lat","longitudine_regione":"long","range_eta":"age_range","totale_genere_maschile":"males","totale_genere_femminile":"females","totale_generale":"total"}, inplace=True)
-        # solves an issue with Trentino and South Tyrol region codes
-        data["region_code"].replace({21:4, 22:4}, inplace=True)
-        # there are two reasonable choices for this dataset DataFrame index. The user is let choose one of them.
-        if index=="r" or index=="region" or index=="region_code":
-            # for proper indexing
-            data.sort_values(by="region_code", inplace=True)
-            # for proper ranging operations (i.e. data[x:y]). Ints have issues in this
-            data["region_code"] = data["region_code"].apply(str)
-            data.set_index("region_code", inplace=True)
-        elif index=="a" or index=="age" or index=="age_range":
-            data["region_code"] = data["region_code"].apply(str)
-            # for proper indexing
-            data.sort_values(by="age_range", inplace=True)
-            data.set_index("age_range", inplace=True)
-        else:
-            raise icl_e.ItaCovidLibArgumentError("invalid option for index. Please see documentation for help on possible options.")
-        return data
+    data = icl_b._load("istat_region_data", index=False)
+    # solves an issue with Trentino and South Tyrol region codes
+    data["region_code"] = data["region_code"].replace({21:4, 22:4})
+    # there are two reasonable choices for this dataset DataFrame index. The user is let choose one of them.
+    if index=="r" or index=="region" or index=="region_code":
+        data = icl_b._index_by_code(data, "region_code")
+    elif index=="a" or index=="age" or index=="age_range":
+        data["region_code"] = icl_b._normalize_codes(data["region_code"])
+        # for proper indexing
+        data.sort_values(by="age_range", inplace=True)
+        data.set_index("age_range", inplace=True)
+    else:
+        raise icl_e.ItaCovidLibArgumentError("invalid option for index. Please see documentation for help on possible options.")
+    return data
+
+# all get_<resource_name> functions, by name
+_GETTERS = {name:function for name, function in list(globals().items()) if name.startswith("get_") and callable(function)}
 
 def tell_total_administered_doses():
     """Returns the amount of all administered doses ever.
@@ -1034,7 +1035,7 @@ def tell_total_administered_doses():
         # get_vaccine_general_summary_latest also returns a column administered_doses, with the amount of all doses ever administered per region. Sum is performed on all regional values.
         return int(data["administered_doses"].sum())
 
-def tell_total_vaccinated(dose, option="n", start_date="2020", stop_date="2030"):
+def tell_total_vaccinated(dose, option="n", start_date="2020", stop_date="2030", by=None):
     """Depending on the str provided as dose:
     dose = "1": returns the number of individuals who have been injected at least one vaccine dose in Italy (independently of it being enough for vaccination cycle completion, as is the case with Janssen vaccine or for individuals with recent COVID-19 injection, for whom only one dose is required);
     dose = "2": returns the number of individuals who have completed the vaccination cycle in Italy (with double dose for Pfizer/BioNTech, Moderna and Vaxzevria (AstraZeneca), with single dose for Janssen, with single dose for individuals previously infected with SARS-CoV-2 between 3 and 6 months before vaccination);
@@ -1049,6 +1050,8 @@ def tell_total_vaccinated(dose, option="n", start_date="2020", stop_date="2030")
     option = "p" or "population": returns the requested number as a fraction of the whole Italian population;
     option = "e" or "eligible": (ONLY FOR dose = "extra"/"e"/"booster"/"b") returns the requested number as a fraction of eligible individuals for extra or booster dose.
     
+    If by is provided, the requested number is returned for each region, age group and/or manufacturer, and fractions refer to the population of the same region and/or age group. Population data per age group are only available for option = "o"/"over12". For the autonomous provinces of Bolzano and Trento, option = "p"/"population" refers to the population of the whole Trentino-Alto Adige region, since ISTAT data are not available separately.
+    
     Parameters
     ----------
     dose : str
@@ -1059,6 +1062,8 @@ def tell_total_vaccinated(dose, option="n", start_date="2020", stop_date="2030")
         Starting date of the period of interest (default is beginning of vaccination cycle).  
     stop_date : datetime or datetime-like formatted str
         Ending date of the period of interest (default is current day)
+    by : str, tuple or None
+        Grouping of results: "region", "age_group", "manufacturer" or a tuple of them (e.g. ("region", "age_group")). None returns a single national result (default is None)
     
     Raises
     ------
@@ -1078,9 +1083,14 @@ def tell_total_vaccinated(dose, option="n", start_date="2020", stop_date="2030")
     float64
         64-bit floating point (see above for its meaning, depending on dose code and option code).
     
+    IF by IS PROVIDED:
+    pandas.core.series.Series
+        Pandas Series with the same numbers per group, indexed by the columns in by.
+    
     See Also
     --------
-    get_vaccine_admin : full data about vaccine administration in Italy"""
+    get_vaccine_admin : full data about vaccine administration in Italy
+    vaccination_summary : returns all doses and options together"""
 
     # checks on options are performed first, otherwise get_vaccine_admin might run uselessly
     if option!="number" and option!="n" and option!="over12" and option!="o" and option!="population" and option!="p" and option!="eligible" and option!="e":
@@ -1090,58 +1100,164 @@ def tell_total_vaccinated(dose, option="n", start_date="2020", stop_date="2030")
     # option "eligible" is not available with dose options "1" and "2"
     elif (dose=="1" or dose=="2") and (option=="eligible" or option=="e"):
         raise icl_e.ItaCovidLibArgumentError("invalid option for option. Please see documentation for help on possible options.")
+    elif by is not None:
+        by = _grouping(by, ["region", "age_group", "manufacturer"])
+        # population data per age group are only available for the population aged over 12
+        if "age_group" in by and _OPTIONS[option] != "number" and _OPTIONS[option] != "over12":
+            raise icl_e.ItaCovidLibArgumentError("population data per age group are only available for option over12. Please see documentation for help on possible options.")
+        # only the columns needed by counts, groups and (for option population) ISTAT region codes are parsed, and only for the requested period
+        columns = [*_VACCINATION_COLUMNS, *by]+(["ISTAT_region_code"] if _OPTIONS[option] == "population" else [])
+        vaccine_admin = get_vaccine_admin(start=start_date, stop=stop_date, columns=columns)
+        if vaccine_admin is not None:
+            # all groups are counted together with a single grouped sum
+            vaccinated = _vaccination_counts_by(vaccine_admin, by)[_DOSES[dose]]
+            vaccinated.name = _OPTIONS[option]
+            if _OPTIONS[option] == "number":
+                return vaccinated
+            return _divide_by_groups(vaccinated, _vaccination_denominators_by(_OPTIONS[option], _DOSES[dose], [key for key in by if key != "manufacturer"], vaccine_admin))
     else:
         # default parameters for start_date and stop_date are respectively "2020" and "2030": this since syntax necessarily requires such default arguments. "2020" covers everything since the beginning, while "2030" covers all future runs of this software (hoping the pandemic ends much earlier!).
-        vaccine_admin = get_vaccine_admin()[start_date:stop_date]
-        if vaccine_admin is not None:
-            if dose == "1":
-                # Previously infected individuals data are also added, since the DataFrame returned by get_vaccine_admin keeps them separate from first doses count
-                vaccinated = vaccine_admin.sum()["first_dose"]+vaccine_admin.sum()["previously_infected"]
-                if option=="number" or option=="n":
-                    return vaccinated
-                elif option=="over12" or option=="o":
-                    total_over_12 = get_eligible().sum()["population"]
-                    return vaccinated/total_over_12
-                elif option=="population" or option=="p":
-                    total_population = get_istat_region_data().sum()["total"]
-                    return vaccinated/total_population
-            elif dose == "2":
-                # For vaccines requiring two doses data on second doses are taken, for vaccines requiring one single dose data on first doses are taken, for all vaccines data on previously infected individuals, completing the vaccination cycle with one single dose, are also taken, since their data are kept separate from first and second doses data
-                vaccinated = vaccine_admin[vaccine_admin["manufacturer"]!="Janssen"].sum()["second_dose"]+vaccine_admin[vaccine_admin["manufacturer"]=="Janssen"].sum()["first_dose"]+vaccine_admin.sum()["previously_infected"]
-                if option=="number" or option=="n":
-                    return vaccinated
-                elif option=="over12" or option=="o":
-                    total_over_12 = get_eligible().sum()["population"]
-                    return vaccinated/total_over_12
-                elif option=="population" or option=="p":
-                    total_population = get_istat_region_data().sum()["total"]
-                    return vaccinated/total_population
-            elif dose == "extra" or dose == "e":
-                vaccinated = vaccine_admin.sum()["extra_dose"]
-                if option=="number" or option=="n":
-                    return vaccinated
-                elif option=="over12" or option=="o":
-                    total_over_12 = get_eligible().sum()["population"]
-                    return vaccinated/total_over_12
-                elif option=="population" or option=="p":
-                    total_population = get_istat_region_data().sum()["total"]
-                    return vaccinated/total_population
-                elif option=="eligible" or option=="e":
-                    total_eligible = get_extra_dose_eligible().sum()["population"]
-                    return vaccinated/total_eligible
-            elif dose == "booster" or dose == "b":
-                vaccinated = vaccine_admin.sum()["booster_dose"]
-                if option=="number" or option=="n":
-                    return vaccinated
-                elif option=="over12" or option=="o":
-                    total_over_12 = get_eligible().sum()["population"]
-                    return vaccinated/total_over_12
-                elif option=="population" or option=="p":
-                    total_population = get_istat_region_data().sum()["total"]
-                    return vaccinated/total_population
-                elif option=="eligible" or option=="e":
-                    total_eligible = get_booster_dose_eligible().sum()["population"]
-                    return vaccinated/total_eligible
+        sums = vaccine_admin_sums()
+        if sums is not None:
+            # all doses are counted together from the prefix sums of administrations, then only the requested denominator is downloaded
+            vaccinated = _vaccination_counts(sums, start_date, stop_date)[_DOSES[dose]]
+            if _OPTIONS[option] == "number":
+                return vaccinated
+            return vaccinated/_vaccination_denominator(_OPTIONS[option], _DOSES[dose])
+
+# columns of the DataFrame returned by get_vaccine_admin needed to count vaccinated individuals
+_VACCINATION_COLUMNS = ["manufacturer", "first_dose", "second_dose", "previously_infected", "extra_dose", "booster_dose"]
+
+# dose and option codes accepted by tell_total_vaccinated, with the corresponding labels of vaccination_summary
+_DOSES = {"1":"1", "2":"2", "extra":"extra", "e":"extra", "booster":"booster", "b":"booster"}
+_OPTIONS = {"number":"number", "n":"number", "over12":"over12", "o":"over12", "population":"population", "p":"population", "eligible":"eligible", "e":"eligible"}
+
+def _vaccination_counts(sums, start_date="2020", stop_date="2030"):
+    """Returns a Series with the number of vaccinated individuals per dose ("1", "2", "extra", "booster") between start_date and stop_date, computed from the PrefixSumIndex returned by vaccine_admin_sums."""
+    
+    totals = sums.totals(start_date, stop_date)
+    # Janssen is the only single dose vaccine
+    janssen = sums.totals(start_date, stop_date, group="Janssen")
+    counts = pd.Series({
+        # previously infected individuals data are also added, since the DataFrame returned by get_vaccine_admin keeps them separate from first doses count
+        "1": totals["first_dose"]+totals["previously_infected"],
+        # for vaccines requiring two doses data on second doses are taken, for vaccines requiring one single dose data on first doses are taken, for all vaccines data on previously infected individuals, completing the vaccination cycle with one single dose, are also taken
+        "2": totals["second_dose"]-janssen["second_dose"]+janssen["first_dose"]+totals["previously_infected"],
+        "extra": totals["extra_dose"],
+        "booster": totals["booster_dose"],
+    }, dtype="int64")
+    counts.index.name = "dose"
+    return counts
+
+def _vaccination_denominator(option, dose=None):
+    """Returns the number of individuals against which vaccinated individuals are compared, for the options "over12", "population" and "eligible" (the last one for doses "extra" and "booster") of tell_total_vaccinated."""
+    
+    if option == "over12":
+        return get_eligible()["population"].sum()
+    elif option == "population":
+        return get_istat_region_data()["total"].sum()
+    elif dose == "extra":
+        return get_extra_dose_eligible()["population"].sum()
+    elif dose == "booster":
+        return get_booster_dose_eligible()["population"].sum()
+
+def _grouping(by, accepted):
+    """Returns by, the grouping option of tell_ functions, as a list of column names, checking that they are among the accepted ones."""
+    
+    by = [by] if isinstance(by, str) else list(by)
+    if len(by) == 0 or len(set(by)) != len(by) or any(key not in accepted for key in by):
+        raise icl_e.ItaCovidLibArgumentError("invalid option for by. Accepted groupings are "+", ".join('"{}"'.format(key) for key in accepted)+" or tuples of them.")
+    return by
+
+def _vaccination_counts_by(vaccine_admin, by):
+    """Returns a DataFrame with the number of vaccinated individuals per dose (columns "1", "2", "extra", "booster") per group of the columns in by, computed from (a slice of) the DataFrame returned by get_vaccine_admin with a single grouped sum."""
+    
+    janssen = (vaccine_admin["manufacturer"]=="Janssen").to_numpy()
+    first_dose = vaccine_admin["first_dose"].to_numpy(dtype="int64")
+    previously_infected = vaccine_admin["previously_infected"].to_numpy(dtype="int64")
+    # the contribution of each row to each dose count follows the same rules of _vaccination_counts: for Janssen, the only single dose vaccine, first doses complete the vaccination cycle
+    doses = pd.DataFrame({
+        "1": first_dose+previously_infected,
+        "2": np.where(janssen, first_dose, vaccine_admin["second_dose"].to_numpy(dtype="int64"))+previously_infected,
+        "extra": vaccine_admin["extra_dose"].to_numpy(dtype="int64"),
+        "booster": vaccine_admin["booster_dose"].to_numpy(dtype="int64"),
+    })
+    return doses.groupby([vaccine_admin[key].to_numpy() for key in by], observed=True).sum().rename_axis(by)
+
+def _vaccination_denominators_by(option, dose, keys, vaccine_admin):
+    """Returns the number of individuals against which vaccinated individuals are compared, for the options "over12", "population" and "eligible" of tell_total_vaccinated, as a Series indexed by the columns in keys ("region" and/or "age_group"), or as a single number if keys is empty."""
+    
+    if len(keys) == 0:
+        return _vaccination_denominator(option, dose)
+    if option == "over12":
+        eligible = get_eligible().reset_index()
+        return eligible.groupby(keys, observed=True)["population"].sum()
+    elif option == "population":
+        # ISTAT data are matched through ISTAT region codes, since region names differ from the ones of vaccination data
+        population = get_istat_region_data()["total"].groupby(level=0).sum()
+        codes = vaccine_admin.groupby("region", observed=True)["ISTAT_region_code"].first()
+        return pd.Series(population.reindex(codes.astype(str)).to_numpy(), index=codes.index)
+    elif dose == "extra":
+        return get_extra_dose_eligible().groupby("region", observed=True)["population"].sum()
+    elif dose == "booster":
+        return get_booster_dose_eligible().groupby("region", observed=True)["population"].sum()
+
+def _divide_by_groups(numbers, denominators):
+    """Divides numbers, a Series indexed by groups, by the denominators of the matching groups (a Series indexed by some of the same columns, or a single number). Groups without denominators result in NaN."""
+    
+    if not isinstance(denominators, pd.Series):
+        return numbers/denominators
+    # levels of numbers absent from denominators (e.g. manufacturer) share the denominators of the other levels
+    keys = numbers.index.droplevel([name for name in numbers.index.names if name not in denominators.index.names]) if numbers.index.nlevels > 1 else numbers.index
+    if isinstance(keys, pd.MultiIndex):
+        keys = keys.reorder_levels(denominators.index.names)
+    return numbers/denominators.reindex(keys).to_numpy(dtype="float64")
+
+def vaccination_summary(start_date="2020", stop_date="2030"):
+    """Returns a DataFrame with the number of individuals who have been injected each vaccine dose in Italy between start_date and stop_date, also as fractions of the population aged over 12, of the whole population and of eligible individuals.
+    
+    All numbers are computed together from the prefix sums of vaccine administrations data (see vaccine_admin_sums). Numbers and their meaning are the same as the ones returned by tell_total_vaccinated, with doses and options as row and column labels respectively.
+    
+    Parameters
+    ----------
+    start_date : datetime or datetime-like formatted str
+        Starting date of the period of interest (default is beginning of vaccination cycle).
+    stop_date : datetime or datetime-like formatted str
+        Ending date of the period of interest (default is current day)
+    
+    Raises
+    ------
+    ItaCovidLibConnectionError
+        Raised when there are issues with Internet connection.
+    
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        Pandas DataFrame with one row per dose
+    
+    DataFrame Columns
+    -----------------
+    dose : str (index)
+        Dose: "1" (at least one dose), "2" (completed vaccination cycle), "extra" or "booster"
+    number : int64
+        Number of individuals who have been injected the dose
+    over12 : float64
+        Number of individuals who have been injected the dose as a fraction of the population aged over 12
+    population : float64
+        Number of individuals who have been injected the dose as a fraction of the whole population
+    eligible : float64
+        Number of individuals who have been injected the dose as a fraction of the individuals eligible for it (only for doses "extra" and "booster", NaN otherwise)
+    
+    See Also
+    --------
+    tell_total_vaccinated : returns a single number of this DataFrame"""
+    
+    sums = vaccine_admin_sums()
+    if sums is not None:
+        counts = _vaccination_counts(sums, start_date, stop_date)
+        eligible = pd.Series({"extra":_vaccination_denominator("eligible", "extra"), "booster":_vaccination_denominator("eligible", "booster")})
+        summary = pd.DataFrame({"number":counts, "over12":counts/_vaccination_denominator("over12"), "population":counts/_vaccination_denominator("population"), "eligible":counts/eligible.reindex(counts.index)})
+        return summary
 
 def tell_total_admin_points():
     """Returns the number of all vaccine administration points in Italy.
@@ -1170,7 +1286,7 @@ def tell_total_admin_points():
     if data is not None:
         return len(data.index)
 
-def tell_manufacturer_delivered_doses(manufacturer="all", start_date="2020", stop_date="2030"):
+def tell_manufacturer_delivered_doses(manufacturer="all", start_date="2020", stop_date="2030", by=None):
     """Returns the number of delivered vaccine doses from the manufacturer given as a parameter in Italy. If string "all" or no string is provided as parameter, it returns the number of delivered vaccine doses from all manufacturers.
     
     Numbers refer to the period between start_date and stop_date. If start_date and stop_date are not specified, returned numbers refer to all time.
@@ -1183,6 +1299,8 @@ def tell_manufacturer_delivered_doses(manufacturer="all", start_date="2020", sto
         Starting date of the period of interest (default is beginning of vaccination cycle).
     stop_date : datetime or datetime-like formatted str
         Ending date of the period of interest (default is current day).
+    by : str, tuple or None
+        Grouping of results: "region", "manufacturer" or a tuple of them. None returns a single national number (default is None)
 
     Raises
     ------
@@ -1197,24 +1315,175 @@ def tell_manufacturer_delivered_doses(manufacturer="all", start_date="2020", sto
     int64
         Number of delivered vaccine doses from chosen manufacturer or all manufacturers, according to parameter "manufacturer"
     
+    IF by IS PROVIDED:
+    pandas.core.series.Series
+        Pandas Series with the same numbers per group, indexed by the columns in by.
+    
     See Also
     --------
     get_vaccine_deliveries : full data about vaccine deliveries per manufacturer"""
 
-    # get_vaccine_deliveries returns all delivered doses per day and per manufacturer in a DataFrame. A sum must be performed over days for the chosen manufacturer. np.int64() to avoid a numpy.float64 obj being produced in case of null result. If str "all" is provided, the function returns all delivered doses for all manufacturers.
+    # vaccine_deliveries_sums returns the prefix sums of delivered doses per manufacturer, from which the doses delivered in any period are found without summing over days. np.int64() for consistency with numpy integers returned for single manufacturers. If str "all" is provided, the function returns all delivered doses for all manufacturers.
     # default parameters for start_date and stop_date are respectively "2020" and "2030": this since syntax necessarily requires such default arguments. "2020" covers everything since the beginning, while "2030" covers all future runs of this software (hoping the pandemic ends much earlier!).
-    data = get_vaccine_deliveries()[start_date:stop_date]
-    if data is not None:
+    if by is not None:
+        by = _grouping(by, ["region", "manufacturer"])
+        if manufacturer!="all" and manufacturer!="Pfizer/BioNTech" and manufacturer!="Moderna" and manufacturer!="Vaxzevria (AstraZeneca)" and manufacturer!="Janssen":
+            raise icl_e.ItaCovidLibArgumentError('no vaccine manufacturer recognized with name "{}". Only accepted names and spellings are "Pfizer/BioNTech", "Moderna", "Vaxzevria (AstraZeneca)" and "Janssen".'.format(manufacturer))
+        # only deliveries of the requested period and manufacturer are kept while parsing
+        filters = None if manufacturer=="all" else [("manufacturer", "==", manufacturer)]
+        data = get_vaccine_deliveries(start=start_date, stop=stop_date, columns=["manufacturer", "number_of_doses", *by], filters=filters)
+        if data is not None:
+            # all groups are counted together with a single grouped sum
+            delivered_doses = data["number_of_doses"].astype("int64").groupby([data[key].to_numpy() for key in by], observed=True).sum().rename_axis(by)
+            return delivered_doses
+    sums = vaccine_deliveries_sums()
+    if sums is not None:
         if manufacturer=="all":
-            all_delivered_doses = np.int64(data.sum()["number_of_doses"])
+            all_delivered_doses = np.int64(sums.total("number_of_doses", start_date, stop_date))
             return all_delivered_doses
         elif manufacturer=="Pfizer/BioNTech" or manufacturer=="Moderna" or manufacturer=="Vaxzevria (AstraZeneca)" or manufacturer=="Janssen":
-            manufacturer_delivered_doses = np.int64(data[data["manufacturer"]==manufacturer].sum()["number_of_doses"])
+            manufacturer_delivered_doses = np.int64(sums.total("number_of_doses", start_date, stop_date, group=manufacturer))
             return manufacturer_delivered_doses
         else:
             raise icl_e.ItaCovidLibArgumentError('no vaccine manufacturer recognized with name "{}". Only accepted names and spellings are "Pfizer/BioNTech", "Moderna", "Vaxzevria (AstraZeneca)" and "Janssen".'.format(manufacturer))
 
-def prepare_for_plotting_on_map(source, on):
+class PrefixSumIndex:
+    """Cumulative sums of the numeric columns of a DataFrame indexed by date, overall and per group (e.g. per manufacturer), answering the total of any column over any date range with two binary searches instead of a sum over all rows in the range.
+    
+    Date ranges follow the rules of date slicing of pandas DataFrames: both ends are included, and dates given as str cover the whole period they describe (e.g. "2021" covers the whole year, "2021-06-30" the whole day).
+    
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+        Pandas DataFrame indexed by date, not necessarily sorted.
+    columns : list
+        Names of the numeric columns to sum.
+    by : str or None
+        Name of the column whose values define groups, which can then be queried separately. None allows only overall totals (default is None)
+    
+    See Also
+    --------
+    vaccine_admin_sums : returns the PrefixSumIndex of vaccine administrations
+    vaccine_deliveries_sums : returns the PrefixSumIndex of vaccine deliveries"""
+    
+    def __init__(self, data, columns, by=None):
+        self.columns = list(columns)
+        # stable sorting keeps the original order of rows sharing the same date
+        data = data.sort_index(kind="stable")
+        self._sums = {None: self._prefix_sums(data)}
+        if by is not None:
+            for group, rows in data.groupby(by, sort=False, observed=True):
+                self._sums[group] = self._prefix_sums(rows)
+    
+    def _prefix_sums(self, data):
+        """Returns the dates of data and the cumulative sums of its columns, with a leading row of zeros, so that the total of rows i to j-1 is the difference between rows j and i."""
+        
+        cumulative = np.zeros((len(data.index)+1, len(self.columns)), dtype="int64")
+        np.cumsum(data[self.columns].to_numpy(dtype="int64"), axis=0, out=cumulative[1:])
+        return data.index.to_numpy(dtype="datetime64[ns]"), cumulative
+    
+    @property
+    def groups(self):
+        """List of the groups which can be queried."""
+        
+        return [group for group in self._sums if group is not None]
+    
+    def _difference(self, start_date, stop_date, group):
+        """Returns a numpy array with the totals of all columns between start_date and stop_date (both included), overall or for group only, or None for groups without data."""
+        
+        if group not in self._sums:
+            return None
+        dates, cumulative = self._sums[group]
+        start, stop = _date_bounds(start_date, stop_date)
+        # None bounds, as in DataFrame slicing, cover all dates
+        start = 0 if start is None else np.searchsorted(dates, start, side="left")
+        stop = len(dates) if stop is None else np.searchsorted(dates, stop, side="left")
+        return cumulative[max(start, stop)]-cumulative[start]
+    
+    def totals(self, start_date="2020", stop_date="2030", group=None):
+        """Returns a Series with the totals of all columns between start_date and stop_date (both included), overall or for group only (0 for groups without data)."""
+        
+        difference = self._difference(start_date, stop_date, group)
+        return pd.Series(0 if difference is None else difference, index=self.columns, dtype="int64")
+    
+    def total(self, column, start_date="2020", stop_date="2030", group=None):
+        """Returns the total of column between start_date and stop_date (both included), overall or for group only (0 for groups without data)."""
+        
+        difference = self._difference(start_date, stop_date, group)
+        return np.int64(0) if difference is None else difference[self.columns.index(column)]
+
+def _date_bounds(start_date, stop_date):
+    """Returns the first instant of start_date and the first instant after stop_date as numpy datetime64 objects (None for None), with the rules of date slicing of pandas DataFrames: a str date covers the whole period it describes (e.g. the whole day), other dates are exact. Raises ItaCovidLibArgumentError if they are not valid dates."""
+    
+    try:
+        return _parsed_date_bounds(start_date, stop_date)
+    # unhashable dates are rejected by the cache with a TypeError as well
+    except (ValueError, TypeError):
+        raise icl_e.ItaCovidLibArgumentError("invalid start_date or stop_date. Please provide dates or datetime-like formatted str.") from None
+
+@functools.lru_cache(maxsize=1024)
+def _parsed_date_bounds(start_date, stop_date):
+    """Returns the bounds of _date_bounds, parsed once per pair of dates."""
+    
+    return tuple(None if bound is None else bound.to_datetime64().astype("datetime64[ns]") for bound in icl_b._period_bounds(start_date, stop_date))
+
+@icl_b._memoized
+def vaccine_admin_sums():
+    """Returns the prefix sums of vaccine administrations in Italy, overall and per manufacturer, for fast totals over any period.
+    
+    They are built from the DataFrame returned by get_vaccine_admin once per download and kept as long as downloaded data (see set_cache).
+    
+    Parameters
+    ----------
+    None
+    
+    Raises
+    ------
+    ItaCovidLibConnectionError
+        Raised when there are issues with Internet connection.
+    
+    Returns
+    -------
+    PrefixSumIndex
+        Prefix sums of columns first_dose, second_dose, previously_infected, extra_dose and booster_dose, with groups given by manufacturer.
+    
+    See Also
+    --------
+    tell_total_vaccinated : uses these prefix sums"""
+    
+    data = get_vaccine_admin(columns=_VACCINATION_COLUMNS)
+    if data is not None:
+        return PrefixSumIndex(data, _VACCINATION_COLUMNS[1:], by="manufacturer")
+
+@icl_b._memoized
+def vaccine_deliveries_sums():
+    """Returns the prefix sums of vaccine deliveries in Italy, overall and per manufacturer, for fast totals over any period.
+    
+    They are built from the DataFrame returned by get_vaccine_deliveries once per download and kept as long as downloaded data (see set_cache).
+    
+    Parameters
+    ----------
+    None
+    
+    Raises
+    ------
+    ItaCovidLibConnectionError
+        Raised when there are issues with Internet connection.
+    
+    Returns
+    -------
+    PrefixSumIndex
+        Prefix sums of column number_of_doses, with groups given by manufacturer.
+    
+    See Also
+    --------
+    tell_manufacturer_delivered_doses : uses these prefix sums"""
+    
+    data = get_vaccine_deliveries()
+    if data is not None:
+        return PrefixSumIndex(data, ["number_of_doses"], by="manufacturer")
+
+def prepare_for_plotting_on_map(source, on, tolerance=None, join="merge"):
     """Makes any Italian COVID Library generated DataFrame with geographical data compatible with geopandas, for subsequent plotting on a map with Italian regions or provinces (depending on the option "on" specified).
     
     Parameters
@@ -1223,6 +1492,10 @@ def prepare_for_plotting_on_map(source, on):
         Pandas DataFrame, with the data to plot, to make compatible with geopandas. Only Italian COVID Library generated DataFrames with geographical data compatible with the option "on" provided are guaranteed to work.
     on : str
         Option for choosing local subdivisions for plotting: regions (options "region", "regions" or "r") or provinces (options "province", "provinces" or "p")
+    tolerance : float or None
+        Tolerance, in degrees, for simplifying borders (e.g. 0.01), which makes plotting faster. None keeps the original borders (default is None)
+    join : str
+        Option for attaching borders to source: "merge" merges source with borders, returning a DataFrame with a new index; "index" looks up the border of each row, keeping the index and order of source (e.g. dates for time series) without copying its data, which is faster and lighter for large DataFrames (default is "merge")
     
     Raises
     ------
@@ -1232,6 +1505,9 @@ def prepare_for_plotting_on_map(source, on):
     ItaCovidLibArgumentError
         Raised when improper arguments are passed to the function.
     
+    ImportError
+        Raised when geopandas, required for maps, is not installed.
+    
     Returns
     -------
     geopandas.geodataframe.GeoDataFrame
@@ -1240,22 +1516,27 @@ def prepare_for_plotting_on_map(source, on):
     See Also
     --------
     plot_on_map : plots directly the DataFrame given as an argument on a map with Italian regions or provinces. Use this function to instantly have the plot, with the possibility of basic customization. Use prepare_for_plotting_on_map if you need the full customization and editing potential of GeoPandas."""
+    if join != "merge" and join != "index":
+        raise icl_e.ItaCovidLibArgumentError("invalid option join. Please see documentation for help on possible options.")
+    gpd = icl_b._import_optional("geopandas", "maps", "maps")
     if on=="region" or on=="regions" or on=="r":
-        # file contains Italian regions with their borders
-        italy_with_subdivisions = gpd.read_file(str(os.path.join(os.path.dirname(__file__), "regions_map.geojson")))
+        # Italian regions with their borders, read only once
+        italy_with_subdivisions = icl_b._load_geometries("region", tolerance)
         try:
             # in this way, input DataFrame includes regional borders
+            if join == "index":
+                return icl_b._join_geometries(source, italy_with_subdivisions, "region")
             source_with_geometry = gpd.GeoDataFrame(pd.merge(source, italy_with_subdivisions, on="region", how="inner"))
             return source_with_geometry
         except KeyError:
             raise icl_e.ItaCovidLibKeyError("could not convert source object into GeoDataFrame with regions.") from None
     elif on=="province" or on=="provinces" or on=="p":
-        # file contains Italian provinces with their borders
-        italy_with_subdivisions = gpd.read_file(str(os.path.join(os.path.dirname(__file__), "provinces_map.geojson")))
-        # the following solves an issue with Sardinian provinces, which are not optimally described by the provinces file
-        italy_with_subdivisions = italy_with_subdivisions.dissolve(by="province")
+        # Italian provinces with their borders, read and dissolved only once
+        italy_with_subdivisions = icl_b._load_geometries("province", tolerance)
         try:
             # in this way, input DataFrame includes province borders
+            if join == "index":
+                return icl_b._join_geometries(source, italy_with_subdivisions, "province")
             source_with_geometry = gpd.GeoDataFrame(pd.merge(source, italy_with_subdivisions, on="province", how="inner"))
             return source_with_geometry
         except KeyError:
@@ -1263,7 +1544,7 @@ def prepare_for_plotting_on_map(source, on):
     else:
         raise icl_e.ItaCovidLibArgumentError("invalid option on. Please see documentation for help on possible options.")
 
-def plot_on_map(source, on, column, title="", legend=True, cmap="Reds"):
+def plot_on_map(source, on, column, title="", legend=True, cmap="Reds", tolerance=None):
     """Plots data on a map of Italy with regions or provinces, depending on the option "on" specified.
     
     Parameters
@@ -1280,6 +1561,8 @@ def plot_on_map(source, on, column, title="", legend=True, cmap="Reds"):
         Displays or not a legend (default is True)
     cmap : str
         Code name of the color palette for plotting (for the list of codes please see matplotlib.org/stable/tutorials/colors/colormaps)(default is "Reds")
+    tolerance : float or None
+        Tolerance, in degrees, for simplifying borders (e.g. 0.01), which makes plotting faster. None keeps the original borders (default is None)
     
     Raises
     ------ 
@@ -1289,6 +1572,9 @@ def plot_on_map(source, on, column, title="", legend=True, cmap="Reds"):
     ItaCovidLibArgumentError
         Raised when improper arguments are passed to the function.
     
+    ImportError
+        Raised when geopandas or matplotlib, required for maps, are not installed.
+    
     Returns
     -------
     matplotlib.axes._subplots.AxesSubplot
@@ -1298,34 +1584,261 @@ def plot_on_map(source, on, column, title="", legend=True, cmap="Reds"):
     --------
     prepare_for_plotting_on_map: only turns the Pandas DataFrame given as an argument to a GeoPandas compatible GeoDataFrame, for subsequent plotting. Use this function if you need the full customization and editing potential of GeoPandas."""
     # with the following function, input DataFrame can be plotted on a map correctly
-    data_to_plot = prepare_for_plotting_on_map(source, on)
+    # geometries are looked up rather than merged, since plotting does not depend on the index
+    data_to_plot = prepare_for_plotting_on_map(source, on, tolerance, join="index")
     plot = data_to_plot.plot(column, legend=legend, cmap=cmap)
     # plot returned by plot function also includes anti-aesthetic latitude and longitude axes
     plot.set_axis_off()
     plot.set_title(title)
     return plot
 
-def tell_rt():
-    """Returns a DataFrame with Rt values over time in Italy.
+def render_time_lapse(source, on, column, output, by="date", title="", legend=True, cmap="Reds", vmin=None, vmax=None, tolerance=None, fps=4, dpi=100):
+    """Renders data on maps of Italy with regions or provinces, one map (frame) for each date, or for each value of the option "by" specified, for time-lapse plots.
+    
+    Borders are drawn only once, and each frame only updates the colors of subdivisions, with the same color scale for all frames. Frames are written as PNG images in a directory, or as a GIF or MP4 animation. No display is needed.
     
     Parameters
     ----------
-    None
+    source : pandas.core.frame.DataFrame
+        Pandas DataFrame with the data to plot, with one row per subdivision per frame (e.g. the one returned by get_region_cases). Only Italian COVID Library generated DataFrames with geographical data compatible with the option "on" provided are guaranteed to work.
+    on : str
+        Option for choosing local subdivisions for plotting: regions (options "region", "regions" or "r") or provinces (options "province", "provinces" or "p")
+    column : str
+        Name of the column with the data to plot
+    output : str
+        Path of the output: a .gif or .mp4 file for an animation (MP4 requires ffmpeg), a directory (created if missing) for PNG images named <column>_<frame label>.png otherwise
+    by : str
+        Name of the column or index level with the values defining frames, in ascending order. Dates are labelled as YYYY-MM-DD (default is "date")
+    title : str
+        Title to give all frames, followed by the label of each frame (default is a null title)
+    legend : bool
+        Displays or not a legend (default is True)
+    cmap : str
+        Code name of the color palette for plotting (for the list of codes please see matplotlib.org/stable/tutorials/colors/colormaps)(default is "Reds")
+    vmin : float or None
+        Value corresponding to the lowest color in all frames (default is the minimum of column)
+    vmax : float or None
+        Value corresponding to the highest color in all frames (default is the maximum of column)
+    tolerance : float or None
+        Tolerance, in degrees, for simplifying borders (e.g. 0.01), which makes rendering faster. None keeps the original borders (default is None)
+    fps : int or float
+        Frames per second of animations (default is 4)
+    dpi : int
+        Resolution of frames in dots per inch (default is 100)
+    
+    Raises
+    ------
+    ItaCovidLibKeyError
+        Raised when source lacks the "region" or "province" column with local subdivision data, column or by.
+    
+    ItaCovidLibArgumentError
+        Raised when improper arguments are passed to the function, when source has no rows to render (i.e. no frames), or when MP4 output is requested without ffmpeg.
+    
+    ImportError
+        Raised when geopandas or matplotlib, required for maps, are not installed.
+    
+    Returns
+    -------
+    list
+        Paths of the written files: PNG images, in frame order, or the animation.
+    
+    See Also
+    --------
+    plot_on_map : plots a single map"""
+    
+    subdivision = _subdivision(on)
+    if column not in source.columns or subdivision not in source.columns or (by not in source.columns and by not in source.index.names):
+        raise icl_e.ItaCovidLibKeyError("could not find columns "+subdivision+", "+str(column)+" and "+str(by)+" in source object.")
+    output = str(output)
+    extension = os.path.splitext(output)[1].lower()
+    icl_r = icl_b._import_optional("itacovidlib.rendering", "maps", "maps")
+    if extension == ".mp4" and not icl_r.matplotlib.animation.writers.is_available("ffmpeg"):
+        raise icl_e.ItaCovidLibArgumentError("MP4 output requires ffmpeg. Please install it or choose GIF output.")
+    frames = icl_r._frames(source, by)
+    # rows without a value of by belong to no frame
+    if not frames:
+        raise icl_e.ItaCovidLibArgumentError("no frames to render: source has no rows with a value of "+str(by)+".")
+    vmin, vmax = icl_r._color_limits(source[column], vmin, vmax)
+    renderer = icl_r._MapRenderer(icl_b._load_geometries(subdivision, tolerance), subdivision, vmin, vmax, title=title, legend=legend, cmap=cmap, dpi=dpi)
+    if extension == ".gif":
+        # frames are handed to the encoder one by one, as soon as they are drawn
+        def images():
+            for _, label, rows in frames[1:]:
+                renderer.draw(rows[subdivision], rows[column], label)
+                yield renderer.image()
+        _, label, rows = frames[0]
+        renderer.draw(rows[subdivision], rows[column], label)
+        renderer.image().save(output, save_all=True, append_images=images(), duration=1000/fps, loop=0)
+        return [output]
+    if extension == ".mp4":
+        writer = icl_r.matplotlib.animation.FFMpegWriter(fps=fps)
+        with writer.saving(renderer.figure, output, dpi):
+            for _, label, rows in frames:
+                renderer.draw(rows[subdivision], rows[column], label)
+                writer.grab_frame()
+        return [output]
+    os.makedirs(output, exist_ok=True)
+    paths = []
+    for _, label, rows in frames:
+        renderer.draw(rows[subdivision], rows[column], label)
+        paths.append(os.path.join(output, str(column)+"_"+label+".png"))
+        renderer.image().save(paths[-1])
+    return paths
+
+def render_maps(source, on, columns, output, by="date", title="", legend=True, cmap="Reds", vmin=None, vmax=None, tolerance=None, dpi=100, max_workers=None):
+    """Renders data on maps of Italy with regions or provinces, one map for each date (or for each value of the option "by" specified) and for each of the columns specified, in parallel across a pool of processes.
+    
+    Each worker process receives borders once and draws them once per column, only updating colors at each map. Each column has the same color scale in all its maps. Maps are written as PNG images in a directory, together with a manifest.csv file listing them.
+    
+    Parameters
+    ----------
+    source : pandas.core.frame.DataFrame
+        Pandas DataFrame with the data to plot, with one row per subdivision per map (e.g. the one returned by get_region_cases). Only Italian COVID Library generated DataFrames with geographical data compatible with the option "on" provided are guaranteed to work.
+    on : str
+        Option for choosing local subdivisions for plotting: regions (options "region", "regions" or "r") or provinces (options "province", "provinces" or "p")
+    columns : str or list
+        Name, or list of names, of the columns with the data to plot
+    output : str
+        Path of the directory (created if missing) where PNG images, named <column>_<map label>.png, and manifest.csv are written
+    by : str
+        Name of the column or index level with the values defining maps. Dates are labelled as YYYY-MM-DD (default is "date")
+    title : str
+        Title to give all maps, followed by the label of each map (default is a null title)
+    legend : bool
+        Displays or not a legend (default is True)
+    cmap : str
+        Code name of the color palette for plotting (for the list of codes please see matplotlib.org/stable/tutorials/colors/colormaps)(default is "Reds")
+    vmin : float or None
+        Value corresponding to the lowest color in all maps (default is the minimum of each column)
+    vmax : float or None
+        Value corresponding to the highest color in all maps (default is the maximum of each column)
+    tolerance : float or None
+        Tolerance, in degrees, for simplifying borders (e.g. 0.01), which makes rendering faster. None keeps the original borders (default is None)
+    dpi : int
+        Resolution of maps in dots per inch (default is 100)
+    max_workers : int or None
+        Maximum number of worker processes. With 1, maps are rendered in the calling process (default is the number of processors)
+    
+    Raises
+    ------
+    ItaCovidLibKeyError
+        Raised when source lacks the "region" or "province" column with local subdivision data, one of columns or by.
+    
+    ItaCovidLibArgumentError
+        Raised when improper arguments are passed to the function.
+    
+    ImportError
+        Raised when geopandas or matplotlib, required for maps, are not installed.
+    
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        Pandas DataFrame with the content of manifest.csv
+    
+    DataFrame Columns
+    -----------------
+    <by>
+        Value of by of the map
+    column : str
+        Name of the column plotted in the map
+    file : str
+        Name of the PNG image, relative to output
+    
+    See Also
+    --------
+    render_time_lapse : renders maps of a single column in the calling process, also as animations"""
+    
+    subdivision = _subdivision(on)
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    if max_workers is not None and max_workers < 1:
+        raise icl_e.ItaCovidLibArgumentError("max_workers must be a positive integer.")
+    missing = [name for name in [subdivision]+columns if name not in source.columns]
+    if missing or (by not in source.columns and by not in source.index.names):
+        raise icl_e.ItaCovidLibKeyError("could not find columns "+", ".join(str(name) for name in missing+[by])+" in source object.")
+    output = str(output)
+    os.makedirs(output, exist_ok=True)
+    icl_r = icl_b._import_optional("itacovidlib.rendering", "maps", "maps")
+    geometries = icl_b._load_geometries(subdivision, tolerance)
+    frames = icl_r._frames(source, by)
+    max_workers = max_workers or os.cpu_count() or 1
+    # maps are sent to workers in batches, a few per worker, so that the overhead of each task is shared by many maps
+    batch_size = max(1, -(-len(frames)*len(columns)//(4*max_workers)))
+    tasks = []
+    manifest = []
+    for column in columns:
+        vmin_column, vmax_column = icl_r._color_limits(source[column], vmin, vmax)
+        options = (vmin_column, vmax_column, title, legend, cmap, dpi)
+        column_frames = []
+        for key, label, rows in frames:
+            file_name = str(column)+"_"+label+".png"
+            column_frames.append((rows[subdivision].to_numpy(), rows[column].to_numpy(), label, os.path.join(output, file_name)))
+            manifest.append({by:key, "column":column, "file":file_name})
+        tasks.extend((options, column_frames[start:start+batch_size]) for start in range(0, len(column_frames), batch_size))
+    if max_workers == 1:
+        icl_r._initialize_worker(geometries, subdivision)
+        try:
+            for options, batch in tasks:
+                icl_r._render_frames(options, batch)
+        finally:
+            # figures are not kept in the calling process
+            icl_r._initialize_worker(None, None)
+    else:
+        # geometries are sent once to each worker, which reuses them for all its maps
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, initializer=icl_r._initialize_worker, initargs=(geometries, subdivision)) as executor:
+            for rendered in [executor.submit(icl_r._render_frames, options, batch) for options, batch in tasks]:
+                rendered.result()
+    manifest = pd.DataFrame(manifest, columns=[by, "column", "file"])
+    manifest.to_csv(os.path.join(output, "manifest.csv"), index=False)
+    return manifest
+
+def _subdivision(on):
+    """Returns the name of the column with local subdivisions ("region" or "province") corresponding to the option on of map functions."""
+    
+    if on=="region" or on=="regions" or on=="r":
+        return "region"
+    elif on=="province" or on=="provinces" or on=="p":
+        return "province"
+    else:
+        raise icl_e.ItaCovidLibArgumentError("invalid option on. Please see documentation for help on possible options.")
+
+def tell_rt(by=None, max_workers=1, incremental=False):
+    """Returns a DataFrame with Rt values over time in Italy, or in each Italian region or province.
+    
+    Estimates are cached: as long as cases are the same (i.e. until new data are published), repeated calls return the same estimates immediately. See clear_cache to empty the cache.
+    
+    With the incremental option, estimates are also stored after every call (in memory, and in the snapshot directory if snapshots are enabled, see set_snapshots). When new data are published, only the trailing days whose estimates can still change are estimated again (about 200 days before the first new or revised day, due to the smoothing of cases and to the delay between infection and reporting), while older estimates are taken from the stored ones. Since Rt is estimated by random sampling, updated estimates differ from the ones of a full estimation within the same statistical fluctuations of two full estimations.
+    
+    Parameters
+    ----------
+    by : str
+        If None, Rt is estimated for Italy as a whole. If "region" (or "r"), Rt is estimated for each region from new cases returned by get_region_cases. If "province" (or "p"), Rt is estimated for each province from daily increments of cumulative cases returned by get_province_cases (default is None)
+    max_workers : int
+        Number of processes among which the estimation is divided. For Italy as a whole, bootstrap samples are divided among processes; for regions and provinces, areas are. With 1, the estimation runs in the calling process (default is 1)
+    incremental : bool
+        If True, stores estimates and only estimates again the trailing days affected by new data since the last stored estimates (default is False)
     
     Raises
     ------
     ItaCovidLibConnectionError
         Raised when there are issues with Internet connection.
     
+    ItaCovidLibArgumentError
+        Raised when improper arguments are passed to the function.
+    
+    ImportError
+        Raised when epyestim, required for Rt estimates, is not installed.
+    
     Returns
     -------
     pandas.core.frame.DataFrame
-        Pandas DataFrame containing Rt values over time.
+        Pandas DataFrame containing Rt values over time. With by, one row per date and area, sorted by date, for all areas whose Rt can be estimated (areas without any case are left out).
     
     DataFrame Columns
     -----------------
     date : datetime (index)
         Date
+    region or province : str (index, only with by)
+        Name of the area
     cases : float64
         Number of new cases on given date
     R_mean : float64
@@ -1341,14 +1854,361 @@ def tell_rt():
     
     See Also
     --------
-    get_national_trend : returns cases and the general situation of the epidemic in Italy over time"""
+    get_national_trend : returns cases and the general situation of the epidemic in Italy over time
+    get_region_cases : returns cases per region over time
+    get_province_cases : returns cases per province over time
+    set_snapshots : enables the local store where incremental estimates are also kept"""
+    if max_workers < 1:
+        raise icl_e.ItaCovidLibArgumentError("max_workers must be a positive integer.")
+    icl_rt = icl_b._import_optional("itacovidlib.rt", "Rt estimates", "rt")
+    if by is not None:
+        if by == "region" or by == "r":
+            by = "region"
+        elif by == "province" or by == "p":
+            by = "province"
+        else:
+            raise icl_e.ItaCovidLibArgumentError('invalid option for by. Accepted options are None, "region" (or "r") and "province" (or "p").')
+        estimates = icl_rt._estimate_rt_by(_cases_by_area(by), max_workers=max_workers, history=by if incremental else None)
+        if not estimates:
+            return pd.DataFrame(columns=["cases", "R_mean", "R_var", "Q0.025", "Q0.5", "Q0.975"], index=pd.MultiIndex.from_arrays([pd.DatetimeIndex([]), []], names=["date", by]), dtype="float64")
+        # long format, with one row per date and area
+        rt_data = pd.concat(estimates, names=[by, "date"]).swaplevel().sort_index()
+        return rt_data
     # cases per day are returned by get_national_trend
     trend = get_national_trend()
-    # covid19.r_covid, the function calculating Rt index, requires dates without hours, minutes and seconds
-    trend.index = trend.index.date
-    rt_data = covid19.r_covid(trend["new_cases"])
+    # Rt estimation (the same of epyestim.covid19.r_covid) requires dates without hours, minutes and seconds. They are kept as datetime objects, since datetime.date objects cannot be compared with the dates of the estimation.
+    trend.index = trend.index.normalize()
+    rt_data = icl_rt._estimate_rt(trend["new_cases"], max_workers=max_workers, history="national" if incremental else None)
     # index column must be given a name
     rt_data.index.name = "date"
     # for proper indexing and ranging
     rt_data.index = pd.to_datetime(rt_data.index)
     return rt_data
+
+def _cases_by_area(by):
+    """Returns a DataFrame with daily cases per region or province (by), one column per area, indexed by dates without time. Meant to be invoked by tell_rt."""
+    
+    if by == "region":
+        data = get_region_cases()
+        daily = data["new_cases"]
+    else:
+        data = get_province_cases()
+        # cases still to be assigned to a province are listed under pseudo-provinces, with codes from 979. Abbreviations cannot tell them apart, since the one of Napoli ("NA") is parsed as missing.
+        data = data[data["province_code"] < 979]
+        daily = data["cumulative_cases"]
+    cases = pd.DataFrame({"date":data.index.normalize(), "area":data[by].astype(str).to_numpy(), "cases":daily.to_numpy(dtype="int64")})
+    cases = cases.pivot_table(index="date", columns="area", values="cases", aggfunc="sum", fill_value=0)
+    if by == "province":
+        # new cases are increments of cumulative cases. Corrections may make them negative, which is not a valid number of cases.
+        cases = cases.diff().fillna(cases).clip(lower=0)
+    cases.columns.name = None
+    return cases.astype("int64")
+
+def set_http_cache(directory, ttl=3600, max_size=512*1024*1024):
+    """Enables (or disables) the persistent on-disk HTTP cache used by all get_<resource_name> functions.
+    
+    Every downloaded .csv file is stored in the cache directory together with its ETag and Last-Modified headers. Requests made within ttl seconds from the last download or revalidation are served from the cache without contacting the server. Later requests are sent as conditional requests, so that the file is downloaded again only if it has changed upstream.
+    
+    Parameters
+    ----------
+    directory : str or None
+        Path of the cache directory, created if missing. None disables the cache (default behaviour of the library). A directory dedicated to the cache is recommended: other files in it are never removed, but they are not counted in max_size either.
+    ttl : int or float
+        Number of seconds during which cached files are considered fresh (default is 3600)
+    max_size : int
+        Maximum size in bytes of the files stored in the cache directory by the library. When it is exceeded, least recently used ones are removed (default is 512 MiB)
+    
+    Raises
+    ------
+    ItaCovidLibArgumentError
+        Raised when improper arguments are passed to the function.
+    
+    Returns
+    -------
+    None
+    
+    See Also
+    --------
+    clear_http_cache : removes all files stored by the library in the cache directory"""
+    
+    if ttl < 0 or max_size < 0:
+        raise icl_e.ItaCovidLibArgumentError("ttl and max_size must not be negative.")
+    icl_b._http_cache["directory"] = None if directory is None else str(directory)
+    icl_b._http_cache["ttl"] = ttl
+    icl_b._http_cache["max_size"] = max_size
+
+def clear_http_cache():
+    """Removes all files stored by the library in the persistent HTTP cache directory, if the cache is enabled. Other files in the directory are left untouched.
+    
+    Parameters
+    ----------
+    None
+    
+    Returns
+    -------
+    None
+    
+    See Also
+    --------
+    set_http_cache : enables the cache and sets its options"""
+    
+    icl_b._clear_http_cache()
+
+def set_snapshots(directory):
+    """Enables (or disables) the local snapshot store used by all get_<resource_name> functions.
+    
+    Every parsed dataset is stored in the snapshot directory as a Feather file, keyed by dataset and upstream revision. Later calls only check whether the dataset has changed upstream (downloading nothing if it has not) and load the snapshot with memory mapping instead of parsing .csv data again. Without Internet connection, the last available snapshot of each dataset is returned instead of raising an error. Requires pyarrow.
+    
+    Parameters
+    ----------
+    directory : str or None
+        Path of the snapshot directory, created if missing. None disables snapshots (default behaviour of the library). A directory dedicated to snapshots is recommended, although other files in it are never removed.
+    
+    Raises
+    ------
+    ImportError
+        Raised when pyarrow, required for snapshots, is not installed.
+    
+    Returns
+    -------
+    None
+    
+    See Also
+    --------
+    clear_snapshots : removes all snapshots
+    set_http_cache : enables a cache of downloaded files, which can be used together with snapshots"""
+    
+    if directory is not None:
+        # fails early if pyarrow is not available
+        icl_b._import_feather()
+    icl_b._snapshots["directory"] = None if directory is None else str(directory)
+
+def clear_snapshots():
+    """Removes all files stored by the library in the snapshot directory, if snapshots are enabled. Other files in the directory are left untouched.
+    
+    Parameters
+    ----------
+    None
+    
+    Returns
+    -------
+    None
+    
+    See Also
+    --------
+    set_snapshots : enables snapshots"""
+    
+    icl_b._clear_snapshots()
+
+def set_session(session=None, retries=3, backoff_factor=0.5, timeout=(10, 60), pool_maxsize=16):
+    """Sets the HTTP session used by all get_<resource_name> functions to download data.
+    
+    The session keeps connections alive, so that only the first of many consecutive downloads from the same host pays for the connection (TCP and TLS) setup. By default, failed requests are retried with exponential backoff and compressed (gzip) responses are requested.
+    
+    Parameters
+    ----------
+    session : requests.Session or None
+        Session to use as it is, e.g. for testing purposes. None creates a new session according to the options below (default is None)
+    retries : int
+        Maximum number of retries of a failed request. Ignored if session is provided (default is 3)
+    backoff_factor : float
+        Factor of the exponential backoff between retries, in seconds. Ignored if session is provided (default is 0.5)
+    timeout : float or tuple
+        Timeout in seconds for connecting to the server and for waiting for data from it, either as a single number or as a (connect, read) pair (default is (10, 60))
+    pool_maxsize : int
+        Maximum number of connections kept alive per host. Ignored if session is provided (default is 16)
+    
+    Raises
+    ------
+    ItaCovidLibArgumentError
+        Raised when improper arguments are passed to the function.
+    
+    Returns
+    -------
+    None
+    
+    See Also
+    --------
+    get_many : downloads several resources at once, sharing the connections of the session"""
+    
+    if retries < 0 or backoff_factor < 0 or pool_maxsize < 1:
+        raise icl_e.ItaCovidLibArgumentError("invalid session options. Please see documentation for help on possible options.")
+    if session is None:
+        session = icl_b._make_session(retries=retries, backoff_factor=backoff_factor, pool_maxsize=pool_maxsize)
+    icl_b._session = session
+    icl_b._timeout = timeout
+
+def set_transport(mode="network", directory=None):
+    """Sets where get_<resource_name> functions take data from: the network, or a local directory of recorded files, e.g. for fast and reproducible tests and benchmarks without Internet connection.
+
+    Files are recorded at <directory>/<host>/<path of the URL>, where URL is the one of the resource (e.g. <directory>/raw.githubusercontent.com/pcm-dpc/COVID-19/master/dati-andamento-nazionale/dpc-covid19-ita-andamento-nazionale.csv), so that a directory can also be filled by hand. DataFrames cached by get_<resource_name> functions are removed (see clear_cache), since they may come from a different source.
+
+    Parameters
+    ----------
+    mode : str
+        "network" (default) to download data through the session set with set_session, "replay" to read the files recorded in directory instead (requests for resources without a recorded file are answered as if they were not found upstream) or "record" to download data through the session and record the files received into directory
+    directory : str or os.PathLike or None
+        Directory of the recorded files. Required by modes "replay" and "record", ignored by mode "network" (default is None)
+
+    Raises
+    ------
+    ItaCovidLibArgumentError
+        Raised when improper arguments are passed to the function.
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    set_session : sets the HTTP session used to download data"""
+
+    if mode not in ("network", "replay", "record") or (mode != "network" and directory is None):
+        raise icl_e.ItaCovidLibArgumentError("invalid transport options. Please see documentation for help on possible options.")
+    if mode == "network":
+        icl_b._transport.update({"mode":"network", "directory":None, "session":None})
+    else:
+        directory = os.fspath(directory)
+        icl_b._transport.update({"mode":mode, "directory":directory, "session":icl_b._make_transport_session(mode, directory)})
+    clear_cache()
+
+def set_cache(maxsize=32, ttl=3600):
+    """Sets the options of the process-wide cache of DataFrames returned by get_<resource_name> functions.
+    
+    Calls to a get_<resource_name> function with the same arguments within ttl seconds from the first one return a copy of the same DataFrame, without downloading and parsing data again. This also applies to calls made internally by tell_<information> functions. With pandas 3 or later (or with copy-on-write enabled in pandas 2) copies are shallow, sharing data with the cached DataFrame until either is modified, so that cached calls do not copy data; otherwise they are deep copies.
+    
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of DataFrames kept in the cache. When it is exceeded, least recently used DataFrames are removed. 0 disables the cache (default is 32)
+    ttl : int or float
+        Number of seconds after which a cached DataFrame is considered outdated and data are downloaded again (default is 3600)
+    
+    Raises
+    ------
+    ItaCovidLibArgumentError
+        Raised when improper arguments are passed to the function.
+    
+    Returns
+    -------
+    None
+    
+    See Also
+    --------
+    clear_cache : removes all DataFrames from the cache
+    cache_info : returns statistics about the cache"""
+    
+    if maxsize < 0 or ttl < 0:
+        raise icl_e.ItaCovidLibArgumentError("maxsize and ttl must not be negative.")
+    with icl_b._memo_lock:
+        icl_b._memo_options["maxsize"] = maxsize
+        icl_b._memo_options["ttl"] = ttl
+        while len(icl_b._memo) > maxsize:
+            icl_b._memo.popitem(last=False)
+
+def clear_cache():
+    """Removes all DataFrames from the process-wide cache of DataFrames returned by get_<resource_name> functions, and resets its statistics. Cached Rt estimates of tell_rt are also removed, together with the incremental estimates kept in memory (the ones stored in the snapshot directory are removed by clear_snapshots).
+    
+    Parameters
+    ----------
+    None
+    
+    Returns
+    -------
+    None
+    
+    See Also
+    --------
+    set_cache : sets the options of the cache
+    cache_info : returns statistics about the cache"""
+    
+    with icl_b._memo_lock:
+        icl_b._memo.clear()
+        icl_b._memo_statistics["hits"] = 0
+        icl_b._memo_statistics["misses"] = 0
+    # Rt estimates can only have been cached if itacovidlib.rt was imported
+    if "itacovidlib.rt" in sys.modules:
+        sys.modules["itacovidlib.rt"]._clear_rt_cache()
+
+def cache_info():
+    """Returns statistics about the process-wide cache of DataFrames returned by get_<resource_name> functions.
+    
+    Parameters
+    ----------
+    None
+    
+    Returns
+    -------
+    dict
+        Dictionary with keys "hits" (number of calls served by the cache), "misses" (number of calls which required data to be downloaded), "maxsize" and "ttl" (cache options) and "currsize" (number of DataFrames currently in the cache)
+    
+    See Also
+    --------
+    set_cache : sets the options of the cache
+    clear_cache : removes all DataFrames from the cache"""
+    
+    with icl_b._memo_lock:
+        return {"hits":icl_b._memo_statistics["hits"], "misses":icl_b._memo_statistics["misses"], "maxsize":icl_b._memo_options["maxsize"], "ttl":icl_b._memo_options["ttl"], "currsize":len(icl_b._memo)}
+
+def get_many(resources, max_workers=8, raise_errors=True):
+    """Returns several DataFrames at once, downloading and parsing them concurrently.
+    
+    Resources are named after the get_<resource_name> functions returning them, either with or without the "get_" prefix (e.g. "vaccine_admin" or "get_vaccine_admin"). For functions accepting the latest option, the suffix "_latest" requests data referred to the current day only (e.g. "region_cases_latest").
+    
+    Parameters
+    ----------
+    resources : list of str
+        Names of the resources to get.
+    max_workers : int
+        Maximum number of resources downloaded at the same time (default is 8)
+    raise_errors : bool
+        If True, an error is raised when any resource cannot be downloaded. If False, each resource which cannot be downloaded is associated with the error raised for it in the returned dictionary (default is True)
+    
+    Raises
+    ------
+    ItaCovidLibConnectionError
+        Raised when there are issues with Internet connection (only with raise_errors=True). The error message lists all the resources which could not be downloaded.
+    
+    ItaCovidLibArgumentError
+        Raised when improper arguments are passed to the function.
+    
+    Returns
+    -------
+    dict
+        Dictionary with the names in resources as keys and the corresponding DataFrames (or ItaCovidLibConnectionError errors, with raise_errors=False) as values.
+    
+    See Also
+    --------
+    Any function whose name begins with "get_" : the functions called by get_many"""
+    
+    if max_workers < 1:
+        raise icl_e.ItaCovidLibArgumentError("max_workers must be at least 1.")
+    # all names are checked before any download begins
+    calls = {resource:_resolve_getter(resource) for resource in resources}
+    results = {}
+    errors = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, max(len(calls), 1))) as executor:
+        futures = {executor.submit(getter, **arguments):resource for resource, (getter, arguments) in calls.items()}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except icl_e.ItaCovidLibConnectionError as error:
+                errors[futures[future]] = error
+    if errors and raise_errors:
+        raise icl_e.ItaCovidLibConnectionError("connection failure for resources: {}. Most probable cause is lack of Internet connection.".format(", ".join(resource for resource in resources if resource in errors)))
+    results.update(errors)
+    # dictionary follows the order of resources
+    return {resource:results[resource] for resource in calls}
+
+def _resolve_getter(resource):
+    """Returns the get_<resource_name> function corresponding to the resource name provided as a parameter, together with the arguments to call it with. Meant to be invoked by get_many."""
+    
+    name = resource if resource.startswith("get_") else "get_"+resource
+    arguments = {}
+    if name not in _GETTERS and name.endswith("_latest"):
+        name = name[:-len("_latest")]
+        arguments["latest"] = True
+    getter = _GETTERS.get(name)
+    if getter is None or ("latest" in arguments and "latest" not in inspect.signature(getter).parameters):
+        raise icl_e.ItaCovidLibArgumentError('no resource recognized with name "{}". Please see documentation for help on possible names.'.format(resource))
+    return getter, arguments
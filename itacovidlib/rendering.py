@@ -0,0 +1,134 @@
+# drawing of many maps of Italian subdivisions (e.g. one per day, for time-lapse plots). Borders are turned into matplotlib patches only once, and every frame only updates their colors.
+# figures are drawn with the Agg backend without pyplot, so that no display is needed.
+import numpy as np
+import pandas as pd
+import PIL.Image
+import matplotlib
+import matplotlib.animation
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PatchCollection
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+
+
+def _geometry_path(geometry):
+    """Returns a matplotlib Path with all the rings (borders and holes) of a shapely Polygon or MultiPolygon."""
+
+    polygons = geometry.geoms if hasattr(geometry, "geoms") else [geometry]
+    rings = []
+    for polygon in polygons:
+        for ring in [polygon.exterior, *polygon.interiors]:
+            rings.append(Path(np.asarray(ring.coords)[:, :2], closed=True))
+    return Path.make_compound_path(*rings)
+
+class _MapRenderer:
+    """Map of Italian subdivisions drawn once on an Agg figure, whose colors and title are updated at every frame.
+
+    Parameters
+    ----------
+    geometries : geopandas.geodataframe.GeoDataFrame
+        GeoDataFrame returned by itacovidlib.backend._load_geometries.
+    subdivision : str
+        Either "region" or "province", the name of the column of geometries with the names of subdivisions.
+    vmin, vmax : float
+        Values mapped to the lowest and to the highest color of cmap in every frame.
+    title : str
+        Title shared by all frames, followed by the label of each frame (default is a null title)
+    legend : bool
+        Displays or not a colorbar (default is True)
+    cmap : str
+        Code name of the color palette for plotting (default is "Reds")
+    dpi : int
+        Resolution of frames in dots per inch (default is 100)"""
+
+    def __init__(self, geometries, subdivision, vmin, vmax, title="", legend=True, cmap="Reds", dpi=100):
+        self.names = pd.Index(geometries[subdivision])
+        self.title = title
+        self.figure = Figure(dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.axes = self.figure.add_subplot()
+        # borders are simplified up to half a pixel: details below that are not visible, but slow down every frame
+        minimum_x, minimum_y, maximum_x, maximum_y = geometries.total_bounds
+        pixel = max(maximum_x-minimum_x, maximum_y-minimum_y)/(max(self.figure.get_size_inches())*dpi)
+        paths = [_geometry_path(geometry.simplify(pixel/2, preserve_topology=True)) for geometry in geometries.geometry]
+        # subdivisions without data in a frame are drawn in light grey
+        colormap = matplotlib.colormaps[cmap].with_extremes(bad="lightgrey")
+        self.collection = PatchCollection([PathPatch(path) for path in paths], cmap=colormap, norm=matplotlib.colors.Normalize(vmin, vmax), edgecolor="black", linewidth=0.2)
+        self.axes.add_collection(self.collection)
+        self.axes.autoscale_view()
+        # same aspect ratio as geopandas plots, which corrects the stretching of longitudes at Italian latitudes
+        self.axes.set_aspect(1/np.cos(np.deg2rad((minimum_y+maximum_y)/2)))
+        # plot returned by plot function also includes anti-aesthetic latitude and longitude axes
+        self.axes.set_axis_off()
+        if legend:
+            self.figure.colorbar(self.collection, ax=self.axes)
+        self.title_text = self.axes.set_title(title)
+        # everything but colors and title is drawn only once, as a background restored at every frame
+        self.collection.set_visible(False)
+        self.title_text.set_visible(False)
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.collection.set_visible(True)
+        self.title_text.set_visible(True)
+
+    def draw(self, names, values, label=""):
+        """Colors each subdivision in names according to the corresponding value, sets the title of the frame and draws it."""
+
+        positions = self.names.get_indexer(names)
+        known = positions >= 0
+        colors = np.full(len(self.names), np.nan)
+        colors[positions[known]] = np.asarray(values, dtype=float)[known]
+        self.collection.set_array(np.ma.masked_invalid(colors))
+        self.title_text.set_text((self.title+" "+label).strip())
+        self.canvas.restore_region(self.background)
+        self.axes.draw_artist(self.collection)
+        self.axes.draw_artist(self.title_text)
+
+    def image(self):
+        """Returns the last drawn frame as a PIL image."""
+
+        return PIL.Image.fromarray(np.asarray(self.canvas.buffer_rgba()))
+
+def _frames(source, by):
+    """Returns (key, label, rows) triples with the rows of source sharing the same value (key) of by (a column or an index level), sorted by that value. Dates are labelled as YYYY-MM-DD."""
+
+    keys = source[by] if by in source.columns else source.index.get_level_values(by)
+    frames = []
+    for key, rows in source.groupby(keys, sort=True, observed=True):
+        label = key.strftime("%Y-%m-%d") if isinstance(key, pd.Timestamp) else str(key)
+        frames.append((key, label, rows))
+    return frames
+
+def _color_limits(values, vmin=None, vmax=None):
+    """Returns the color normalization shared by all frames, which is the range of values unless given."""
+
+    values = np.asarray(values, dtype=float)
+    if vmin is None:
+        vmin = float(np.nanmin(values)) if len(values) > 0 else 0.0
+    if vmax is None:
+        vmax = float(np.nanmax(values)) if len(values) > 0 else 1.0
+    return vmin, vmax
+
+# state of worker processes rendering maps in parallel: geometries, received once by _initialize_worker, and one renderer per set of drawing options
+_worker = {"geometries": None, "subdivision": None, "renderers": {}}
+
+def _initialize_worker(geometries, subdivision):
+    """Stores the geometries used by all the maps rendered by a worker process. Meant to be the initializer of the process pool of render_maps."""
+
+    _worker["geometries"] = geometries
+    _worker["subdivision"] = subdivision
+    _worker["renderers"] = {}
+
+def _render_frames(options, frames):
+    """Renders frames, given as (names, values, label, path) tuples, as PNG images, reusing the renderer of the worker process for options (vmin, vmax, title, legend, cmap, dpi). Returns the number of rendered frames. Meant to be invoked by render_maps, either in worker processes or, after _initialize_worker, in the calling process."""
+
+    renderer = _worker["renderers"].get(options)
+    if renderer is None:
+        vmin, vmax, title, legend, cmap, dpi = options
+        renderer = _MapRenderer(_worker["geometries"], _worker["subdivision"], vmin, vmax, title=title, legend=legend, cmap=cmap, dpi=dpi)
+        _worker["renderers"][options] = renderer
+    for names, values, label, path in frames:
+        renderer.draw(names, values, label)
+        renderer.image().save(path)
+    return len(frames)
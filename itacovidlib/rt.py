@@ -0,0 +1,262 @@
+# estimation of the effective reproduction number (Rt) from daily cases, with the bootstrap method of epyestim (the same used by epyestim.covid19.r_covid, with the same default parameters).
+# estimates are cached, keyed by a hash of the case series and of the parameters, and bootstrap samples can be drawn across a pool of processes.
+# estimates can also be updated incrementally: only the trailing days whose estimates can still change with new data are estimated again, the older ones coming from stored histories.
+import os
+import hashlib
+import json
+import threading
+import collections
+import concurrent.futures
+import numpy as np
+import pandas as pd
+import epyestim.covid19 as covid19
+import epyestim.main as epyestim_main
+import itacovidlib.backend as icl_b
+
+
+# default parameters of epyestim.covid19.r_covid
+_RT_PARAMETERS = {"a_prior": 3, "b_prior": 1, "smoothing_window": 21, "r_window_size": 3, "n_samples": 100, "quantiles": (0.025, 0.5, 0.975)}
+
+# cache of Rt estimates, ordered from least to most recently used. Keys are hashes of case series and parameters.
+_rt_cache = collections.OrderedDict()
+_rt_cache_options = {"maxsize": 256}
+_rt_cache_lock = threading.Lock()
+
+# histories of incremental estimates: for each history key, the case series last estimated and its Rt estimate. Also stored in the snapshot directory, if snapshots are enabled.
+_rt_histories = {}
+
+# generation time and infection to reporting delay distributions for COVID-19, generated at first use
+_distributions = {}
+
+def _covid_distributions():
+    """Returns the standard generation time and infection to reporting delay distributions for COVID-19 used by epyestim.covid19.r_covid."""
+
+    if not _distributions:
+        _distributions["generation_time"] = covid19.generate_standard_si_distribution()
+        _distributions["delay"] = covid19.generate_standard_infection_to_reporting_distribution()
+    return _distributions["generation_time"], _distributions["delay"]
+
+def _rt_key(cases, parameters):
+    """Returns the key of the Rt estimate for cases (a Series indexed by date) with parameters in the cache."""
+
+    digest = hashlib.sha256()
+    digest.update(pd.to_datetime(cases.index).to_numpy(dtype="datetime64[ns]").tobytes())
+    digest.update(cases.to_numpy(dtype="int64").tobytes())
+    digest.update(json.dumps(parameters, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+def _estimate_rt(cases, max_workers=1, history=None, **parameters):
+    """Returns a DataFrame with Rt estimates over time from daily cases, like the one returned by epyestim.covid19.r_covid, using the cache when the same cases and parameters were already estimated.
+
+    Parameters
+    ----------
+    cases : pandas.core.series.Series
+        Daily cases indexed by consecutive dates without time.
+    max_workers : int
+        Number of processes among which bootstrap samples are divided. With 1, samples are drawn in the calling process (default is 1)
+    history : str or None
+        Name of the history of incremental estimates of cases (e.g. "national"). If given, the estimate is stored under that name, and only the trailing days whose estimates can change since the stored estimate are estimated again (see _trailing_segment). If None, the whole series is estimated (default is None)
+    **parameters
+        Parameters of epyestim.covid19.r_covid overriding the default ones: a_prior, b_prior, smoothing_window, r_window_size, n_samples and quantiles.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        DataFrame with columns cases, R_mean, R_var and one column per quantile (e.g. Q0.5), indexed by date."""
+
+    parameters = {**_RT_PARAMETERS, **parameters}
+    key = _rt_key(cases, parameters)
+    estimate = _cached_rt(key)
+    if estimate is None:
+        segment, stored, since = _trailing_segment(cases, parameters, history)
+        estimate = stored if segment is None else _merge_rt(stored, _bagging_r(segment, parameters, max_workers), since)
+        if history is not None:
+            _save_rt_history(history, parameters, cases, estimate)
+        _cache_rt(key, estimate)
+    return estimate.copy()
+
+def _estimate_rt_by(cases, max_workers=1, history=None, **parameters):
+    """Returns a dict with the Rt estimates of many areas (e.g. regions), like the ones returned by _estimate_rt, using the cache for areas whose cases and parameters were already estimated. Areas whose Rt cannot be estimated (e.g. without any case) are left out.
+
+    Parameters
+    ----------
+    cases : pandas.core.frame.DataFrame
+        Daily cases with one column per area, indexed by consecutive dates without time.
+    max_workers : int
+        Number of processes among which areas are divided, each estimated entirely by one process. With 1, all areas are estimated in the calling process (default is 1)
+    history : str or None
+        Prefix of the names of the histories of incremental estimates of areas, followed by ":" and the name of each area (default is None)
+    **parameters
+        Parameters of epyestim.covid19.r_covid overriding the default ones, as in _estimate_rt.
+
+    Returns
+    -------
+    dict
+        Dict with areas (names of the columns of cases) as keys and DataFrames with Rt estimates as values."""
+
+    parameters = {**_RT_PARAMETERS, **parameters}
+    estimates = {}
+    missing = {}
+    for area in cases.columns:
+        key = _rt_key(cases[area], parameters)
+        estimate = _cached_rt(key)
+        if estimate is None:
+            missing[area] = (key, *_trailing_segment(cases[area], parameters, None if history is None else history+":"+str(area)))
+        else:
+            estimates[area] = estimate.copy()
+    # areas whose stored estimates are still valid need no estimation
+    segments = {area: plan[1] for area, plan in missing.items() if plan[1] is not None}
+    if max_workers == 1 or len(segments) < 2:
+        results = {area: _try_bagging_r(segment, parameters) for area, segment in segments.items()}
+    else:
+        # each area gets its own random seed, otherwise processes forked with the same random state would draw the same samples
+        seeds = dict(zip(segments, (int(child.generate_state(1)[0]) for child in np.random.SeedSequence().spawn(len(segments)))))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(max_workers, len(segments))) as executor:
+            futures = {area: executor.submit(_try_bagging_r, segment, parameters, seed=seeds[area]) for area, segment in segments.items()}
+            results = {area: future.result() for area, future in futures.items()}
+    for area, (key, segment, stored, since) in missing.items():
+        if segment is None:
+            estimate = stored
+        elif results[area] is None:
+            continue
+        else:
+            estimate = _merge_rt(stored, results[area], since)
+        if history is not None:
+            _save_rt_history(history+":"+str(area), parameters, cases[area], estimate)
+        _cache_rt(key, estimate)
+        estimates[area] = estimate.copy()
+    return {area: estimates[area] for area in cases.columns if area in estimates}
+
+def _rt_horizon(parameters):
+    """Returns the number of trailing days whose Rt estimates can change when the cases of a new day are added: new cases change smoothed cases within the smoothing window, which change infections up to the longest infection to reporting delay before, which change Rt estimates up to the longest generation time and the Rt window after."""
+
+    generation_time, delay = _covid_distributions()
+    return parameters["smoothing_window"]+len(delay)+len(generation_time)+parameters["r_window_size"]
+
+def _trailing_segment(cases, parameters, history):
+    """Returns the cases to estimate to update the stored estimate of history, as a (segment, stored, since) triple: the stored estimate is kept for dates before since, and replaced by the estimate of segment from since on.
+
+    Dates whose estimates can change start one horizon (see _rt_horizon) before the first day of cases differing from (or missing in) the stored cases. The segment starts a further horizon before, so that smoothing and deconvolution at the beginning of the segment do not affect the estimates from since on. If nothing is stored, or the segment would start at the beginning of cases, all cases are estimated again, i.e. (cases, None, None) is returned. If cases are the same as the stored ones, (None, stored, None) is returned."""
+
+    stored_rt = None if history is None else _load_rt_history(history, parameters)
+    if stored_rt is None:
+        return cases, None, None
+    stored_cases, stored = stored_rt
+    length = len(stored_cases.index)
+    if len(cases.index) < length or not cases.index[:length].equals(stored_cases.index):
+        return cases, None, None
+    changed = np.flatnonzero(cases.to_numpy(dtype="int64")[:length] != stored_cases.to_numpy(dtype="int64"))
+    first = changed[0] if len(changed) > 0 else length
+    if first == len(cases.index):
+        return None, stored, None
+    horizon = _rt_horizon(parameters)
+    if first-2*horizon <= 0:
+        return cases, None, None
+    return cases.iloc[first-2*horizon:], stored, cases.index[first-horizon]
+
+def _merge_rt(stored, estimate, since):
+    """Returns the stored Rt estimate before since followed by the new estimate from since on, or the new estimate alone if since is None."""
+
+    if since is None:
+        return estimate
+    return pd.concat([stored[stored.index < since], estimate[estimate.index >= since]])
+
+def _rt_history_key(history, parameters):
+    """Returns the key under which the incremental estimates of history with parameters are stored."""
+
+    return hashlib.sha256(("rt-history:"+history+json.dumps(parameters, sort_keys=True, default=str)).encode("utf-8")).hexdigest()
+
+def _load_rt_history(history, parameters):
+    """Returns the (cases, estimate) pair stored for history with parameters, from memory or from the snapshot directory, or None if there is none."""
+
+    key = _rt_history_key(history, parameters)
+    with _rt_cache_lock:
+        if key in _rt_histories:
+            return _rt_histories[key]
+    directory = icl_b._snapshots["directory"]
+    path = None if directory is None else os.path.join(directory, key+"-rt.feather")
+    if path is None or not os.path.exists(path):
+        return None
+    stored = icl_b._load_snapshot(path).set_index("date")
+    stored.index.name = None
+    cases = stored.pop("confirmed_cases")
+    # the estimate starts and ends some days after and before cases (auto_cutoff option of epyestim)
+    stored_rt = (cases, stored[stored["cases"].notna()])
+    with _rt_cache_lock:
+        _rt_histories[key] = stored_rt
+    return stored_rt
+
+def _save_rt_history(history, parameters, cases, estimate):
+    """Stores cases and their Rt estimate as the history with parameters, in memory and in the snapshot directory, if snapshots are enabled."""
+
+    key = _rt_history_key(history, parameters)
+    with _rt_cache_lock:
+        _rt_histories[key] = (cases.copy(), estimate)
+    directory = icl_b._snapshots["directory"]
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+        stored = pd.concat([cases.astype("int64").rename("confirmed_cases"), estimate], axis=1, sort=True)
+        stored.index.name = "date"
+        icl_b._save_history(os.path.join(directory, key+"-rt.feather"), stored.reset_index())
+
+def _cached_rt(key):
+    """Returns the Rt estimate stored in the cache with key, or None if there is none."""
+
+    with _rt_cache_lock:
+        if key in _rt_cache:
+            _rt_cache.move_to_end(key)
+            return _rt_cache[key]
+    return None
+
+def _cache_rt(key, estimate):
+    """Stores an Rt estimate in the cache with key, discarding the least recently used estimates beyond the maximum size of the cache."""
+
+    with _rt_cache_lock:
+        _rt_cache[key] = estimate
+        while len(_rt_cache) > _rt_cache_options["maxsize"]:
+            _rt_cache.popitem(last=False)
+
+def _try_bagging_r(cases, parameters, seed=None):
+    """Returns the Rt estimate of _bagging_r, drawn in the calling process, or None if Rt cannot be estimated from cases (e.g. when there are no cases at all). Meant to be invoked by _estimate_rt_by, also in worker processes."""
+
+    try:
+        return _bagging_r(cases, parameters, seed=seed)
+    except ValueError:
+        return None
+
+def _bagging_r(cases, parameters, max_workers=1, seed=None):
+    """Estimates Rt from daily cases as epyestim.main.bagging_r does, optionally drawing bootstrap samples across a pool of processes. seed, if given, seeds the random generator when samples are drawn in the calling process."""
+
+    cases = cases.astype(int)
+    generation_time, delay = _covid_distributions()
+    # estimates are reliable only within these dates (auto_cutoff option of epyestim)
+    first_date = epyestim_main.start_date(confirmed_cases=cases, gt_distribution=generation_time, r_window_size=parameters["r_window_size"])
+    last_date = epyestim_main.end_date(confirmed_cases=cases, delay_distribution=delay)
+    n_samples = parameters["n_samples"]
+    if max_workers == 1 or n_samples < 2:
+        bag = _sample_bag(cases, parameters, n_samples, seed=seed)
+    else:
+        workers = min(max_workers, n_samples)
+        batches = [n_samples//workers+(1 if worker < n_samples%workers else 0) for worker in range(workers)]
+        # each process draws its samples from its own random seed, otherwise processes forked with the same random state would draw the same samples
+        seeds = [int(child.generate_state(1)[0]) for child in np.random.SeedSequence().spawn(workers)]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            bag = [sample for batch in executor.map(_sample_bag, [cases]*workers, [parameters]*workers, batches, seeds) for sample in batch]
+    estimate = epyestim_main.aggregate_quantiles_r(bag, parameters["quantiles"])
+    estimate = pd.concat((cases.rename("cases"), estimate), axis=1, sort=True)
+    return estimate[(first_date <= estimate.index) & (estimate.index <= last_date)]
+
+def _sample_bag(cases, parameters, n_samples, seed=None):
+    """Returns a list of n_samples bootstrap samples of the posterior distribution of Rt, after seeding the random generator used by epyestim if seed is given. Meant to be invoked by _bagging_r, also in worker processes."""
+
+    if seed is not None:
+        np.random.seed(seed)
+    generation_time, delay = _covid_distributions()
+    return [epyestim_main.sample_r(confirmed_cases=cases, gt_distribution=generation_time, delay_distribution=delay, a_prior=parameters["a_prior"], b_prior=parameters["b_prior"], smoothing_window=parameters["smoothing_window"], r_window_size=parameters["r_window_size"]) for _ in range(n_samples)]
+
+def _clear_rt_cache():
+    """Empties the cache of Rt estimates, together with the histories of incremental estimates kept in memory. Meant to be invoked by clear_cache."""
+
+    with _rt_cache_lock:
+        _rt_cache.clear()
+        _rt_histories.clear()
@@ -17,7 +17,13 @@ setup(
     url='https://github.com/FedericoCorchia/Italian_COVID_Library',
     download_url='https://github.com/FedericoCorchia/itacovidlib/archive/refs/tags/v0.1.3-alpha.tar.gz',
     long_description=read('README.md'),
-    install_requires=['numpy', 'pandas>=1.2.0', 'geopandas>=0.7.0', 'requests', 'epyestim'],
+    install_requires=['numpy', 'pandas>=2.0.0', 'requests'],
+    extras_require={
+        'maps': ['geopandas>=0.7.0', 'matplotlib'],
+        'rt': ['epyestim'],
+        'snapshots': ['pyarrow'],
+        'all': ['geopandas>=0.7.0', 'matplotlib', 'epyestim', 'pyarrow'],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Topic :: Utilities',
@@ -0,0 +1,146 @@
+import os
+import pandas as pd
+import pytest
+import itacovidlib.backend as icl_b, itacovidlib.datasets as icl_d, itacovidlib.functions as icl, itacovidlib.exceptions as icl_e
+
+################################################################################################
+# NOTE ON TESTING
+#
+# Tests in this file do not need an Internet connection: every dataset of the registry is
+# replayed from a one-row .csv file built from its declaration, and vaccine administrations
+# from a small .csv file shaped like the upstream one.
+################################################################################################
+
+
+@pytest.fixture
+def recorded_datasets(tmp_path):
+    """Records, for every file of every dataset of the registry, a .csv file with its original columns and a single row (dates in date columns, 1 elsewhere), and replays them."""
+    for dataset in icl_d.DATASETS.values():
+        row = ["2021-01-01" if column in dataset.get("dates", []) else "1" for column in dataset["columns"]]
+        for url in (dataset["url"], dataset.get("latest_url")):
+            if url is not None:
+                path = icl_b._fixture_path(url, tmp_path)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "w") as recording:
+                    recording.write(",".join(dataset["columns"])+"\n"+",".join(row)+"\n")
+    icl.set_transport("replay", tmp_path)
+    yield
+    icl.set_transport("network")
+
+
+@pytest.mark.parametrize("name", list(icl_d.DATASETS))
+def test_get_functions_follow_registry(recorded_datasets, name):
+    """Tests whether every dataset of the registry has a get_<resource_name> function returning its columns translated and indexed as declared, with declared types and dates."""
+    dataset = icl_d.DATASETS[name]
+    data = getattr(icl, "get_"+name)()
+    translated = list(dataset["columns"].values())
+    assert data.index.name == dataset["index"]
+    assert list(data.columns) == [column for column in translated if column != dataset["index"]]
+    for column, dtype in dataset.get("dtype", {}).items():
+        if dataset["columns"][column] != dataset["index"]:
+            assert data[dataset["columns"][column]].dtype == dtype
+    for column in dataset.get("dates", []):
+        values = data.index if dataset["columns"][column] == dataset["index"] else data[dataset["columns"][column]]
+        assert pd.api.types.is_datetime64_any_dtype(values)
+    if "latest_url" in dataset:
+        assert getattr(icl, "get_"+name)(latest=True).equals(data)
+
+@pytest.mark.parametrize("name", [name for name, dataset in icl_d.DATASETS.items() if dataset.get("index_order") == "codes" and name != "istat_region_data"])
+def test_filters_on_codes(recorded_datasets, name):
+    """Tests whether filters on geographical codes, returned as str, accept them both as str and as int, and reject values which are not codes."""
+    get = getattr(icl, "get_"+name)
+    code = icl_d.DATASETS[name]["index"]
+    assert list(get(filters=[(code, "==", "1")]).index) == ["1"]
+    assert get(filters=[(code, "in", ["1", "2"])]).equals(get(filters=[(code, "==", 1)]))
+    assert len(get(filters=[(code, ">", "1")]).index) == 0
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        get(filters=[(code, "==", "Lazio")])
+
+def test_schemas_of_registry():
+    """Tests whether datasets without declared types and dates are parsed with pandas defaults, and the other ones with the declared options."""
+    assert icl_d.schema("eligible") is None
+    assert icl_d.schema("national_trend") == {"dtype":{"stato":"category"}, "parse_dates":["data"], "date_format":"ISO8601"}
+
+
+def write_vaccine_admin(directory):
+    """Records a .csv file shaped like the upstream one of vaccine administrations, with two manufacturers and two regions over five days, returning its rows."""
+    dataset = icl_d.DATASETS["vaccine_admin"]
+    rows = pd.MultiIndex.from_product([pd.date_range("2021-01-01", periods=5, freq="D").strftime("%Y-%m-%d"), ["Moderna", "Pfizer/BioNTech"], [("LAZ", 12, "Lazio"), ("MAR", 11, "Marche")]], names=["data_somministrazione", "fornitore", "regione"]).to_frame(index=False)
+    rows[["area", "codice_regione_ISTAT", "nome_area"]] = pd.DataFrame(rows.pop("regione").tolist())
+    for number, column in enumerate(dataset["dtype"]):
+        if dataset["dtype"][column] == "int32":
+            rows[column] = (rows.index*(number+1)) % 50
+    rows["fascia_anagrafica"] = "20-29"
+    rows["codice_NUTS1"] = "ITI"
+    rows["codice_NUTS2"] = "ITI4"
+    path = icl_b._fixture_path(dataset["url"], directory)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    rows[list(dataset["columns"])].to_csv(path, index=False)
+
+@pytest.fixture
+def vaccine_admin(tmp_path):
+    write_vaccine_admin(tmp_path)
+    icl.set_transport("replay", tmp_path)
+    yield
+    icl.set_transport("network")
+
+@pytest.fixture(params=[False, True], ids=["csv", "snapshots"])
+def selection_source(request, vaccine_admin, monkeypatch, tmp_path):
+    """Makes get_<resource_name> functions read data either from .csv files, filtering them in blocks of two rows, or from snapshots (after storing them)."""
+    if request.param:
+        icl.set_snapshots(tmp_path/"snapshots")
+        icl.get_vaccine_admin()
+        icl.clear_cache()
+    else:
+        monkeypatch.setattr(icl_b, "_FILTER_CHUNKSIZE", 2)
+    yield
+    icl.set_snapshots(None)
+
+
+def test_get_columns(selection_source):
+    """Tests whether get_<resource_name> functions with columns return only the requested columns (in their original order) and the index."""
+    full = icl.get_vaccine_admin()
+    narrow = icl.get_vaccine_admin(columns=["booster_dose", "manufacturer"])
+    assert list(narrow.columns) == ["manufacturer", "booster_dose"]
+    assert narrow.equals(full[["manufacturer", "booster_dose"]])
+    # equal columns and filters given as lists share the same cache entry
+    hits = icl.cache_info()["hits"]
+    icl.get_vaccine_admin(columns=["booster_dose", "manufacturer"])
+    assert icl.cache_info()["hits"] == hits+1
+
+def test_get_filters(selection_source):
+    """Tests whether get_<resource_name> functions with filters return the same rows selected from the whole DataFrame, keeping column types."""
+    full = icl.get_vaccine_admin()
+    filtered = icl.get_vaccine_admin(columns=["region", "first_dose"], filters=[("region", "==", "Lazio"), ("manufacturer", "in", ["Moderna"]), ("date", ">=", "2021-01-02"), ("date", "<", "2021-01-05")])
+    expected = full[(full["region"]=="Lazio") & (full["manufacturer"]=="Moderna")]["2021-01-02":"2021-01-04"][["region", "first_dose"]]
+    assert len(filtered.index) == 3
+    assert filtered.index.equals(expected.index)
+    assert (filtered["first_dose"] == expected["first_dose"]).all()
+    assert filtered["region"].dtype == "category"
+    assert filtered["first_dose"].dtype == "int32"
+    assert len(icl.get_vaccine_admin(filters=[("region", "==", "Sicilia")]).index) == 0
+
+def test_get_start_and_stop(selection_source):
+    """Tests whether get_<resource_name> functions with start and stop return the same rows as date slicing of the whole DataFrame, for str dates covering whole periods and for exact dates."""
+    full = icl.get_vaccine_admin()
+    assert icl.get_vaccine_admin(start="2021-01-02", stop="2021-01-03").equals(full["2021-01-02":"2021-01-03"])
+    assert icl.get_vaccine_admin(start=pd.Timestamp("2021-01-04")).equals(full["2021-01-04":])
+    assert icl.get_vaccine_admin(stop="2021-01", columns=["first_dose"], filters=[("region", "==", "Marche")]).equals(full[full["region"]=="Marche"][["first_dose"]])
+    assert len(icl.get_vaccine_admin(start="2021-02").index) == 0
+
+def test_get_stop_cuts_parsing_off(vaccine_admin, tmp_path, monkeypatch):
+    """Tests whether get_<resource_name> functions with stop stop parsing date-sorted files past it, never reaching later rows."""
+    monkeypatch.setattr(icl_b, "_FILTER_CHUNKSIZE", 2)
+    full = icl.get_vaccine_admin()
+    with open(icl_b._fixture_path(icl_d.DATASETS["vaccine_admin"]["url"], tmp_path), "a") as file:
+        file.write("not a date"+","*(len(icl_d.DATASETS["vaccine_admin"]["columns"])-1)+"\n")
+    icl.clear_cache()
+    assert icl.get_vaccine_admin(stop="2021-01-02").equals(full[:"2021-01-02"])
+    with pytest.raises(ValueError):
+        icl.get_vaccine_admin()
+
+def test_get_columns_and_filters_improper_arguments(vaccine_admin):
+    """Tests whether get_<resource_name> functions raise the proper exception when given unknown columns, malformed filters (also ordering comparisons with unordered categories) or invalid dates."""
+    for arguments in [{"columns":["regione"]}, {"columns":"region"}, {"filters":[("region", "~", "Lazio")]}, {"filters":[("regione", "==", "Lazio")]}, {"filters":[("region", "in", "Lazio")]}, {"filters":[("region", "==")]}, {"filters":[("region", "<", "Lazio")]}, {"start":"not a date"}, {"stop":[1]}]:
+        with pytest.raises(icl_e.ItaCovidLibArgumentError):
+            icl.get_vaccine_admin(**arguments)
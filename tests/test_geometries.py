@@ -0,0 +1,80 @@
+import geopandas
+import pandas as pd
+import pytest
+import itacovidlib.backend as icl_b, itacovidlib.functions as icl, itacovidlib.exceptions as icl_e
+
+################################################################################################
+# NOTE ON TESTING
+#
+# Tests in this file do not need an Internet connection: they use the geometries shipped with
+# the library and small local DataFrames.
+################################################################################################
+
+
+@pytest.fixture
+def counted_read_file(monkeypatch):
+    """Empties the geometry store and counts the calls to geopandas.read_file."""
+    calls = []
+    read_file = geopandas.read_file
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return read_file(*args, **kwargs)
+    monkeypatch.setattr(geopandas, "read_file", counted)
+    icl_b._geometries.clear()
+    yield calls
+    icl_b._geometries.clear()
+
+def test_geometries_are_read_once(counted_read_file):
+    """Tests whether repeated calls to icl.prepare_for_plotting_on_map read the .geojson file only once."""
+    source = pd.DataFrame({"region":["Lazio", "Marche"], "value":[1, 2]})
+    first = icl.prepare_for_plotting_on_map(source, on="region")
+    second = icl.prepare_for_plotting_on_map(source, on="r")
+    assert len(counted_read_file) == 1
+    assert isinstance(second, geopandas.GeoDataFrame)
+    assert first.equals(second)
+    assert list(second["value"]) == [1, 2]
+
+def test_geometries_are_stored_with_snapshots(counted_read_file, tmp_path):
+    """Tests whether geometries are stored in the snapshot directory and loaded from there by a new geometry store."""
+    icl.set_snapshots(tmp_path)
+    try:
+        stored = icl_b._load_geometries("region")
+        icl_b._geometries.clear()
+        loaded = icl_b._load_geometries("region")
+    finally:
+        icl.set_snapshots(None)
+    assert len(counted_read_file) == 1
+    assert len([name for name in tmp_path.iterdir() if name.suffix == ".parquet"]) == 1
+    assert loaded.geom_equals(stored).all()
+
+def test_geometries_simplification(counted_read_file):
+    """Tests whether a tolerance simplifies geometries, keeping one row per region."""
+    original = icl_b._load_geometries("region")
+    simplified = icl_b._load_geometries("region", tolerance=0.05)
+    assert len(simplified.index) == len(original.index)
+    assert simplified.count_coordinates().sum() < original.count_coordinates().sum()
+
+def test_prepare_for_plotting_on_map_improper_option():
+    """Tests whether icl.prepare_for_plotting_on_map raises the proper exception when given an invalid option on."""
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.prepare_for_plotting_on_map(pd.DataFrame({"region":["Lazio"]}), on="municipality")
+
+def test_index_join_matches_merge():
+    """Tests whether icl.prepare_for_plotting_on_map with join="index" returns the same rows and geometries as with join="merge", keeping the index of source and dropping unknown regions."""
+    dates = pd.to_datetime(["2021-01-01", "2021-01-01", "2021-01-02", "2021-01-02", "2021-01-02"])
+    source = pd.DataFrame({"region":["Lazio", "Marche", "Lazio", "Atlantis", "Marche"], "value":[1, 2, 3, 4, 5]}, index=pd.Index(dates, name="date"))
+    merged = icl.prepare_for_plotting_on_map(source, on="region", join="merge")
+    indexed = icl.prepare_for_plotting_on_map(source, on="region", join="index")
+    assert isinstance(indexed, geopandas.GeoDataFrame)
+    assert indexed.index.equals(source.index[[0, 1, 2, 4]])
+    assert list(indexed["value"]) == list(merged["value"]) == [1, 2, 3, 5]
+    assert indexed.geometry.reset_index(drop=True).geom_equals(merged.geometry).all()
+    # rows of the same region share the same geometry object
+    assert indexed.geometry.iloc[0] is indexed.geometry.iloc[2]
+
+def test_index_join_improper_arguments():
+    """Tests whether icl.prepare_for_plotting_on_map raises the proper exceptions when given an invalid option join, or a DataFrame without a "region" column with join="index"."""
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.prepare_for_plotting_on_map(pd.DataFrame({"region":["Lazio"]}), on="region", join="nearest")
+    with pytest.raises(icl_e.ItaCovidLibKeyError):
+        icl.prepare_for_plotting_on_map(pd.DataFrame({"area":["Lazio"]}), on="region", join="index")
@@ -151,6 +151,16 @@ def test_tell_total_vaccinated_booster():
     except Exception as e:
         assert isinstance(e, icl_e.ItaCovidLibConnectionError)
 
+def test_vaccination_summary_ranging():
+    """Tests whether numbers returned by icl.vaccination_summary make sense (i.e. the numbers of vaccinated individuals for the whole vaccination timeline are equal to the sums of the numbers for two periods into which it is divided)."""
+    try:
+        summary_ever = icl.vaccination_summary()
+        summary_first_period = icl.vaccination_summary(stop_date="2021-06-30")
+        summary_second_period = icl.vaccination_summary(start_date="2021-07-01")
+        assert summary_ever["number"].equals(summary_first_period["number"]+summary_second_period["number"])
+    except Exception as e:
+        assert isinstance(e, icl_e.ItaCovidLibConnectionError)
+
 def test_tell_manufacturer_delivered_doses_all():
     """Tests whether results returned by icl.tell_manufacturer_delivered_doses with manufacturer="all" and with ranging for date options make sense (i.e. the number of vaccinated individuals is equal to the sum of the number of vaccinated individuals in three periods into which the whole vaccination timeline is divided)."""
     try:
@@ -210,3 +220,12 @@ def test_tell_manufacturer_delivered_doses_janssen():
         assert total_delivered_ever == delivered_first_group+delivered_second_group+delivered_third_group
     except Exception as e:
         assert isinstance(e, icl_e.ItaCovidLibConnectionError)
+
+def test_get_many_improper_names():
+    """Tests whether icl.get_many raises the proper exception when given names not corresponding to any resource, before downloading anything."""
+    for resources in (["national_trend", "fake_resource"], ["vaccine_admin_latest"], ["many"]):
+        try:
+            icl.get_many(resources)
+            assert False
+        except Exception as e:
+            assert isinstance(e, icl_e.ItaCovidLibArgumentError)
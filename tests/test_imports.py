@@ -0,0 +1,34 @@
+import subprocess
+import sys
+import pytest
+
+################################################################################################
+# NOTE ON TESTING
+#
+# Tests in this file run Python in separate processes, so that modules imported by other tests
+# do not affect which modules are imported by the library.
+################################################################################################
+
+
+def run_python(code):
+    """Runs code in a new Python process, returning its standard output."""
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+
+def test_optional_dependencies_not_imported():
+    """Tests whether importing the library does not import optional dependencies, which are slow to import."""
+    imported = run_python("import sys, itacovidlib.functions; print(' '.join(sorted(sys.modules)))").split()
+    for module in ["geopandas", "shapely", "pyproj", "matplotlib", "PIL", "epyestim", "scipy", "statsmodels", "itacovidlib.rendering", "itacovidlib.rt"]:
+        assert module not in imported
+
+def test_optional_dependencies_imported_at_first_use():
+    """Tests whether functions requiring optional dependencies import them at first use."""
+    imported = run_python("import sys, itacovidlib.functions as icl; icl.prepare_for_plotting_on_map(icl.pd.DataFrame({'region':['Lazio']}), on='r'); print(' '.join(sorted(sys.modules)))").split()
+    assert "geopandas" in imported
+
+@pytest.mark.parametrize("module, call, extra", [("epyestim", "icl.tell_rt()", "rt"), ("geopandas", "icl.prepare_for_plotting_on_map(icl.pd.DataFrame({'region':['Lazio']}), on='r')", "maps"), ("matplotlib", "icl.render_maps(icl.pd.DataFrame({'date':[], 'region':[], 'new_cases':[]}), on='r', columns='new_cases', output='.')", "maps")])
+def test_missing_optional_dependencies(module, call, extra):
+    """Tests whether functions requiring missing optional dependencies raise an ImportError naming them and the extra installing them."""
+    message = run_python("import sys\nsys.modules['{}'] = None\nimport itacovidlib.functions as icl\ntry:\n    {}\nexcept ImportError as error:\n    print(error)".format(module, call))
+    assert module in message
+    assert "itacovidlib[{}]".format(extra) in message
@@ -0,0 +1,356 @@
+import http.server
+import threading
+import gzip
+import hashlib
+import requests
+import os
+import pandas as pd
+import pytest
+import itacovidlib.backend as icl_b, itacovidlib.functions as icl, itacovidlib.exceptions as icl_e
+
+################################################################################################
+# NOTE ON TESTING
+#
+# Tests in this file do not need an Internet connection: they run against a local HTTP server
+# standing in for raw.githubusercontent.com, which serves small .csv files and records the
+# requests it receives, or replay files recorded in temporary directories.
+################################################################################################
+
+
+CSV_CONTENT = b"data,valore\n2021-01-01,1\n2021-01-02,2\n2021-01-03,3\n"
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    """Serves the server content at every path (or the content in server.files for the paths listed there, 404 Not Found when it is None), with an ETag, honouring If-None-Match and compressing it with gzip when requested. The first server.failures requests are answered with 503 Service Unavailable. Every request is recorded in the server log."""
+
+    def do_GET(self):
+        self.server.log.append({"path":self.path, "headers":dict(self.headers)})
+        if self.server.failures > 0:
+            self.server.failures -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag = self.server.etag
+        content = self.server.content
+        if self.path in self.server.files:
+            content = self.server.files[self.path]
+            if content is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            etag = '"{}"'.format(hashlib.sha1(content).hexdigest()[:8])
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            content = gzip.compress(content)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    stand_in = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    stand_in.log = []
+    stand_in.etag = '"v1"'
+    stand_in.content = CSV_CONTENT
+    stand_in.files = {}
+    stand_in.failures = 0
+    stand_in.url = "http://127.0.0.1:{}".format(stand_in.server_address[1])
+    thread = threading.Thread(target=stand_in.serve_forever, daemon=True)
+    thread.start()
+    yield stand_in
+    stand_in.shutdown()
+    stand_in.server_close()
+
+@pytest.fixture
+def snapshots(tmp_path):
+    icl.set_snapshots(tmp_path/"snapshots")
+    yield tmp_path/"snapshots"
+    icl.set_snapshots(None)
+
+@pytest.fixture
+def http_cache(tmp_path):
+    icl.set_http_cache(tmp_path/"cache", ttl=3600)
+    yield tmp_path/"cache"
+    icl.set_http_cache(None)
+
+
+def test_get_without_cache_downloads_every_time(server):
+    """Tests whether icl_b._get downloads the file again at every call when the HTTP cache is disabled (default behaviour)."""
+    first = icl_b._get(server.url+"/data.csv")
+    second = icl_b._get(server.url+"/data.csv")
+    assert first.equals(second)
+    assert len(server.log) == 2
+
+def test_http_cache_serves_fresh_copies_locally(server, http_cache):
+    """Tests whether icl_b._get serves a file from the HTTP cache, without contacting the server, within the cache ttl."""
+    first = icl_b._get(server.url+"/data.csv")
+    second = icl_b._get(server.url+"/data.csv")
+    assert first.equals(second)
+    assert list(first.columns) == ["data", "valore"]
+    assert len(server.log) == 1
+
+def test_http_cache_revalidates_stale_copies(server, http_cache):
+    """Tests whether icl_b._get sends a conditional request once the cache ttl has expired, and uses the cached copy when the server answers 304 Not Modified."""
+    icl.set_http_cache(http_cache, ttl=0)
+    first = icl_b._get(server.url+"/data.csv")
+    second = icl_b._get(server.url+"/data.csv")
+    assert first.equals(second)
+    assert len(server.log) == 2
+    assert server.log[1]["headers"].get("If-None-Match") == '"v1"'
+
+def test_http_cache_downloads_changed_files(server, http_cache):
+    """Tests whether icl_b._get downloads a file again when it has changed upstream (i.e. when its ETag is different)."""
+    icl.set_http_cache(http_cache, ttl=0)
+    icl_b._get(server.url+"/data.csv")
+    server.etag = '"v2"'
+    server.content = CSV_CONTENT+b"2021-01-04,4\n"
+    updated = icl_b._get(server.url+"/data.csv")
+    assert len(updated.index) == 4
+
+def test_http_cache_size_limit(server, http_cache):
+    """Tests whether the HTTP cache removes least recently used files when its maximum size is exceeded, leaving files it did not store untouched."""
+    icl.set_http_cache(http_cache, max_size=len(CSV_CONTENT))
+    os.makedirs(http_cache)
+    user_file = os.path.join(http_cache, "user.csv")
+    with open(user_file, "wb") as file:
+        file.write(CSV_CONTENT)
+    os.utime(user_file, (0, 0))
+    icl_b._get(server.url+"/first.csv")
+    icl_b._get(server.url+"/second.csv")
+    assert len([name for name in os.listdir(http_cache) if name.endswith(".csv")]) == 2
+    assert os.path.exists(user_file)
+    # the most recent file is still cached, so no new request is made for it
+    icl_b._get(server.url+"/second.csv")
+    assert len(server.log) == 2
+
+def test_http_cache_clearing(server, http_cache):
+    """Tests whether icl.clear_http_cache removes all cached files, and only them."""
+    icl_b._get(server.url+"/data.csv")
+    for file_name in ("user.csv", "user.json"):
+        with open(os.path.join(http_cache, file_name), "w") as file:
+            file.write("1")
+    icl.clear_http_cache()
+    assert sorted(os.listdir(http_cache)) == ["user.csv", "user.json"]
+
+def test_get_in_chunks(server):
+    """Tests whether icl_b._get with chunksize returns an iterator of DataFrames which, put together, correspond to the whole file."""
+    chunks = list(icl_b._get(server.url+"/data.csv", chunksize=2))
+    assert [len(chunk.index) for chunk in chunks] == [2, 1]
+    assert pd.concat(chunks, ignore_index=True).equals(icl_b._get(server.url+"/data.csv"))
+
+def test_get_in_chunks_with_http_cache(server, http_cache):
+    """Tests whether icl_b._get with chunksize also works when data are served from the HTTP cache."""
+    whole = icl_b._get(server.url+"/data.csv")
+    chunks = list(icl_b._get(server.url+"/data.csv", chunksize=2))
+    assert pd.concat(chunks, ignore_index=True).equals(whole)
+    assert len(server.log) == 1
+
+def test_get_decompresses_gzip_responses(server, http_cache):
+    """Tests whether icl_b._get requests gzip-compressed responses and decompresses them, both when streaming and when storing them in the HTTP cache."""
+    icl.set_http_cache(None)
+    streamed = icl_b._get(server.url+"/data.csv")
+    icl.set_http_cache(http_cache)
+    cached = icl_b._get(server.url+"/data.csv")
+    assert "gzip" in server.log[0]["headers"]["Accept-Encoding"]
+    assert streamed.equals(cached)
+    assert list(streamed["valore"]) == [1, 2, 3]
+
+def test_get_retries_failed_requests(server):
+    """Tests whether icl_b._get retries requests failed with a server error."""
+    icl.set_session(backoff_factor=0)
+    try:
+        server.failures = 2
+        data = icl_b._get(server.url+"/data.csv")
+        assert len(data.index) == 3
+        assert len(server.log) == 3
+    finally:
+        icl.set_session()
+
+def test_set_session_with_user_supplied_session(server):
+    """Tests whether icl_b._get uses the session supplied to icl.set_session."""
+    session = requests.Session()
+    session.headers["User-Agent"] = "stand-in-test"
+    icl.set_session(session)
+    try:
+        icl_b._get(server.url+"/data.csv")
+        assert server.log[0]["headers"]["User-Agent"] == "stand-in-test"
+    finally:
+        icl.set_session()
+
+def test_snapshots_are_reused_when_unchanged(server, snapshots):
+    """Tests whether icl_b._get loads the snapshot of a file, keeping the types of the schema, when the server answers 304 Not Modified."""
+    schema = {"dtype":{"valore":"int8"}, "parse_dates":["data"]}
+    first = icl_b._get(server.url+"/data.csv", schema=schema)
+    second = icl_b._get(server.url+"/data.csv", schema=schema)
+    assert first.equals(second)
+    assert second["valore"].dtype == "int8"
+    assert server.log[1]["headers"].get("If-None-Match") == '"v1"'
+    assert len([name for name in os.listdir(snapshots) if name.endswith(".feather")]) == 1
+
+def test_snapshots_clearing(server, snapshots):
+    """Tests whether icl.clear_snapshots removes all files stored in the snapshot directory by the library, and only them."""
+    icl_b._get(server.url+"/data.csv")
+    for file_name in ("0"*64+"-history.feather", "0"*64+"-rt.feather", "geometries-"+"0"*64+".parquet", "user.feather", "user.json", "user.parquet"):
+        with open(os.path.join(snapshots, file_name), "w") as file:
+            file.write("1")
+    icl.clear_snapshots()
+    assert sorted(os.listdir(snapshots)) == ["user.feather", "user.json", "user.parquet"]
+
+def test_snapshots_are_replaced_when_changed(server, snapshots):
+    """Tests whether icl_b._get parses a file again, replacing its snapshot, when it has changed upstream."""
+    icl_b._get(server.url+"/data.csv")
+    server.etag = '"v2"'
+    server.content = CSV_CONTENT+b"2021-01-04,4\n"
+    assert len(icl_b._get(server.url+"/data.csv").index) == 4
+    assert len([name for name in os.listdir(snapshots) if name.endswith(".feather")]) == 1
+
+def test_snapshots_without_internet(server, snapshots):
+    """Tests whether icl_b._get returns the last snapshot of a file when the server cannot be reached, and still raises the proper exception for files without snapshots."""
+    data = icl_b._get(server.url+"/data.csv")
+    server.shutdown()
+    server.server_close()
+    assert icl_b._get(server.url+"/data.csv").equals(data)
+    with pytest.raises(icl_e.ItaCovidLibConnectionError):
+        icl_b._get(server.url+"/other.csv")
+
+def test_snapshots_with_http_cache(server, snapshots, http_cache):
+    """Tests whether icl_b._get loads snapshots without contacting the server when the HTTP cache holds a fresh copy of the same revision."""
+    first = icl_b._get(server.url+"/data.csv")
+    second = icl_b._get(server.url+"/data.csv")
+    assert first.equals(second)
+    assert len(server.log) == 1
+
+def serve_daily_files(server, days):
+    """Serves a small daily time series dataset, with two areas per day, as a whole history file (the given days), a latest file (the last day) and daily files, like the datasets of get_national_trend, get_region_cases and get_province_cases."""
+    header = b"data,area,valore\n"
+    rows = {day:"{0}T17:00:00,A,{1}\n{0}T17:00:00,B,{2}\n".format(day, index, 10*index).encode() for index, day in enumerate(days)}
+    server.files["/trend.csv"] = header+b"".join(rows.values())
+    server.files["/trend-latest.csv"] = header+rows[days[-1]]
+    for day, row in rows.items():
+        server.files["/trend-{}.csv".format(day.replace("-", ""))] = header+row
+
+INCREMENTAL_SCHEMA = {"dtype":{"area":"category", "valore":"int32"}, "parse_dates":["data"], "date_format":"ISO8601"}
+
+def test_incremental_downloads_missing_days_only(server, snapshots):
+    """Tests whether icl_b._get_incremental downloads only the latest file and the daily files of the missing days once the whole history is stored, keeping the types of the schema."""
+    serve_daily_files(server, ["2021-01-01", "2021-01-02", "2021-01-03"])
+    icl_b._get_incremental(server.url+"/trend.csv", server.url+"/trend-latest.csv", schema=INCREMENTAL_SCHEMA)
+    serve_daily_files(server, ["2021-01-01", "2021-01-02", "2021-01-03", "2021-01-04", "2021-01-05"])
+    server.log.clear()
+    data = icl_b._get_incremental(server.url+"/trend.csv", server.url+"/trend-latest.csv", schema=INCREMENTAL_SCHEMA)
+    assert sorted(request["path"] for request in server.log) == ["/trend-20210103.csv", "/trend-20210104.csv", "/trend-latest.csv"]
+    assert data.equals(icl_b._get(server.url+"/trend.csv", schema=INCREMENTAL_SCHEMA))
+    assert data["area"].dtype == "category" and data["valore"].dtype == "int32"
+
+def test_incremental_without_new_days(server, snapshots):
+    """Tests whether icl_b._get_incremental returns the stored history, without duplicates, when no new day is available."""
+    serve_daily_files(server, ["2021-01-01", "2021-01-02"])
+    first = icl_b._get_incremental(server.url+"/trend.csv", server.url+"/trend-latest.csv", schema=INCREMENTAL_SCHEMA)
+    second = icl_b._get_incremental(server.url+"/trend.csv", server.url+"/trend-latest.csv", schema=INCREMENTAL_SCHEMA)
+    assert first.equals(second)
+    assert len(second.index) == 4
+
+def test_incremental_reloads_revised_history(server, snapshots):
+    """Tests whether icl_b._get_incremental downloads the whole history again when the stored data of the last day have been revised upstream, or when a daily file is missing."""
+    serve_daily_files(server, ["2021-01-01", "2021-01-02"])
+    icl_b._get_incremental(server.url+"/trend.csv", server.url+"/trend-latest.csv", schema=INCREMENTAL_SCHEMA)
+    serve_daily_files(server, ["2021-01-01", "2021-01-02", "2021-01-03"])
+    server.files["/trend.csv"] = server.files["/trend.csv"].replace(b"B,10", b"B,11")
+    server.files["/trend-20210102.csv"] = server.files["/trend-20210102.csv"].replace(b"B,10", b"B,11")
+    data = icl_b._get_incremental(server.url+"/trend.csv", server.url+"/trend-latest.csv", schema=INCREMENTAL_SCHEMA)
+    assert "/trend.csv" in [request["path"] for request in server.log[1:]]
+    assert list(data["valore"]) == [0, 0, 1, 11, 2, 20]
+    serve_daily_files(server, ["2021-01-01", "2021-01-02", "2021-01-03", "2021-01-04", "2021-01-05"])
+    server.files["/trend-20210104.csv"] = None
+    server.log.clear()
+    data = icl_b._get_incremental(server.url+"/trend.csv", server.url+"/trend-latest.csv", schema=INCREMENTAL_SCHEMA)
+    assert "/trend.csv" in [request["path"] for request in server.log]
+    assert len(data.index) == 10
+
+def test_incremental_without_internet(server, snapshots):
+    """Tests whether icl_b._get_incremental returns the stored history when the server cannot be reached."""
+    serve_daily_files(server, ["2021-01-01", "2021-01-02"])
+    data = icl_b._get_incremental(server.url+"/trend.csv", server.url+"/trend-latest.csv", schema=INCREMENTAL_SCHEMA)
+    server.shutdown()
+    server.server_close()
+    assert icl_b._get_incremental(server.url+"/trend.csv", server.url+"/trend-latest.csv", schema=INCREMENTAL_SCHEMA).equals(data)
+
+def test_incremental_requires_snapshots():
+    """Tests whether get_<resource_name> functions raise the proper exception when incremental mode is requested without snapshots."""
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.get_national_trend(incremental=True)
+
+def test_set_http_cache_improper_arguments():
+    """Tests whether icl.set_http_cache raises the proper exception when given a negative ttl."""
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.set_http_cache("cache", ttl=-1)
+
+@pytest.fixture
+def transport():
+    yield
+    icl.set_transport("network")
+
+
+NATIONAL_TREND_CONTENT = b"""data,stato,ricoverati_con_sintomi,terapia_intensiva,totale_ospedalizzati,isolamento_domiciliare,totale_positivi,variazione_totale_positivi,nuovi_positivi,dimessi_guariti,deceduti,casi_da_sospetto_diagnostico,casi_da_screening,totale_casi,tamponi,casi_testati,note,ingressi_terapia_intensiva,note_test,note_casi,totale_positivi_test_molecolare,totale_positivi_test_antigenico_rapido,tamponi_test_molecolare,tamponi_test_antigenico_rapido
+2020-02-24T18:00:00,ITA,101,26,127,94,221,0,221,1,7,,,229,4324,,,,,,,,,
+2020-02-25T18:00:00,ITA,114,35,150,162,311,90,93,1,10,,,322,8623,,,,,,,,,
+"""
+
+def test_record_and_replay(server, transport, tmp_path):
+    """Tests whether icl.set_transport in mode "record" stores decompressed files received from the server, which mode "replay" then serves without contacting it."""
+    icl.set_transport("record", tmp_path)
+    recorded = icl_b._get(server.url+"/dati/data.csv")
+    assert "gzip" in server.log[0]["headers"]["Accept-Encoding"]
+    with open(icl_b._fixture_path(server.url+"/dati/data.csv", tmp_path), "rb") as recording:
+        assert recording.read() == CSV_CONTENT
+    icl.set_transport("replay", tmp_path)
+    server.content = CSV_CONTENT+b"2021-01-04,4\n"
+    assert icl_b._get(server.url+"/dati/data.csv").equals(recorded)
+    assert len(server.log) == 1
+
+def test_replay_of_get_functions(transport, tmp_path):
+    """Tests whether get_<resource_name> functions read the files recorded at the paths of their URLs in mode "replay", and whether missing files are reported as not found."""
+    path = icl_b._fixture_path("https://raw.githubusercontent.com/pcm-dpc/COVID-19/master/dati-andamento-nazionale/dpc-covid19-ita-andamento-nazionale.csv", tmp_path)
+    os.makedirs(os.path.dirname(path))
+    with open(path, "wb") as recording:
+        recording.write(NATIONAL_TREND_CONTENT)
+    icl.set_transport("replay", tmp_path)
+    trend = icl.get_national_trend()
+    assert list(trend["new_cases"]) == [221, 93]
+    assert trend.index.name == "date"
+    assert icl_b._fetch("https://raw.githubusercontent.com/missing.csv", None) == (None, False)
+
+def test_replay_with_http_cache(transport, http_cache, tmp_path):
+    """Tests whether recorded files are revalidated with conditional requests by the HTTP cache, answered with 304 Not Modified until they change."""
+    path = icl_b._fixture_path("https://example.org/data.csv", tmp_path/"recordings")
+    os.makedirs(os.path.dirname(path))
+    with open(path, "wb") as recording:
+        recording.write(CSV_CONTENT)
+    icl.set_transport("replay", tmp_path/"recordings")
+    icl.set_http_cache(http_cache, ttl=0)
+    response = icl_b._request("https://example.org/data.csv")
+    response.close()
+    assert icl_b._request("https://example.org/data.csv", {"etag":response.headers["ETag"], "last_modified":None}).status_code == 304
+    assert len(icl_b._get("https://example.org/data.csv").index) == 3
+    with open(path, "ab") as recording:
+        recording.write(b"2021-01-04,4\n")
+    assert len(icl_b._get("https://example.org/data.csv").index) == 4
+
+def test_set_transport_improper_arguments(transport):
+    """Tests whether icl.set_transport raises the proper exception when given an invalid mode, or no directory for modes requiring one."""
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.set_transport("offline")
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.set_transport("replay")
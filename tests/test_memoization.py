@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+import itacovidlib.backend as icl_b, itacovidlib.functions as icl, itacovidlib.exceptions as icl_e
+
+################################################################################################
+# NOTE ON TESTING
+#
+# Tests in this file do not need an Internet connection: the process-wide cache is tested on
+# local functions decorated the same way as get_<resource_name> functions.
+################################################################################################
+
+
+@pytest.fixture
+def counted_getter():
+    """Returns a memoized function building a small DataFrame, together with the list of its actual (i.e. not cached) calls."""
+    calls = []
+    @icl_b._memoized
+    def get_numbers(latest=False):
+        calls.append(latest)
+        return pd.DataFrame({"number":[1, 2, 3]})
+    icl.clear_cache()
+    yield get_numbers, calls
+    icl.set_cache()
+    icl.clear_cache()
+
+
+def test_cache_avoids_repeated_calls(counted_getter):
+    """Tests whether repeated calls with equivalent arguments are served by the cache."""
+    get_numbers, calls = counted_getter
+    get_numbers()
+    get_numbers(latest=False)
+    get_numbers(False)
+    get_numbers(latest=True)
+    assert calls == [False, True]
+    info = icl.cache_info()
+    assert info["hits"] == 2 and info["misses"] == 2 and info["currsize"] == 2
+
+def test_cache_results_are_independent_copies(counted_getter):
+    """Tests whether changes made to a DataFrame returned by the cache do not affect later results."""
+    get_numbers, _ = counted_getter
+    first = get_numbers()
+    first["number"] = 0
+    first.drop(index=0, inplace=True)
+    assert list(get_numbers()["number"]) == [1, 2, 3]
+
+def test_cache_results_share_data_until_written(counted_getter, monkeypatch):
+    """Tests whether, with copy-on-write, results returned by the cache share data with each other without exposing in-place changes, and whether they are deep copies otherwise."""
+    get_numbers, _ = counted_getter
+    first, second = get_numbers(), get_numbers()
+    assert np.shares_memory(first["number"].to_numpy(), second["number"].to_numpy()) == icl_b._copy_on_write()
+    first.iloc[0, 0] = 10
+    first.index.name = "changed"
+    assert list(second["number"]) == [1, 2, 3]
+    assert list(get_numbers()["number"]) == [1, 2, 3] and get_numbers().index.name is None
+    monkeypatch.setattr(icl_b, "_copy_on_write", lambda: False)
+    assert not np.shares_memory(get_numbers()["number"].to_numpy(), second["number"].to_numpy())
+
+def test_cache_ttl(counted_getter):
+    """Tests whether cached results are not used anymore once the cache ttl has expired."""
+    get_numbers, calls = counted_getter
+    icl.set_cache(ttl=0)
+    get_numbers()
+    get_numbers()
+    assert len(calls) == 2
+
+def test_cache_maxsize(counted_getter):
+    """Tests whether least recently used results are removed from the cache when maxsize is exceeded."""
+    get_numbers, calls = counted_getter
+    icl.set_cache(maxsize=1)
+    get_numbers(latest=False)
+    get_numbers(latest=True)
+    get_numbers(latest=False)
+    assert calls == [False, True, False]
+    assert icl.cache_info()["currsize"] == 1
+
+def test_cache_clearing(counted_getter):
+    """Tests whether icl.clear_cache empties the cache."""
+    get_numbers, calls = counted_getter
+    get_numbers()
+    icl.clear_cache()
+    get_numbers()
+    assert len(calls) == 2
+
+def test_set_cache_improper_arguments():
+    """Tests whether icl.set_cache raises the proper exception when given a negative maxsize."""
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.set_cache(maxsize=-1)
@@ -57,3 +57,16 @@ def test_getter_functions_cannot_connect():
             function()
         except Exception as e:
             assert isinstance(e, icl_e.ItaCovidLibConnectionError)
+
+def test_get_many_cannot_connect():
+    """Tests whether icl.get_many reports connection errors for every resource, either raising them or returning them, depending on raise_errors."""
+    # to be performed under no Internet connection.
+    resources = ["national_trend", "get_region_cases", "province_cases_latest"]
+    try:
+        icl.get_many(resources)
+    except Exception as e:
+        assert isinstance(e, icl_e.ItaCovidLibConnectionError)
+    results = icl.get_many(resources, raise_errors=False)
+    assert list(results) == resources
+    for result in results.values():
+        assert not isinstance(result, Exception) or isinstance(result, icl_e.ItaCovidLibConnectionError)
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import PIL.Image
+import pytest
+import matplotlib.animation
+import itacovidlib.functions as icl, itacovidlib.exceptions as icl_e
+
+################################################################################################
+# NOTE ON TESTING
+#
+# Tests in this file do not need an Internet connection: maps are rendered from small local
+# DataFrames shaped like the ones returned by get_region_cases.
+################################################################################################
+
+
+@pytest.fixture
+def region_cases():
+    """Returns a DataFrame with new cases in three regions over three days, indexed by date."""
+    dates = pd.date_range("2021-01-01 17:00", periods=3, freq="D")
+    return pd.DataFrame({"region":["Lazio", "Marche", "Toscana"]*3, "new_cases":[1, 2, 3, 4, 5, 6, 7, 8, 9]}, index=pd.Index(np.repeat(dates, 3), name="date"))
+
+
+def test_render_time_lapse_png(region_cases, tmp_path):
+    """Tests whether icl.render_time_lapse writes one PNG image per date, in date order, with frames differing only where data differ."""
+    paths = icl.render_time_lapse(region_cases, on="region", column="new_cases", output=tmp_path/"frames", title="New cases")
+    assert [path.rsplit("/", 1)[1] for path in paths] == ["new_cases_2021-01-01.png", "new_cases_2021-01-02.png", "new_cases_2021-01-03.png"]
+    frames = [np.asarray(PIL.Image.open(path)) for path in paths]
+    assert frames[0].shape == frames[1].shape
+    assert not np.array_equal(frames[0], frames[1])
+
+def test_render_time_lapse_fixed_colors(region_cases, tmp_path):
+    """Tests whether frames share the same color scale, i.e. equal data give equal frames apart from titles."""
+    region_cases["new_cases"] = [1, 2, 3, 1, 2, 3, 1, 2, 3]
+    paths = icl.render_time_lapse(region_cases, on="region", column="new_cases", output=tmp_path/"frames", vmin=0, vmax=10)
+    first, second = (np.asarray(PIL.Image.open(path)) for path in paths[:2])
+    # rows outside the title are the same
+    assert np.array_equal(first[60:], second[60:])
+
+def test_render_time_lapse_gif(region_cases, tmp_path):
+    """Tests whether icl.render_time_lapse writes a GIF animation with one frame per date."""
+    paths = icl.render_time_lapse(region_cases, on="r", column="new_cases", output=tmp_path/"cases.gif", fps=2)
+    with PIL.Image.open(paths[0]) as animation:
+        assert animation.n_frames == 3
+
+def test_render_time_lapse_improper_arguments(region_cases, tmp_path):
+    """Tests whether icl.render_time_lapse raises the proper exceptions when given a missing column or an invalid option on."""
+    with pytest.raises(icl_e.ItaCovidLibKeyError):
+        icl.render_time_lapse(region_cases, on="region", column="deaths", output=tmp_path)
+    with pytest.raises(icl_e.ItaCovidLibKeyError):
+        icl.render_time_lapse(region_cases, on="province", column="new_cases", output=tmp_path)
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.render_time_lapse(region_cases, on="municipality", column="new_cases", output=tmp_path)
+    if not matplotlib.animation.writers.is_available("ffmpeg"):
+        with pytest.raises(icl_e.ItaCovidLibArgumentError):
+            icl.render_time_lapse(region_cases, on="region", column="new_cases", output=tmp_path/"cases.mp4")
+
+def test_render_time_lapse_without_frames(region_cases, tmp_path):
+    """Tests whether icl.render_time_lapse raises the proper exception when source has no rows, or none with a value of by, for all outputs."""
+    region_cases["week"] = np.nan
+    for source, by in [(region_cases.iloc[:0], "date"), (region_cases, "week")]:
+        for output in [tmp_path/"cases.gif", tmp_path/"frames"]:
+            with pytest.raises(icl_e.ItaCovidLibArgumentError):
+                icl.render_time_lapse(source, on="region", column="new_cases", output=output, by=by)
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_render_maps(region_cases, tmp_path, max_workers):
+    """Tests whether icl.render_maps writes one PNG image per date and per column, together with a manifest listing them, both in the calling process and in a process pool."""
+    region_cases["new_deaths"] = region_cases["new_cases"]*2
+    manifest = icl.render_maps(region_cases, on="region", columns=["new_cases", "new_deaths"], output=tmp_path, max_workers=max_workers)
+    assert list(manifest.columns) == ["date", "column", "file"]
+    assert len(manifest.index) == 6
+    assert manifest.equals(pd.read_csv(tmp_path/"manifest.csv", parse_dates=["date"]))
+    assert all((tmp_path/file_name).exists() for file_name in manifest["file"])
+    assert "new_deaths_2021-01-03.png" in list(manifest["file"])
+
+def test_render_maps_matches_render_time_lapse(region_cases, tmp_path):
+    """Tests whether icl.render_maps and icl.render_time_lapse render the same images."""
+    manifest = icl.render_maps(region_cases, on="region", columns="new_cases", output=tmp_path/"maps", max_workers=2)
+    paths = icl.render_time_lapse(region_cases, on="region", column="new_cases", output=tmp_path/"frames")
+    for file_name, path in zip(manifest["file"], paths):
+        assert np.array_equal(np.asarray(PIL.Image.open(tmp_path/"maps"/file_name)), np.asarray(PIL.Image.open(path)))
+
+def test_render_maps_improper_arguments(region_cases, tmp_path):
+    """Tests whether icl.render_maps raises the proper exceptions when given a missing column or an invalid max_workers."""
+    with pytest.raises(icl_e.ItaCovidLibKeyError):
+        icl.render_maps(region_cases, on="region", columns=["new_cases", "deaths"], output=tmp_path)
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.render_maps(region_cases, on="region", columns="new_cases", output=tmp_path, max_workers=0)
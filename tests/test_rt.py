@@ -0,0 +1,206 @@
+import numpy as np
+import pandas as pd
+import pytest
+import epyestim.covid19 as covid19
+import itacovidlib.rt as icl_rt, itacovidlib.backend as icl_b, itacovidlib.functions as icl, itacovidlib.exceptions as icl_e
+
+################################################################################################
+# NOTE ON TESTING
+#
+# Tests in this file do not need an Internet connection: Rt is estimated from synthetic case
+# series, with get_national_trend replaced by a function returning them when needed.
+################################################################################################
+
+
+def make_cases(days=150, seed=0):
+    """Returns a synthetic series of daily cases, with a wave, indexed by consecutive dates."""
+    generator = np.random.default_rng(seed)
+    return pd.Series((1000*np.exp(np.sin(np.arange(days)/20))+generator.integers(0, 100, days)).astype("int64"), index=pd.date_range("2020-02-24", periods=days, freq="D"))
+
+@pytest.fixture
+def empty_rt_cache():
+    icl_rt._clear_rt_cache()
+    yield
+    icl_rt._clear_rt_cache()
+
+@pytest.fixture
+def national_trend(monkeypatch):
+    """Replaces get_national_trend with a function returning a DataFrame shaped like the real one, with synthetic new cases."""
+    cases = make_cases()
+    trend = pd.DataFrame({"new_cases":cases.to_numpy()}, index=pd.Index(cases.index+pd.Timedelta(hours=17), name="date"))
+    monkeypatch.setattr(icl, "get_national_trend", lambda **kwargs: trend.copy())
+    icl.clear_cache()
+    yield cases
+    icl.clear_cache()
+
+
+def test_estimate_rt_matches_epyestim(empty_rt_cache):
+    """Tests whether icl_rt._estimate_rt returns the same estimates of epyestim.covid19.r_covid for the same random state."""
+    cases = make_cases()
+    np.random.seed(0)
+    expected = covid19.r_covid(cases, n_samples=10)
+    np.random.seed(0)
+    estimate = icl_rt._estimate_rt(cases, n_samples=10)
+    assert estimate.index.equals(expected.index)
+    assert list(estimate.columns) == list(expected.columns)
+    assert np.allclose(estimate.to_numpy(dtype="float64"), expected.to_numpy(dtype="float64"), equal_nan=True)
+
+def test_estimate_rt_cache(empty_rt_cache):
+    """Tests whether icl_rt._estimate_rt returns cached estimates for the same cases and parameters only, as independent copies."""
+    cases = make_cases()
+    first = icl_rt._estimate_rt(cases, n_samples=5)
+    first["R_mean"] = 0
+    second = icl_rt._estimate_rt(cases, n_samples=5)
+    assert (second["R_mean"] != 0).all()
+    assert second.equals(icl_rt._estimate_rt(cases.copy(), n_samples=5))
+    assert len(icl_rt._rt_cache) == 1
+    changed = cases.copy()
+    changed.iloc[-1] += 1
+    icl_rt._estimate_rt(changed, n_samples=5)
+    icl_rt._estimate_rt(cases, n_samples=6)
+    assert len(icl_rt._rt_cache) == 3
+
+def test_estimate_rt_in_parallel(empty_rt_cache):
+    """Tests whether icl_rt._estimate_rt divides bootstrap samples among processes with different random seeds, returning estimates for the same dates."""
+    cases = make_cases()
+    sequential = icl_rt._estimate_rt(cases, n_samples=4)
+    parallel = icl_rt._estimate_rt(cases, n_samples=4, max_workers=2)
+    assert parallel.index.equals(sequential.index)
+    assert np.allclose(parallel["R_mean"], sequential["R_mean"], rtol=0.1)
+    first, second = (icl_rt._sample_bag(cases, icl_rt._RT_PARAMETERS, 1, seed=seed)[0] for seed in (1, 2))
+    assert not first.equals(second)
+
+def test_tell_rt(national_trend):
+    """Tests whether icl.tell_rt returns Rt estimates indexed by date, and the same estimates at later calls."""
+    rt = icl.tell_rt()
+    assert rt.index.name == "date"
+    assert isinstance(rt.index, pd.DatetimeIndex)
+    assert list(rt.columns) == ["cases", "R_mean", "R_var", "Q0.025", "Q0.5", "Q0.975"]
+    assert (rt["cases"] == national_trend[rt.index]).all()
+    assert rt.equals(icl.tell_rt())
+
+def test_tell_rt_improper_arguments():
+    """Tests whether icl.tell_rt raises the proper exception when given an invalid max_workers."""
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.tell_rt(max_workers=0)
+
+
+@pytest.fixture
+def area_cases(monkeypatch):
+    """Replaces get_region_cases and get_province_cases with functions returning DataFrames shaped like the real ones, for two regions with a province each (and a pseudo-province without cases), with few bootstrap samples. Napoli is also listed, with the abbreviation "NA" parsed as missing like in the real data."""
+    first, second = make_cases(seed=1), make_cases(seed=2)*2
+    dates = pd.Index(np.repeat(first.index+pd.Timedelta(hours=17), 2), name="date")
+    regions = pd.DataFrame({"region":pd.Categorical(["Lazio", "Marche"]*len(first.index)), "new_cases":np.column_stack([first, second]).ravel()}, index=dates)
+    cumulative = np.column_stack([first.cumsum(), second.cumsum(), first.cumsum(), np.zeros(len(first.index), dtype="int64")]).ravel()
+    # a correction lowering cumulative cases of Roma on a single day
+    cumulative[4*100] -= 5000
+    provinces = pd.DataFrame({"province_code":np.array([58, 42, 63, 979]*len(first.index), dtype="int16"), "province":pd.Categorical(["Roma", "Ancona", "Napoli", "In fase di definizione/aggiornamento"]*len(first.index)), "province_abbreviation":["RM", "AN", None, None]*len(first.index), "cumulative_cases":cumulative}, index=pd.Index(np.repeat(first.index+pd.Timedelta(hours=17), 4), name="date"))
+    monkeypatch.setattr(icl, "get_region_cases", lambda **kwargs: regions.copy())
+    monkeypatch.setattr(icl, "get_province_cases", lambda **kwargs: provinces.copy())
+    monkeypatch.setitem(icl_rt._RT_PARAMETERS, "n_samples", 5)
+    icl.clear_cache()
+    yield {"Lazio":first, "Marche":second}
+    icl.clear_cache()
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_tell_rt_by_region(area_cases, max_workers):
+    """Tests whether icl.tell_rt with by="region" returns, for each region, Rt estimates for the cases of that region, in long format indexed by date and region."""
+    rt = icl.tell_rt(by="region", max_workers=max_workers)
+    assert rt.index.names == ["date", "region"]
+    assert rt.index.is_monotonic_increasing
+    assert sorted(rt.index.unique("region")) == ["Lazio", "Marche"]
+    assert list(rt.columns) == ["cases", "R_mean", "R_var", "Q0.025", "Q0.5", "Q0.975"]
+    for region, cases in area_cases.items():
+        region_rt = rt.xs(region, level="region")
+        assert (region_rt["cases"] == cases[region_rt.index]).all()
+        assert region_rt.index.equals(icl_rt._estimate_rt(cases).index)
+    # estimates are cached per region
+    assert rt.equals(icl.tell_rt(by="r"))
+
+def test_tell_rt_by_province(area_cases):
+    """Tests whether icl.tell_rt with by="province" estimates Rt from increments of cumulative cases, clipping negative ones, and leaves out pseudo-provinces."""
+    rt = icl.tell_rt(by="p")
+    assert rt.index.names == ["date", "province"]
+    assert sorted(rt.index.unique("province")) == ["Ancona", "Napoli", "Roma"]
+    ancona = rt.xs("Ancona", level="province")
+    assert (ancona["cases"] == area_cases["Marche"][ancona.index]).all()
+    cases = icl._cases_by_area("province")
+    assert (cases >= 0).all().all()
+    assert cases["Roma"].iloc[100] == 0
+
+def test_estimate_rt_by_skips_areas_without_cases(empty_rt_cache):
+    """Tests whether icl_rt._estimate_rt_by leaves out areas whose Rt cannot be estimated."""
+    cases = pd.DataFrame({"first":make_cases(), "none":0})
+    estimates = icl_rt._estimate_rt_by(cases, n_samples=3)
+    assert list(estimates) == ["first"]
+    assert estimates["first"].equals(icl_rt._estimate_rt(cases["first"], n_samples=3))
+
+def test_tell_rt_by_improper_arguments():
+    """Tests whether icl.tell_rt raises the proper exception when given an invalid option by."""
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.tell_rt(by="municipality")
+
+@pytest.fixture
+def estimated_segments(monkeypatch):
+    """Records the case series estimated by icl_rt._bagging_r, which are returned."""
+    segments = []
+    bagging_r = icl_rt._bagging_r
+    def recording_bagging_r(cases, *args, **kwargs):
+        segments.append(cases)
+        return bagging_r(cases, *args, **kwargs)
+    monkeypatch.setattr(icl_rt, "_bagging_r", recording_bagging_r)
+    return segments
+
+
+def test_estimate_rt_incremental(empty_rt_cache, estimated_segments):
+    """Tests whether incremental estimates only estimate again the trailing segment affected by a new day, keeping older stored estimates."""
+    cases = make_cases(days=500)
+    previous = icl_rt._estimate_rt(cases.iloc[:-1], history="test", n_samples=3)
+    updated = icl_rt._estimate_rt(cases, history="test", n_samples=3)
+    horizon = icl_rt._rt_horizon(icl_rt._RT_PARAMETERS)
+    assert len(estimated_segments[-1].index) == 2*horizon+1
+    since = cases.index[-1-horizon]
+    assert updated[updated.index < since].equals(previous[previous.index < since])
+    assert updated.index.equals(icl_rt._estimate_rt(cases, n_samples=4).index)
+    # same cases, no longer cached: the stored estimate is returned without estimating again
+    with icl_rt._rt_cache_lock:
+        icl_rt._rt_cache.clear()
+    assert icl_rt._estimate_rt(cases, history="test", n_samples=3).equals(updated)
+    assert len(estimated_segments) == 3
+
+def test_estimate_rt_incremental_revisions(empty_rt_cache, estimated_segments):
+    """Tests whether incremental estimates estimate again all cases when early cases are revised, or when histories differ by parameters."""
+    cases = make_cases(days=500)
+    icl_rt._estimate_rt(cases, history="test", n_samples=3)
+    revised = cases.copy()
+    revised.iloc[100] += 10
+    icl_rt._estimate_rt(revised, history="test", n_samples=3)
+    assert len(estimated_segments[-1].index) == 500
+    icl_rt._estimate_rt(revised, history="test", n_samples=4)
+    assert len(estimated_segments) == 3
+
+def test_estimate_rt_incremental_snapshots(empty_rt_cache, estimated_segments, monkeypatch, tmp_path):
+    """Tests whether incremental estimates are stored in the snapshot directory, and updated from there after the ones in memory are removed."""
+    monkeypatch.setitem(icl_b._snapshots, "directory", str(tmp_path))
+    cases = make_cases(days=500)
+    previous = icl_rt._estimate_rt(cases.iloc[:-1], history="test", n_samples=3)
+    assert len(list(tmp_path.glob("*-rt.feather"))) == 1
+    icl_rt._clear_rt_cache()
+    stored_cases, stored = icl_rt._load_rt_history("test", {**icl_rt._RT_PARAMETERS, "n_samples":3})
+    assert stored_cases.equals(cases.iloc[:-1])
+    assert stored.equals(previous)
+    icl_rt._estimate_rt(cases, history="test", n_samples=3)
+    assert len(estimated_segments[-1].index) < 500
+
+def test_tell_rt_incremental(national_trend, area_cases, estimated_segments):
+    """Tests whether icl.tell_rt with the incremental option returns the same estimates at later calls, for Italy and by region."""
+    rt = icl.tell_rt(incremental=True)
+    assert rt.equals(icl.tell_rt(incremental=True))
+    by_region = icl.tell_rt(by="region", incremental=True)
+    assert len(estimated_segments) == 3
+    # same cases, no longer cached: stored estimates are returned without estimating again
+    with icl_rt._rt_cache_lock:
+        icl_rt._rt_cache.clear()
+    assert by_region.equals(icl.tell_rt(by="region", incremental=True))
+    assert len(estimated_segments) == 3
@@ -0,0 +1,175 @@
+import numpy as np
+import pandas as pd
+import pytest
+import itacovidlib.functions as icl, itacovidlib.exceptions as icl_e
+
+################################################################################################
+# NOTE ON TESTING
+#
+# Tests in this file do not need an Internet connection: get_<resource_name> functions are
+# replaced by functions returning small DataFrames shaped like the real ones, so that results
+# of tell_ functions can be compared with values computed by hand.
+################################################################################################
+
+
+def make_vaccine_admin():
+    """Returns a DataFrame shaped like the one returned by get_vaccine_admin, with two regions, two age groups and all manufacturers over four days."""
+    generator = np.random.default_rng(0)
+    dates = pd.date_range("2021-01-01", periods=4, freq="D")
+    rows = pd.MultiIndex.from_product([dates, ["Pfizer/BioNTech", "Moderna", "Janssen"], ["LAZ", "MAR"], ["20-29", "80-89"]], names=["date", "manufacturer", "region_code", "age_group"]).to_frame(index=False)
+    for column in ["first_dose", "second_dose", "previously_infected", "extra_dose", "booster_dose"]:
+        rows[column] = generator.integers(0, 100, len(rows.index)).astype("int32")
+    rows["region"] = rows["region_code"].map({"LAZ":"Lazio", "MAR":"Marche"})
+    rows["ISTAT_region_code"] = rows["region_code"].map({"LAZ":12, "MAR":11}).astype("int8")
+    rows = rows.astype({"manufacturer":"category", "region_code":"category", "age_group":"category", "region":"category"})
+    return rows.set_index("date")
+
+def replacement(data):
+    """Returns a function replacing a get_<resource_name> function, returning a copy of data with the rows between start and stop (both included) meeting filters, which tell_ functions only build with "==" operators."""
+    def get(start=None, stop=None, columns=None, filters=None):
+        selected = data.sort_index(kind="stable")[start:stop]
+        for column, _, value in filters or []:
+            selected = selected[selected[column] == value]
+        return selected.copy()
+    return get
+
+@pytest.fixture
+def offline_data(monkeypatch):
+    """Replaces the get_<resource_name> functions used by tell_ functions with functions returning small local DataFrames, which are also returned (and can be replaced by tests)."""
+    data = {
+        "vaccine_admin": make_vaccine_admin(),
+        "eligible": pd.DataFrame({"region_code":["LAZ", "MAR", "LAZ", "MAR"], "region":["Lazio", "Marche", "Lazio", "Marche"], "population":[4000, 1000, 2000, 500]}, index=pd.Index(["20-29", "20-29", "80-89", "80-89"], name="age_group")),
+        "extra_dose_eligible": pd.DataFrame({"region":["Lazio", "Marche"], "prevailing_category":["A", "A"], "population":[300, 100]}, index=pd.Index(["LAZ", "MAR"], name="region_code")),
+        "booster_dose_eligible": pd.DataFrame({"region":["Lazio", "Marche"], "prevailing_category":["A", "A"], "population":[3000, 900]}, index=pd.Index(["LAZ", "MAR"], name="region_code")),
+        "istat_region_data": pd.DataFrame({"region":["Lazio", "Marche"], "total":[6000, 1600]}, index=pd.Index(["12", "11"], name="region_code")),
+    }
+    for name in data:
+        monkeypatch.setattr(icl, "get_"+name, lambda name=name, **kwargs: replacement(data[name])(**kwargs))
+    # results computed from the replaced functions must not be cached beyond each test
+    icl.clear_cache()
+    yield data
+    icl.clear_cache()
+
+
+def test_tell_total_vaccinated_offline(offline_data):
+    """Tests whether icl.tell_total_vaccinated returns the expected numbers and fractions for all doses."""
+    admin = offline_data["vaccine_admin"]["2021-01-02":"2021-01-03"]
+    janssen = admin["manufacturer"]=="Janssen"
+    expected = {
+        "1": admin["first_dose"].sum()+admin["previously_infected"].sum(),
+        "2": admin[~janssen]["second_dose"].sum()+admin[janssen]["first_dose"].sum()+admin["previously_infected"].sum(),
+        "e": admin["extra_dose"].sum(),
+        "b": admin["booster_dose"].sum(),
+    }
+    for dose, number in expected.items():
+        assert icl.tell_total_vaccinated(dose, start_date="2021-01-02", stop_date="2021-01-03") == number
+        assert icl.tell_total_vaccinated(dose, option="o", start_date="2021-01-02", stop_date="2021-01-03") == pytest.approx(number/7500)
+        assert icl.tell_total_vaccinated(dose, option="population", start_date="2021-01-02", stop_date="2021-01-03") == pytest.approx(number/7600)
+    assert icl.tell_total_vaccinated("extra", option="e", start_date="2021-01-02", stop_date="2021-01-03") == pytest.approx(expected["e"]/400)
+    assert icl.tell_total_vaccinated("booster", option="e", start_date="2021-01-02", stop_date="2021-01-03") == pytest.approx(expected["b"]/3900)
+
+def test_vaccination_summary(offline_data):
+    """Tests whether icl.vaccination_summary returns, for each dose and option, the same values returned by icl.tell_total_vaccinated."""
+    summary = icl.vaccination_summary(start_date="2021-01-02")
+    assert list(summary.index) == ["1", "2", "extra", "booster"]
+    assert list(summary.columns) == ["number", "over12", "population", "eligible"]
+    assert summary["number"].dtype == "int64"
+    for dose in summary.index:
+        for option in summary.columns:
+            if option == "eligible" and (dose == "1" or dose == "2"):
+                assert np.isnan(summary.loc[dose, option])
+            else:
+                assert summary.loc[dose, option] == pytest.approx(icl.tell_total_vaccinated(dose, option=option, start_date="2021-01-02"))
+
+def test_vaccination_summary_without_janssen(offline_data):
+    """Tests whether icl.vaccination_summary counts second doses properly when no Janssen vaccine was administered in the period."""
+    admin = offline_data["vaccine_admin"]
+    admin = offline_data["vaccine_admin"] = admin[admin["manufacturer"]!="Janssen"]
+    summary = icl.vaccination_summary()
+    assert summary.loc["2", "number"] == admin["second_dose"].sum()+admin["previously_infected"].sum()
+
+def test_tell_total_vaccinated_improper_arguments(offline_data):
+    """Tests whether icl.tell_total_vaccinated raises the proper exception when given invalid doses, options or dates."""
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.tell_total_vaccinated("3")
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.tell_total_vaccinated("1", option="eligible")
+    for dates in [{"start_date":"not a date"}, {"stop_date":"2021-13"}, {"start_date":[2021]}]:
+        with pytest.raises(icl_e.ItaCovidLibArgumentError):
+            icl.tell_total_vaccinated("1", **dates)
+        with pytest.raises(icl_e.ItaCovidLibArgumentError):
+            icl.vaccination_summary(**dates)
+
+def test_prefix_sum_index_matches_slicing(offline_data):
+    """Tests whether icl.PrefixSumIndex returns the same totals as summing over DataFrame slices, for str and datetime bounds, for groups and for unsorted data."""
+    admin = offline_data["vaccine_admin"]
+    shuffled = admin.sample(frac=1, random_state=0)
+    sums = icl.PrefixSumIndex(shuffled, ["first_dose", "booster_dose"], by="manufacturer")
+    assert sorted(sums.groups) == ["Janssen", "Moderna", "Pfizer/BioNTech"]
+    for start_date, stop_date in [("2020", "2030"), ("2021-01-02", "2021-01-03"), (pd.Timestamp("2021-01-02"), pd.Timestamp("2021-01-03")), ("2021-01-04", "2021-01-01"), ("2021-01", "2021-01-01"), (None, "2021-01-02"), ("2021-01-03", None), (None, None)]:
+        assert sums.total("first_dose", start_date, stop_date) == admin.sort_index()[start_date:stop_date]["first_dose"].sum()
+        moderna = admin[admin["manufacturer"]=="Moderna"]
+        assert sums.total("booster_dose", start_date, stop_date, group="Moderna") == moderna[start_date:stop_date]["booster_dose"].sum()
+    assert sums.total("first_dose", group="AstraZeneca") == 0
+
+def test_tell_manufacturer_delivered_doses_offline(offline_data, monkeypatch):
+    """Tests whether icl.tell_manufacturer_delivered_doses returns the expected numbers, also for deliveries not sorted by date."""
+    deliveries = pd.DataFrame({"manufacturer":["Moderna", "Janssen", "Moderna", "Pfizer/BioNTech"], "number_of_doses":[100, 20, 300, 4000]}, index=pd.Index(pd.to_datetime(["2021-03-01", "2021-01-15", "2021-01-10", "2021-02-01"]), name="date_of_delivery"))
+    monkeypatch.setattr(icl, "get_vaccine_deliveries", replacement(deliveries))
+    assert icl.tell_manufacturer_delivered_doses() == 4420
+    assert icl.tell_manufacturer_delivered_doses("Moderna", start_date="2021-01", stop_date="2021-02") == 300
+    assert icl.tell_manufacturer_delivered_doses("Vaxzevria (AstraZeneca)") == 0
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.tell_manufacturer_delivered_doses("Sputnik")
+
+def test_tell_functions_with_none_bounds(offline_data, monkeypatch):
+    """Tests whether tell_ functions given None as start_date or stop_date cover all dates on that side, as in DataFrame slicing."""
+    deliveries = pd.DataFrame({"manufacturer":["Moderna", "Janssen"], "number_of_doses":[100, 20]}, index=pd.Index(pd.to_datetime(["2021-03-01", "2021-01-15"]), name="date_of_delivery"))
+    monkeypatch.setattr(icl, "get_vaccine_deliveries", replacement(deliveries))
+    assert icl.tell_total_vaccinated("1", start_date=None, stop_date=None) == icl.tell_total_vaccinated("1")
+    assert icl.tell_total_vaccinated("b", start_date=None, stop_date="2021-01-02") == offline_data["vaccine_admin"][:"2021-01-02"]["booster_dose"].sum()
+    assert icl.tell_manufacturer_delivered_doses(start_date="2021-02", stop_date=None) == 100
+    assert icl.tell_manufacturer_delivered_doses(start_date=None, stop_date=None, by="manufacturer").to_dict() == {"Janssen":20, "Moderna":100}
+    assert icl.vaccination_summary(start_date=None, stop_date=None).equals(icl.vaccination_summary())
+
+def test_tell_total_vaccinated_by_groups(offline_data):
+    """Tests whether icl.tell_total_vaccinated with by returns, for each group, the same number returned without by for the data of that group only, and fractions of the matching populations."""
+    admin = offline_data["vaccine_admin"]
+    by_region = icl.tell_total_vaccinated("2", by="region")
+    assert list(by_region.index) == ["Lazio", "Marche"]
+    for region in by_region.index:
+        offline_data["vaccine_admin"] = admin[admin["region"]==region]
+        icl.clear_cache()
+        assert by_region[region] == icl.tell_total_vaccinated("2")
+    offline_data["vaccine_admin"] = admin
+    icl.clear_cache()
+    over12 = icl.tell_total_vaccinated("1", option="o", by=("age_group", "region"))
+    assert over12.index.names == ["age_group", "region"]
+    lazio_80 = admin[(admin["region"]=="Lazio") & (admin["age_group"]=="80-89")]
+    assert over12["80-89", "Lazio"] == pytest.approx((lazio_80["first_dose"].sum()+lazio_80["previously_infected"].sum())/2000)
+    population = icl.tell_total_vaccinated("b", option="p", by=("manufacturer", "region"))
+    moderna_marche = admin[(admin["region"]=="Marche") & (admin["manufacturer"]=="Moderna")]
+    assert population["Moderna", "Marche"] == pytest.approx(moderna_marche["booster_dose"].sum()/1600)
+    eligible = icl.tell_total_vaccinated("e", option="e", by="region")
+    assert eligible["Lazio"] == pytest.approx(admin[admin["region"]=="Lazio"]["extra_dose"].sum()/300)
+    by_manufacturer = icl.tell_total_vaccinated("1", option="p", by="manufacturer")
+    assert by_manufacturer.sum() == pytest.approx(icl.tell_total_vaccinated("1", option="p"))
+
+def test_tell_total_vaccinated_by_improper_arguments(offline_data):
+    """Tests whether icl.tell_total_vaccinated raises the proper exception when given invalid groupings, or groupings without matching population data."""
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.tell_total_vaccinated("1", by="province")
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.tell_total_vaccinated("1", by=())
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.tell_total_vaccinated("1", option="p", by="age_group")
+
+def test_tell_manufacturer_delivered_doses_by_groups(offline_data, monkeypatch):
+    """Tests whether icl.tell_manufacturer_delivered_doses with by returns the delivered doses per group."""
+    deliveries = pd.DataFrame({"manufacturer":["Moderna", "Janssen", "Moderna", "Moderna"], "region":["Lazio", "Lazio", "Marche", "Lazio"], "number_of_doses":[100, 20, 300, 4000]}, index=pd.Index(pd.to_datetime(["2021-03-01", "2021-01-15", "2021-01-10", "2021-02-01"]), name="date_of_delivery"))
+    monkeypatch.setattr(icl, "get_vaccine_deliveries", replacement(deliveries))
+    by_region = icl.tell_manufacturer_delivered_doses(by="region")
+    assert by_region.to_dict() == {"Lazio":4120, "Marche":300}
+    assert icl.tell_manufacturer_delivered_doses("Moderna", stop_date="2021-02", by=("region", "manufacturer")).to_dict() == {("Lazio", "Moderna"):4000, ("Marche", "Moderna"):300}
+    with pytest.raises(icl_e.ItaCovidLibArgumentError):
+        icl.tell_manufacturer_delivered_doses(by="age_group")